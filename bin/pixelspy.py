@@ -18,35 +18,34 @@ if os.geteuid() == 0:
             except Exception as e:
                 print("Failed to run xhost command:", e)
 
-# Attempt to override the screenshot method with one using mss
-try:
-    import mss
-    from PIL import Image
-
-    def mss_screenshot(region=None):
-        with mss.mss() as sct:
-            if region:
-                # region should be a dict: {'top': y, 'left': x, 'width': w, 'height': h}
-                sct_img = sct.grab(region)
-            else:
-                sct_img = sct.grab(sct.monitors[0])
-            return Image.frombytes("RGB", sct_img.size, sct_img.rgb)
-
-    # Import pyautogui and override its screenshot function
-    import pyautogui
-    pyautogui.screenshot = mss_screenshot
-except ImportError:
+import sys
+
+# Add the parent directory to the path so we can import our libs
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Override the screenshot method with the shared capture backend, which keeps
+# one mss handle open instead of creating one per screenshot
+from libs.capture_backends import get_capture_backend
+import pyautogui
+
+def mss_screenshot(region=None):
+    if region:
+        # region is a dict {'top': y, 'left': x, 'width': w, 'height': h}
+        # or a pyautogui (left, top, width, height) tuple
+        if isinstance(region, dict):
+            left, top, width, height = region['left'], region['top'], region['width'], region['height']
+        else:
+            left, top, width, height = region
+        return get_capture_backend().grab((left, top, left + width, top + height))
+    return get_capture_backend().grab()
+
+pyautogui.screenshot = mss_screenshot
+if get_capture_backend().active.name != 'mss':
     print("mss library not found; falling back to default screenshot method.")
-    import pyautogui
 
 import time
 import threading
 import keyboard
-import sys
-import os
-
-# Add the parent directory to the path so we can import our libs
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from libs.pixel_get_color import get_color
 
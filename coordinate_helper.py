@@ -4,6 +4,7 @@ EvilHotKeys Coordinate Helper Tool
 
 Interactive GUI to capture and save pixel coordinates for game specs.
 Click on screen elements to capture their coordinates and save to config.yaml
+Icons around a captured coordinate can be saved as templates for libs.template_match
 """
 
 import tkinter as tk
@@ -13,6 +14,7 @@ from pathlib import Path
 from libs.pixel_get_color import get_color
 from libs.logger import get_logger
 from libs.config_manager import get_config_manager
+from libs.template_match import Template, template_path
 import keyboard
 import time
 import threading
@@ -97,6 +99,12 @@ class CoordinateHelperApp:
             )
             btn.grid(row=i//2, column=i%2, padx=2, pady=2)
         
+        # Icon size for template capture
+        ttk.Label(left_frame, text="Icon Size:").grid(row=4, column=0, sticky="w", pady=5)
+        self.icon_size_var = tk.IntVar(value=32)
+        self.icon_size_entry = ttk.Entry(left_frame, textvariable=self.icon_size_var, width=27)
+        self.icon_size_entry.grid(row=4, column=1, pady=5, padx=5)
+        
         # Right side - Current info and capture
         right_frame = ttk.LabelFrame(main_frame, text="Capture", padding="10")
         right_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
@@ -153,6 +161,14 @@ class CoordinateHelperApp:
         )
         self.test_btn.pack(side=tk.LEFT, padx=5)
         
+        self.icon_btn = ttk.Button(
+            button_frame,
+            text="📷 Save Icon",
+            command=self.save_icon,
+            state='disabled'
+        )
+        self.icon_btn.pack(side=tk.LEFT, padx=5)
+        
         # Bottom - Saved coordinates list
         coords_frame = ttk.LabelFrame(main_frame, text="Saved Coordinates", padding="10")
         coords_frame.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)
@@ -241,6 +257,7 @@ class CoordinateHelperApp:
             # Enable buttons
             self.save_btn.config(state='normal')
             self.test_btn.config(state='normal')
+            self.icon_btn.config(state='normal')
             
             # Update statusbar
             self.statusbar.config(text=f"Captured: ({x}, {y}) - Ready to save")
@@ -311,12 +328,75 @@ class CoordinateHelperApp:
             self.captured_label.config(text="None")
             self.save_btn.config(state='disabled')
             self.test_btn.config(state='disabled')
+            self.icon_btn.config(state='disabled')
             self.status_label.config(text="Press F9 to capture", foreground='black')
             
         except Exception as e:
             logger.error(f"Error saving coordinate: {e}")
             messagebox.showerror("Error", f"Failed to save coordinate: {e}")
     
+    def save_icon(self):
+        """Save the icon centered on the captured coordinate as a template"""
+        coord_name = self.coord_name_var.get().strip()
+        if not coord_name:
+            messagebox.showwarning("Warning", "Please enter a coordinate name")
+            return
+        
+        game = self.current_game
+        if not game:
+            messagebox.showwarning("Warning", "Please select a game")
+            return
+        
+        captured_text = self.captured_label.cget("text")
+        if captured_text == "None":
+            messagebox.showwarning("Warning", "Please capture a coordinate first (F9)")
+            return
+        
+        try:
+            # Parse captured coordinates
+            coord_text = captured_text.strip('()')
+            x, y = map(int, coord_text.split(','))
+            
+            size = int(self.icon_size_var.get())
+            x1, y1 = x - size // 2, y - size // 2
+            x2, y2 = x1 + size, y1 + size
+            
+            template = Template.from_screen(coord_name, x1, y1, x2, y2)
+            if template is None:
+                messagebox.showerror("Error", "Failed to capture icon")
+                return
+            path = template_path(game, coord_name)
+            template.save(path)
+            
+            resolution = self.resolution_var.get()
+            
+            # Load current config
+            config_path = Path('config.yaml')
+            if config_path.exists():
+                with open(config_path, 'r') as f:
+                    config_data = yaml.safe_load(f) or {}
+            else:
+                config_data = {}
+            
+            # Save where the icon was captured, next to the coordinates
+            templates = (config_data.setdefault('games', {}).setdefault(game, {})
+                         .setdefault('templates', {}).setdefault(resolution, {}))
+            templates[coord_name] = [x1, y1, x2, y2]
+            
+            # Write back to file
+            with open(config_path, 'w') as f:
+                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            
+            self.statusbar.config(text=f"✓ Saved icon {coord_name} ({size}x{size}) to {path}")
+            messagebox.showinfo("Success", f"Saved icon {coord_name} at ({x1}, {y1})\n\nTo: {path}")
+            
+            # Reload config
+            self.config.load()
+            
+        except Exception as e:
+            logger.error(f"Error saving icon: {e}")
+            messagebox.showerror("Error", f"Failed to save icon: {e}")
+    
     def test_coordinate(self):
         """Test the captured coordinate by reading its color"""
         captured_text = self.captured_label.cget("text")
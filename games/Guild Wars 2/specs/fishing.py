@@ -1,9 +1,15 @@
 from libs.pixel_search import pixel_search
+from libs.capture_planner import plan_capture
 from libs.keyboard_actions import press_and_release, press, release
 from libs.key_mapping import key_mapping
-import time
+from libs.waits import sleep
 import keyboard
 
+# Fishing bar colors; tolerance absorbs gamma/compression noise
+GREEN_BLOCK = (113, 241, 156)
+ORANGE_BLOCK = (12, 47, 84)
+BAR_TOLERANCE = 8
+
 def fishing_rotation(stop_event):
     press(key_mapping['numpad1'])
     release(key_mapping['numpad1'])
@@ -11,8 +17,7 @@ def fishing_rotation(stop_event):
         
         if keyboard.is_pressed(key_mapping['numpad2']):
             press_and_release('j')  # Equip fishing
-            time.sleep(2.5)
-            if stop_event.is_set(): break  
+            if not sleep(2.5, stop_event): break
             press(key_mapping['numpad1'])  # Begin fishing
             release(key_mapping['numpad1'])  
 
@@ -21,27 +26,29 @@ def fishing_rotation(stop_event):
             if catch_color:
                 press(key_mapping['numpad1'])
                 release(key_mapping['numpad1'])
-                time.sleep(0.5)
-                if stop_event.is_set(): break 
+                if not sleep(0.5, stop_event): break
 
                 while not stop_event.is_set():  
-                    green_color = pixel_search((113, 241, 156), 1665, 1590, 2174, 1624)  # Searching for the green block
-                    if not green_color:
-                        orange_color = pixel_search((12, 47, 84), 1665, 1590, 2174, 1624)  # Searching for the orange block
-                        if orange_color:
-                            green_x, green_y = green_color
-                            orange_x, orange_y = orange_color
-                            if green_x < orange_x - 5:
-                                press_and_release('d')  # Press "d" to move the orange block to the left
-                            elif green_x > orange_x + 5:
-                                press_and_release('a')  # Press "a" to move the orange block to the right
-                    else:
+                    # Search for the green and orange blocks in one pass
+                    green_color, orange_color = pixel_search([GREEN_BLOCK, ORANGE_BLOCK], 1665, 1590, 2174, 1624,
+                                                             tolerance=BAR_TOLERANCE)
+                    if green_color and orange_color:
+                        green_x, green_y = green_color
+                        orange_x, orange_y = orange_color
+                        if green_x < orange_x - 5:
+                            press_and_release('d')  # Press "d" to move the orange block to the left
+                        elif green_x > orange_x + 5:
+                            press_and_release('a')  # Press "a" to move the orange block to the right
+                    elif not green_color and not orange_color:
+                        # Fishing bar is gone
                         press_and_release('a up')
                         press_and_release('d up')
-                        time.sleep(4)
+                        sleep(4, stop_event)
                         break  # This break exits the while loop, so it's okay to keep
 
 def run(stop_event):
+    # Only capture the catch indicator and the fishing bar
+    plan_capture(regions=[(1855, 840, 1965, 950), (1665, 1590, 2174, 1624)])
     while not stop_event.is_set():
         fishing_rotation(stop_event)  
-        time.sleep(0.1)  
+        sleep(0.1, stop_event)  
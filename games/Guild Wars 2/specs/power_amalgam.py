@@ -11,10 +11,13 @@ Build Overview:
 
 import time
 import keyboard
-from libs.pixel_get_color import get_color as pixel_get_color
 from libs.keyboard_actions_monitored import press_and_release
 from libs.key_mapping import key_mapping
+from libs.key_state import is_pressed as is_key_pressed
 from libs.logger import get_logger
+from libs.capture_planner import plan_capture
+from libs.rotation import RotationEngine
+from libs.skill_board import SkillBoard
 
 logger = get_logger('power_amalgam')
 
@@ -45,137 +48,42 @@ DEFAULT_COORDS = {
 
 def check_stop_condition(stop_event):
     """Check if we should stop the rotation"""
-    return not keyboard.is_pressed(key_mapping['numpad1']) or stop_event.is_set()
+    return not is_key_pressed(key_mapping['numpad1']) or stop_event.is_set()
 
-def check_skill_available(coords):
-    """Check if a skill is available (not on cooldown)"""
-    color = pixel_get_color(coords[0], coords[1])
-    # Skills ready have a brighter color, on cooldown are dark/gray
-    return color is not None and color != (0, 0, 0) and sum(color) > 300
+# Every skill the rotation reads, evaluated together against one frame
+SKILL_BOARD = SkillBoard()
+for _name in ('protocol_1', 'protocol_2', 'protocol_3', 'weapon_2', 'weapon_3', 'weapon_4', 'weapon_5'):
+    SKILL_BOARD.add_probe(_name, DEFAULT_COORDS[_name])  # Ready skills are bright (R+G+B > 300)
 
-def execute_opener_burst(stop_event):
-    """
-    Execute the opener burst combo:
-    Solid State > Mace 2 > Shield 4 > Shield 3 > Demolish
-    """
-    logger.info("Executing opener burst combo")
-    
-    # Use Offensive Protocol: Solid State (numpad7 on bottom bar)
-    if check_skill_available(DEFAULT_COORDS['protocol_1']):
-        logger.info("Using Offensive Protocol: Solid State")
-        press_and_release(key_mapping['numpad7'])  # Bottom bar numpad
-        time.sleep(0.3)
-        if check_stop_condition(stop_event): return False
-    
-    # Mace 2 - Brutal Leap (numpad2 = bottom bar slot 2)
-    if check_skill_available(DEFAULT_COORDS['weapon_2']):
-        logger.info("Using Mace 2: Brutal Leap")
-        press_and_release(key_mapping['numpad2'])
-        time.sleep(0.3)
-        if check_stop_condition(stop_event): return False
-    
-    # Shield 4 - Shield Smack (numpad4 = bottom bar slot 4)
-    if check_skill_available(DEFAULT_COORDS['weapon_4']):
-        logger.info("Using Shield 4: Shield Smack")
-        press_and_release(key_mapping['numpad4'])
-        time.sleep(0.2)
-        if check_stop_condition(stop_event): return False
-    
-    # Shield 5 (numpad5 = bottom bar slot 5)
-    if check_skill_available(DEFAULT_COORDS['weapon_5']):
-        logger.info("Using Shield 5")
-        press_and_release(key_mapping['numpad5'])
-        time.sleep(0.2)
-        if check_stop_condition(stop_event): return False
-    
-    # Finish with Demolish (Mace 3) (numpad3 = bottom bar slot 3)
-    if check_skill_available(DEFAULT_COORDS['weapon_3']):
-        logger.info("Using Demolish (Mace 3)")
-        press_and_release(key_mapping['numpad3'])
-        time.sleep(0.2)
-    
-    return True
+# Priority list (lower priority value goes first)
+ROTATION = RotationEngine(SKILL_BOARD, gcd=0.2, send=lambda key, presses: press_and_release(key))
+
+# Opener steps; only cast as part of the burst combo unless listed below
+ROTATION.add_ability('solid_state', key_mapping['numpad7'], probe='protocol_1', priority=None, gcd=0.3)
+ROTATION.add_ability('shield_5', key_mapping['numpad5'], probe='weapon_5', priority=None)
+
+# Priority 1: Burst opener when the key skills are off cooldown
+# Solid State > Mace 2 > Shield 4 > Shield 5 > Demolish
+ROTATION.add_combo('opener', ['solid_state', 'mace_2', 'shield_4', 'shield_5', 'demolish'], priority=1,
+                   requires_ready=['protocol_1', 'weapon_2', 'weapon_4'])
+
+# Protocols 2/3 at most once every 5 seconds
+ROTATION.add_ability('protocol_2', '2', probe='protocol_2', priority=2, cooldown=5.0, gcd=0.3)
+ROTATION.add_ability('protocol_3', '3', probe='protocol_3', priority=3, cooldown=5.0, gcd=0.3)
+
+# Priority 2: Mace 2 or Shield 4 individually; Priority 3: Demolish (Mace 3)
+# Mace 1 is left out of the rotation to avoid triggering F1-F5
+ROTATION.add_ability('mace_2', key_mapping['numpad2'], probe='weapon_2', priority=4, gcd=0.3)
+ROTATION.add_ability('shield_4', key_mapping['numpad4'], probe='weapon_4', priority=5)
+ROTATION.add_ability('demolish', key_mapping['numpad3'], probe='weapon_3', priority=6)
 
 def power_amalgam_rotation(stop_event):
     """
     Main rotation loop for Power Amalgam PvP
     """
-    loop_count = 0
-    last_protocol_use = {'2': 0, '3': 0, '4': 0, '5': 0}  # Track last protocol use
-    
-    while not stop_event.is_set():
-        loop_count += 1
-        current_time = time.time()
-        
-        # Log every 50 loops to show it's running
-        if loop_count % 50 == 0:
-            logger.info(f"Rotation running, loop {loop_count}")
-        
-        # Check stop condition frequently
-        if check_stop_condition(stop_event):
-            logger.info("Stop condition detected")
-            break
-        
-        # Priority 1: Check if burst combo skills are ready
-        protocol_1_ready = check_skill_available(DEFAULT_COORDS['protocol_1'])
-        protocol_2_ready = check_skill_available(DEFAULT_COORDS['protocol_2'])
-        protocol_3_ready = check_skill_available(DEFAULT_COORDS['protocol_3'])
-        protocol_4_ready = check_skill_available(DEFAULT_COORDS['protocol_4'])
-        protocol_5_ready = check_skill_available(DEFAULT_COORDS['protocol_5'])
-        mace_2_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
-        shield_4_ready = check_skill_available(DEFAULT_COORDS['weapon_4'])
-        mace_3_ready = check_skill_available(DEFAULT_COORDS['weapon_3'])
-        
-        # Execute burst combo when key skills are off cooldown (HIGHEST PRIORITY)
-        if protocol_1_ready and mace_2_ready and shield_4_ready:
-            logger.info("Executing burst opener - skills ready")
-            execute_opener_burst(stop_event)
-            if check_stop_condition(stop_event): break
-            continue
-        
-        # Use protocol 2/3 ONLY if haven't used in last 5 seconds AND ready
-        if protocol_2_ready and (current_time - last_protocol_use['2'] > 5.0):
-            logger.info("Using Protocol 2 (key 2)")
-            press_and_release('2')
-            last_protocol_use['2'] = current_time
-            time.sleep(0.3)
-            if check_stop_condition(stop_event): break
-            continue
-        
-        if protocol_3_ready and (current_time - last_protocol_use['3'] > 5.0):
-            logger.info("Using Protocol 3 (key 3)")
-            press_and_release('3')
-            last_protocol_use['3'] = current_time
-            time.sleep(0.3)
-            if check_stop_condition(stop_event): break
-            continue
-        
-        # Priority 2: Check for Mace 2 or Shield 4 individually if off cooldown
-        if mace_2_ready:
-            logger.info("Using Mace 2: Brutal Leap")
-            press_and_release(key_mapping['numpad2'])
-            time.sleep(0.3)
-            if check_stop_condition(stop_event): break
-            continue
-        
-        if shield_4_ready:
-            logger.info("Using Shield 4: Shield Smack")
-            press_and_release(key_mapping['numpad4'])
-            time.sleep(0.2)
-            if check_stop_condition(stop_event): break
-            continue
-        
-        # Priority 3: Use Mace 3 (Demolish) if ready
-        if mace_3_ready:
-            logger.info("Using Demolish (Mace 3)")
-            press_and_release(key_mapping['numpad3'])
-            time.sleep(0.2)
-            if check_stop_condition(stop_event): break
-            continue
-        
-        # Priority 4: Small sleep, then retry (no auto-attack spam)
-        # Mace 1 is removed from rotation to avoid triggering F1-F5
-        time.sleep(0.1)
+    ROTATION.run(stop_event, active=lambda: not check_stop_condition(stop_event), interval=0.1,
+                 hold_key=key_mapping['numpad1'])
+    logger.info("Stop condition detected")
 
 def run(stop_event):
     """
@@ -185,6 +93,9 @@ def run(stop_event):
     logger.info("Power Amalgam PvP spec started")
     logger.info("Hold numpad1 to activate rotation")
     
+    # Only capture the skill bar instead of the whole desktop
+    plan_capture(points=DEFAULT_COORDS.values())
+    
     while not stop_event.is_set():
         # Check stop event first
         if stop_event.is_set():
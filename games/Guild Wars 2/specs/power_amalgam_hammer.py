@@ -34,9 +34,15 @@ Utilities: numpad6-0
 import time
 import keyboard
 from libs.pixel_get_color import get_color as pixel_get_color
+from libs.pixel_watch import wait_until, below
 from libs.keyboard_actions_monitored import press_and_release, button_mash
 from libs.key_mapping import key_mapping
+from libs.key_state import is_pressed as is_key_pressed
 from libs.logger import get_logger
+from libs.capture_planner import plan_capture
+from libs.cooldowns import CooldownTracker
+from libs.kit_modes import KitStateMachine
+from libs.input_scheduler import get_input_scheduler
 
 logger = get_logger('power_amalgam_hammer')
 
@@ -63,81 +69,71 @@ DEFAULT_COORDS = {
     'utility_elite': (3178, 1013),     # NumPad0 - Flux Strike
 }
 
-# Debounce for kit toggles to avoid racing inputs
-DEBOUNCE_WINDOW_SECONDS = 0.6
-last_kit_toggle_time = 0.0
-kit_switch_in_progress = False
-current_mode = 'hammer'  # 'hammer' or 'bomb'
+# Remembers each skill's cooldown so checks skip pixel reads until it may be ready
+COOLDOWNS = CooldownTracker()
 
-def just_toggled_recently() -> bool:
-    """Return True if a kit toggle happened within the debounce window."""
-    return (time.time() - last_kit_toggle_time) < DEBOUNCE_WINDOW_SECONDS
+# Tracks the equipped kit from sent toggles; each toggle is confirmed from one icon
+KITS = KitStateMachine(base='hammer', send=press_and_release)
+KITS.add_kit('bomb', DEFAULT_COORDS['utility_bomb'], key_mapping['numpad8'])
 
 def switch_to_bomb() -> None:
-    global last_kit_toggle_time, kit_switch_in_progress, current_mode
-    if kit_switch_in_progress:
-        return
-    kit_switch_in_progress = True
-    press_and_release(key_mapping['numpad8'])
-    last_kit_toggle_time = time.time()
-    current_mode = 'bomb'
-    time.sleep(0.8)
-    kit_switch_in_progress = False
+    """Toggle Bomb Kit on and wait for its icon to confirm"""
+    KITS.ensure('bomb')
 
 def switch_to_hammer() -> None:
-    global last_kit_toggle_time, kit_switch_in_progress, current_mode
-    if kit_switch_in_progress:
-        return
-    kit_switch_in_progress = True
-    press_and_release(key_mapping['numpad8'])
-    last_kit_toggle_time = time.time()
-    current_mode = 'hammer'
-    time.sleep(1.0)
-    kit_switch_in_progress = False
+    """Toggle Bomb Kit off and wait for its icon to confirm"""
+    KITS.ensure('hammer')
 
 def ensure_hammer_mode() -> None:
     """If Bomb Kit is detected outside a toggle, switch back to Hammer."""
-    if not kit_switch_in_progress and not just_toggled_recently() and is_bomb_kit_equipped():
+    if not KITS.pending and is_bomb_kit_equipped():
         logger.warning("Recovery: Bomb Kit detected during rotation - switching to Hammer")
         switch_to_hammer()
 
 def check_stop_condition(stop_event):
     """Check if we should stop the rotation"""
-    return not keyboard.is_pressed(key_mapping['numpad1']) or stop_event.is_set()
+    return not is_key_pressed(key_mapping['numpad1']) or stop_event.is_set()
 
-def check_skill_available(coords):
-    """Check if a skill is available (not on cooldown)"""
+def read_skill_available(coords):
+    """Read a skill's icon pixel: bright means available"""
     color = pixel_get_color(coords[0], coords[1])
     return color is not None and color != (0, 0, 0) and sum(color) > 300
 
+def cooldown_key(coords):
+    """Tracker key for a skill slot: each kit puts a different skill in it"""
+    return (KITS.mode, coords)
+
+def check_skill_available(coords):
+    """Check if a skill is available (not on cooldown)
+    Answered from the cooldown tracker; the pixel is only read when a check is due."""
+    if KITS.pending:
+        # Mid-swap the slot may show either kit's skill
+        return read_skill_available(coords)
+    return COOLDOWNS.is_ready(cooldown_key(coords), lambda: read_skill_available(coords))
+
 def wait_until_on_cooldown(coords, timeout_seconds: float = 1.8, poll_seconds: float = 0.05) -> bool:
     """Wait until the given skill pixel turns dark (goes on cooldown).
     Returns True if it turned dark within timeout, False otherwise.
+    The pixel watcher checks every new frame, so poll_seconds is no longer used.
     """
-    start = time.time()
-    while (time.time() - start) < timeout_seconds:
-        color = pixel_get_color(coords[0], coords[1])
-        if color is None:
-            return True
-        if color == (0, 0, 0) or sum(color) <= 300:
-            return True
-        time.sleep(poll_seconds)
-    return False
+    # The tracker learns the cooldown from this cast; stamp it with the
+    # time this thread's queued key was actually sent
+    start = get_input_scheduler().wait_own(timeout=1.0)
+    COOLDOWNS.record_cast(cooldown_key(coords), start)
+    # Dark means black or R+G+B <= 300; an unreadable pixel counts as dark
+    fired = wait_until(coords[0], coords[1], below(301), timeout=timeout_seconds,
+                       unreadable=(0, 0, 0)) is not None
+    COOLDOWNS.observe(cooldown_key(coords), ready=not fired)
+    return fired
 
 def is_bomb_kit_equipped():
-    """Check if Bomb Kit is equipped by looking for white color"""
-    coords = DEFAULT_COORDS['utility_bomb']
-    color = pixel_get_color(coords[0], coords[1])
-    if color is None:
-        return False
-    
-    # Check if color is white or close to white (all RGB values high)
-    is_white = color[0] > 200 and color[1] > 200 and color[2] > 200
+    """Check if Bomb Kit is equipped by re-reading its icon (white when equipped)"""
+    equipped = KITS.update() == 'bomb'
     
     # ALWAYS log this to help debug the issue
-    logger.info(f"Bomb Kit check at ({coords[0]}, {coords[1]}): RGB={color}, is_white={is_white}")
+    logger.info(f"Bomb Kit check: mode={KITS.mode}, pending={KITS.target}, equipped={equipped}")
     
-    return is_white
+    return equipped
 
 def opener_bomb_combo(stop_event):
     """
@@ -368,9 +364,9 @@ def hammer_auto_attack_chain(stop_event):
     Perform 3x Hammer auto-attack chain
     IMPORTANT: Makes sure we're not in Bomb Kit first!
     """
-    # Debounce: if a kit switch is in progress or just happened, skip this tick
-    if kit_switch_in_progress or just_toggled_recently():
-        logger.debug("Auto-attack: debounce active, skipping this chain tick")
+    # A kit toggle is still waiting for confirmation: skip this tick
+    if KITS.pending:
+        logger.debug("Auto-attack: kit switch in flight, skipping this chain tick")
         return False
     # If we're in Bomb Kit, attempt a single safe recovery toggle then exit
     if is_bomb_kit_equipped():
@@ -686,6 +682,9 @@ def run(stop_event):
     logger.info("Hold NumPad1 to activate rotation")
     logger.info("Toolbelt skills on keys 1-5, weapon/kit skills on numpad")
     
+    # Only capture the skill bar instead of the whole desktop
+    plan_capture(points=DEFAULT_COORDS.values())
+    
     # Debug: Check initial Bomb Kit status
     logger.info("Initial Bomb Kit status check:")
     is_bomb_kit_equipped()
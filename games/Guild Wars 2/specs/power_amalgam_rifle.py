@@ -41,10 +41,20 @@ Utilities: numpad6-0
 
 import time
 import keyboard
-from libs.pixel_get_color import get_color as pixel_get_color
+from libs.pixel_get_color import get_color as pixel_get_color, wait_for_frame_after
+from libs.pixel_watch import wait_until
 from libs.keyboard_actions_monitored import press_and_release, button_mash
 from libs.key_mapping import key_mapping
+from libs.key_state import is_pressed as is_key_pressed
 from libs.logger import get_logger
+from libs.capture_planner import plan_capture
+from libs.cooldowns import CooldownTracker
+from libs.skill_board import SkillBoard, MULTIPOINT_OFFSETS
+from libs.probe_table import ProbeTable, KeyTable
+from libs.kit_modes import KitStateMachine
+from libs.input_scheduler import get_input_scheduler
+from libs.frame_capture import get_frame_capture_service
+from libs.tick_scheduler import TickScheduler
 import sys
 
 logger = get_logger('power_amalgam_rifle')
@@ -82,24 +92,65 @@ DEFAULT_COORDS = {
     'utility_elite': (3171, 1013),   # NumPad0 - Elite
 }
 
-# Debounce for kit toggles
-DEBOUNCE_WINDOW_SECONDS = 0.6
-last_kit_toggle_time = 0.0
-kit_switch_in_progress = False
+# Compiled once at load so hot loops read attributes instead of hashing names
+COORDS = ProbeTable(DEFAULT_COORDS, offsets={'weapon_5': MULTIPOINT_OFFSETS,
+                                             'utility_elite': MULTIPOINT_OFFSETS})
+KEYS = KeyTable(key_mapping)
 
-def just_toggled_recently() -> bool:
-    """Return True if a kit toggle happened within the debounce window."""
-    return (time.time() - last_kit_toggle_time) < DEBOUNCE_WINDOW_SECONDS
+# Remembers each skill's cooldown so checks skip pixel reads until it may be ready
+COOLDOWNS = CooldownTracker()
+
+# Every pixel the rotation loop checks, evaluated together against one frame
+SKILL_BOARD = SkillBoard()
+SKILL_BOARD.add_probe('in_flamethrower', COORDS.utility_flamethrower, min_channel=200)
+SKILL_BOARD.add_probe('in_elixir', COORDS.utility_elixir, min_channel=200)
+SKILL_BOARD.add_probe('evolve', COORDS.toolbelt_5)
+SKILL_BOARD.add_probe('obliterate', COORDS.toolbelt_4)
+SKILL_BOARD.add_probe('thorns', COORDS.toolbelt_3)
+SKILL_BOARD.add_probe('demolish', COORDS.toolbelt_2)
+SKILL_BOARD.add_probe('elixir', COORDS.utility_elixir)
+SKILL_BOARD.add_probe('plasmatic', COORDS.utility_3)
+SKILL_BOARD.add_probe('weapon_2', COORDS.weapon_2)
+SKILL_BOARD.add_probe('weapon_4', COORDS.weapon_4)
+# Rifle skills may be dimmer when ready (not black = ready, sum > 100)
+SKILL_BOARD.add_probe('weapon_2_dim', COORDS.weapon_2, threshold=100)
+SKILL_BOARD.add_probe('weapon_5_dim', COORDS.weapon_5, threshold=100)
+# Napalm uses INVERTED logic: NOT black = ready, black = on cooldown
+SKILL_BOARD.add_probe('napalm', COORDS.weapon_5, offsets=MULTIPOINT_OFFSETS, threshold=100)
+
+# Tracks the equipped kit from sent toggles; each toggle is confirmed from one icon
+KITS = KitStateMachine(base='rifle', send=press_and_release)
+KITS.add_kit('flamethrower', COORDS.utility_flamethrower, KEYS.numpad8)
+KITS.add_kit('elixir_gun', COORDS.utility_elixir, KEYS.numpad7)
+
+# Rotation passes start 0.1s apart; a pass that casts simply overruns.
+# Passes re-read skills right after casting, so keep the short freshness window
+TICKER = TickScheduler(rate=10, name='rifle', adapt_freshness=False)
+
+# Seconds for the skill bar to redraw once the kit icon confirmed a swap
+SKILL_BAR_SETTLE_SECONDS = 0.15
 
 def check_stop_condition(stop_event):
     """Check if we should stop the rotation"""
-    return not keyboard.is_pressed(key_mapping['numpad1']) or stop_event.is_set()
+    return not is_key_pressed(KEYS.numpad1) or stop_event.is_set()
 
-def check_skill_available(coords):
-    """Check if a skill is available (not on cooldown)"""
+def read_skill_available(coords):
+    """Read a skill's icon pixel: bright means available"""
     color = pixel_get_color(coords[0], coords[1])
     return color is not None and color != (0, 0, 0) and sum(color) > 300
 
+def cooldown_key(coords):
+    """Tracker key for a skill slot: each kit puts a different skill in it"""
+    return (KITS.mode, coords)
+
+def check_skill_available(coords):
+    """Check if a skill is available (not on cooldown)
+    Answered from the cooldown tracker; the pixel is only read when a check is due."""
+    if KITS.pending:
+        # Mid-swap the slot may show either kit's skill
+        return read_skill_available(coords)
+    return COOLDOWNS.is_ready(cooldown_key(coords), lambda: read_skill_available(coords))
+
 def check_skill_available_multipoint(coords, offsets=[(0, 0), (-2, -2), (2, -2), (0, -5)], invert_logic=False):
     """Check if a skill is available by checking multiple points on the icon
     For some skills (like Napalm), ready state is indicated by BLACK pixel,
@@ -128,25 +179,33 @@ def wait_until_on_cooldown(coords, timeout_seconds: float = 2.0, poll_seconds: f
     """Wait until the given skill pixel turns dark (goes on cooldown).
     Returns True if skill went on cooldown, False if timeout.
     If skill gets brighter, it likely didn't fire - will return False after timeout.
+    The pixel watcher checks every new frame, so poll_seconds is no longer used.
     """
-    initial_color = pixel_get_color(coords[0], coords[1])
-    initial_sum = sum(initial_color) if initial_color else 0
-    start = time.time()
-    brightest_sum = initial_sum  # Track if it gets brighter (didn't fire)
+    # The tracker learns the cooldown from this cast; stamp it with the
+    # time this thread's queued key was actually sent
+    start = get_input_scheduler().wait_own(timeout=1.0)
+    COOLDOWNS.record_cast(cooldown_key(coords), start)
+    # Never compare against a frame captured before we were called
+    frame = wait_for_frame_after(start, timeout=timeout_seconds)
+    if frame is not None:
+        initial_color = get_frame_capture_service().get_color(coords[0], coords[1], frame)
+    else:
+        initial_color = pixel_get_color(coords[0], coords[1])
+    if initial_color is None:
+        return True
+    initial_sum = sum(initial_color)
+    state = {'brightest_sum': initial_sum}  # Track if it gets brighter (didn't fire)
     
     # For toolbelt skills, they might dim slightly or go dark
     # Check multiple conditions with varying strictness based on initial brightness
-    while (time.time() - start) < timeout_seconds:
-        color = pixel_get_color(coords[0], coords[1])
-        if color is None:
-            return True
+    def on_cooldown(color):
         current_sum = sum(color)
         dim_amount = initial_sum - current_sum
         dim_percentage = (dim_amount / initial_sum) if initial_sum > 0 else 0
         
         # Track if skill got brighter (didn't fire)
-        if current_sum > brightest_sum:
-            brightest_sum = current_sum
+        if current_sum > state['brightest_sum']:
+            state['brightest_sum'] = current_sum
         
         # Skill is on cooldown if:
         # 1. Completely black
@@ -157,20 +216,22 @@ def wait_until_on_cooldown(coords, timeout_seconds: float = 2.0, poll_seconds: f
         # For bright toolbelt skills (initial_sum > 400), even small dimming can indicate cooldown
         # Accept if: dimmed by 5% OR dimmed by 10+ points OR dropped below 98% of initial
         if initial_sum > 400:
-            if dim_percentage >= 0.05 or dim_amount >= 10 or current_sum < (initial_sum * 0.98):
-                return True
+            return dim_percentage >= 0.05 or dim_amount >= 10 or current_sum < (initial_sum * 0.98)
         
         # For moderately bright skills (350-400), check for 10% dimming or below 350
-        elif initial_sum > 350:
-            if dim_percentage >= 0.10 or current_sum < 350:
-                return True
+        if initial_sum > 350:
+            return dim_percentage >= 0.10 or current_sum < 350
         
         # For darker skills, check for 15% dimming
-        else:
-            if dim_percentage >= 0.15:
-                return True
-        
-        time.sleep(poll_seconds)
+        return dim_percentage >= 0.15
+    
+    # One shared watcher evaluates this against every new frame
+    remaining = max(start + timeout_seconds - time.time(), 0)
+    if wait_until(coords[0], coords[1], on_cooldown, timeout=remaining) is not None:
+        COOLDOWNS.observe(cooldown_key(coords), ready=False)
+        return True
+    COOLDOWNS.observe(cooldown_key(coords), ready=True)
+    brightest_sum = state['brightest_sum']
     
     # Timeout - check final state for logging
     final_color = pixel_get_color(coords[0], coords[1])
@@ -183,13 +244,6 @@ def wait_until_on_cooldown(coords, timeout_seconds: float = 2.0, poll_seconds: f
         log_and_print('info', f"wait_until_on_cooldown timeout: initial_sum={initial_sum}, final_sum={final_sum}, dim={dim_percentage:.1f}%, coords={coords}")
     return False
 
-def is_kit_equipped(kit_coords):
-    """Check if a kit is equipped by looking for white color"""
-    color = pixel_get_color(kit_coords[0], kit_coords[1])
-    if color is None:
-        return False
-    return color[0] > 200 and color[1] > 200 and color[2] > 200
-
 def try_flux_state(stop_event):
     """
     Try to use Flux State (NumPad0 - Elite) at the start of bursts if available.
@@ -199,11 +253,11 @@ def try_flux_state(stop_event):
     """
     # Use multipoint check with inverted logic (same as Napalm)
     # Flux State is on NumPad0 (elite utility slot)
-    flux_ready, color, checked_coords = check_skill_available_multipoint(DEFAULT_COORDS['utility_elite'], invert_logic=True)
+    flux_ready, color, checked_coords = check_skill_available_multipoint(COORDS.utility_elite, invert_logic=True)
     log_and_print('info', f"Flux State ready check: {flux_ready}, color at {checked_coords}: {color}, sum: {sum(color) if color else 0}")
     if flux_ready:
         log_and_print('info', ">>> Using Flux State (NumPad0) - Pull")
-        button_mash(key_mapping['numpad0'], presses=2, delay=0.05)
+        button_mash(KEYS.numpad0, presses=2, delay=0.05)
         time.sleep(0.2)  # Brief wait after Flux State
         if check_stop_condition(stop_event):
             return False
@@ -224,7 +278,7 @@ def execute_napalm_burst(stop_event):
     try_flux_state(stop_event)
     
     # Switch to Flamethrower if needed
-    if not is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+    if not KITS.is_active('flamethrower'):
         log_and_print('info', "Switching to Flamethrower for Napalm burst")
         ensure_flamethrower_mode(stop_event)
         if check_stop_condition(stop_event): return False
@@ -233,21 +287,21 @@ def execute_napalm_burst(stop_event):
         # Already in Flamethrower, but skill bar might need a moment to update
         time.sleep(0.3)  # Small wait to ensure skill bar is fully updated
         # Per Metabattle: Flame Blast can be added before burst combos due to travel time
-        flame_blast_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+        flame_blast_ready = check_skill_available(COORDS.weapon_2)
         if flame_blast_ready:
             log_and_print('info', ">>> PRE-BURST: Using Flame Blast (travels while we use other skills)")
-            button_mash(key_mapping['numpad2'], presses=2, delay=0.05)
+            button_mash(KEYS.numpad2, presses=2, delay=0.05)
             time.sleep(0.2)  # Short wait, skill has travel time
     
     # Verify we're actually in Flamethrower mode
-    in_flamethrower_check = is_kit_equipped(DEFAULT_COORDS['utility_flamethrower'])
+    in_flamethrower_check = KITS.is_active('flamethrower')
     log_and_print('info', f"In Flamethrower mode check: {in_flamethrower_check}")
     
     # Check Napalm (Flamethrower Skill 5) with retries
     # Napalm uses INVERTED logic: NOT black = ready, black = on cooldown
     napalm_ready = False
     for attempt in range(6):  # More attempts to catch skill bar updates
-        napalm_ready, color, checked_coords = check_skill_available_multipoint(DEFAULT_COORDS['weapon_5'], invert_logic=True)
+        napalm_ready, color, checked_coords = check_skill_available_multipoint(COORDS.weapon_5, invert_logic=True)
         log_and_print('info', f"Napalm ready check (attempt {attempt+1}/6): {napalm_ready}, color at {checked_coords}: {color}, sum: {sum(color) if color else 0}")
         if napalm_ready:
             break
@@ -259,15 +313,15 @@ def execute_napalm_burst(stop_event):
         return False
     
     # STEP 1: Plasmatic State (damage modifier)
-    plasmatic_ready = check_skill_available(DEFAULT_COORDS['utility_3'])
+    plasmatic_ready = check_skill_available(COORDS.utility_3)
     if plasmatic_ready:
         log_and_print('info', ">>> STEP 1/2: Using Plasmatic State (damage modifier)")
         # Retry logic to ensure it fires
         plasmatic_on_cd = False
         for retry_attempt in range(3):  # Try up to 3 times
-            button_mash(key_mapping['numpad9'], presses=6, delay=0.05)  # Increased to 6 presses
+            button_mash(KEYS.numpad9, presses=6, delay=0.05)  # Increased to 6 presses
             time.sleep(0.5)  # Increased wait for skill to register
-            plasmatic_on_cd = not check_skill_available(DEFAULT_COORDS['utility_3'])
+            plasmatic_on_cd = not check_skill_available(COORDS.utility_3)
             if plasmatic_on_cd:
                 if retry_attempt > 0:
                     log_and_print('info', f"Plasmatic State fired on retry attempt {retry_attempt+1}")
@@ -283,9 +337,9 @@ def execute_napalm_burst(stop_event):
     
     # STEP 2: Napalm
     log_and_print('info', ">>> STEP 2/2: Using Napalm (Flamethrower Skill 5)")
-    button_mash(key_mapping['numpad5'], presses=2, delay=0.05)
+    button_mash(KEYS.numpad5, presses=2, delay=0.05)
     time.sleep(2.0)  # Increased wait for skill to register and animation to complete (~2s)
-    wait_until_on_cooldown(DEFAULT_COORDS['weapon_5'], timeout_seconds=2.5)
+    wait_until_on_cooldown(COORDS.weapon_5, timeout_seconds=2.5)
     if check_stop_condition(stop_event): return False
     
     log_and_print('info', "=" * 70)
@@ -307,17 +361,17 @@ def execute_acid_bomb_burst(stop_event):
     try_flux_state(stop_event)
     
     # Per Metabattle: Flame Blast can be added before burst combos if in Flamethrower
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
-        flame_blast_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+    if KITS.is_active('flamethrower'):
+        flame_blast_ready = check_skill_available(COORDS.weapon_2)
         if flame_blast_ready:
             log_and_print('info', ">>> PRE-BURST: Using Flame Blast (travels while we do Jump Shot/Acid Bomb)")
-            button_mash(key_mapping['numpad2'], presses=2, delay=0.05)
+            button_mash(KEYS.numpad2, presses=2, delay=0.05)
             time.sleep(0.2)  # Short wait, skill has travel time
     
     # STEP 1: Jump Shot
     log_and_print('info', ">>> STEP 1/2: Using Jump Shot (Rifle Skill 5)")
     # Ensure we're in Rifle mode FIRST - Jump Shot is only available in Rifle mode
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']) or is_kit_equipped(DEFAULT_COORDS['utility_elixir']):
+    if KITS.is_active('flamethrower') or KITS.is_active('elixir_gun'):
         log_and_print('info', "Switching to Rifle for Jump Shot")
         ensure_rifle_mode(stop_event)
         if check_stop_condition(stop_event): return False
@@ -326,7 +380,7 @@ def execute_acid_bomb_burst(stop_event):
     # NOW check if Jump Shot is ready - retry in case skill bar is still updating
     jump_shot_ready = False
     for attempt in range(3):
-        jump_shot_ready = check_skill_available(DEFAULT_COORDS['weapon_5'])
+        jump_shot_ready = check_skill_available(COORDS.weapon_5)
         log_and_print('info', f"Jump Shot ready check (after switching to Rifle, attempt {attempt+1}/3): {jump_shot_ready}")
         if jump_shot_ready:
             break
@@ -341,11 +395,11 @@ def execute_acid_bomb_burst(stop_event):
     waited = False
     jump_shot_on_cd = False
     for retry_attempt in range(2):  # Try up to 2 times
-        button_mash(key_mapping['numpad5'], presses=4, delay=0.05)  # Increased to 4 presses
+        button_mash(KEYS.numpad5, presses=4, delay=0.05)  # Increased to 4 presses
         time.sleep(1.0)  # Wait for skill to register and animation to complete (1s for Jump Shot)
-        waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_5'], timeout_seconds=2.5)
+        waited = wait_until_on_cooldown(COORDS.weapon_5, timeout_seconds=2.5)
         time.sleep(0.5)  # Additional wait after cooldown check
-        jump_shot_on_cd = not check_skill_available(DEFAULT_COORDS['weapon_5'])
+        jump_shot_on_cd = not check_skill_available(COORDS.weapon_5)
         if waited or jump_shot_on_cd:
             if retry_attempt > 0:
                 log_and_print('info', f"Jump Shot fired on retry attempt {retry_attempt+1}")
@@ -371,17 +425,19 @@ def execute_acid_bomb_burst(stop_event):
     time.sleep(0.8)  # Wait for Elixir Gun kit to equip and skill bar to update
     
     # Check if Acid Bomb is ready - simple check without excessive verification
-    acid_bomb_ready = check_skill_available(DEFAULT_COORDS['weapon_4'])
+    acid_bomb_ready = check_skill_available(COORDS.weapon_4)
     log_and_print('info', f"Acid Bomb ready check: {acid_bomb_ready}")
     
     if acid_bomb_ready:
         log_and_print('info', "Pressing Acid Bomb (NumPad4)")
-        button_mash(key_mapping['numpad4'], presses=2, delay=0.05)
+        button_mash(KEYS.numpad4, presses=2, delay=0.05)
         time.sleep(0.6)  # Wait for Acid Bomb to start casting
         # Cancel Acid Bomb with weapon swap (F1)
         log_and_print('info', "Canceling Acid Bomb with weapon swap (F1)")
-        button_mash(key_mapping['f1'], presses=2, delay=0.05)
+        button_mash(KEYS.f1, presses=2, delay=0.05)
         time.sleep(0.5)  # Wait after cancel to ensure weapon swap completes
+        # Weapon swap is not a kit toggle, so re-read the kit icons
+        KITS.sync()
         if check_stop_condition(stop_event): return False
     else:
         log_and_print('info', "Acid Bomb not ready, skipping")
@@ -410,15 +466,15 @@ def execute_morph_burst(stop_event):
     try_flux_state(stop_event)
     
     # Per Metabattle: Flame Blast can be added before burst combos if in Flamethrower
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
-        flame_blast_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+    if KITS.is_active('flamethrower'):
+        flame_blast_ready = check_skill_available(COORDS.weapon_2)
         if flame_blast_ready:
             log_and_print('info', ">>> PRE-BURST: Using Flame Blast (travels while we stack morphs)")
-            button_mash(key_mapping['numpad2'], presses=2, delay=0.05)
+            button_mash(KEYS.numpad2, presses=2, delay=0.05)
             time.sleep(0.2)  # Short wait, skill has travel time
     
     # Check if Evolve is ready
-    evolve_ready = check_skill_available(DEFAULT_COORDS['toolbelt_5'])
+    evolve_ready = check_skill_available(COORDS.toolbelt_5)
     log_and_print('info', f"Evolve ready check in morph_burst: {evolve_ready}")
     if not evolve_ready:
         log_and_print('info', "Evolve not ready, skipping morph burst")
@@ -426,13 +482,13 @@ def execute_morph_burst(stop_event):
     
     # CRITICAL: Ensure we're in Rifle mode before using toolbelt skills (morphs and Evolve)
     # This prevents kit switches from interrupting the morph sequence
-    if is_kit_equipped(DEFAULT_COORDS['utility_elixir']) or is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+    if KITS.is_active('elixir_gun') or KITS.is_active('flamethrower'):
         log_and_print('info', "Ensuring Rifle mode before morph sequence (critical)")
         ensure_rifle_mode(stop_event)
-        time.sleep(0.3)  # Give time for weapon swap to complete
+        time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
     
     # STEP 1: Defensive Protocol: Thorns - with retry if it doesn't fire
-    thorns_ready = check_skill_available(DEFAULT_COORDS['toolbelt_3'])
+    thorns_ready = check_skill_available(COORDS.toolbelt_3)
     if thorns_ready:
         log_and_print('info', ">>> STEP 1/6: Using Defensive Protocol: Thorns (F3)")
         time.sleep(0.15)  # Small delay to ensure we're not animation locked
@@ -440,9 +496,9 @@ def execute_morph_burst(stop_event):
         for retry_attempt in range(2):  # Try up to 2 times
             button_mash('3', presses=6, delay=0.05)  # Increased to 6 presses
             time.sleep(0.15)  # Give time for skill to register
-            waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_3'], timeout_seconds=1.5)
+            waited = wait_until_on_cooldown(COORDS.toolbelt_3, timeout_seconds=1.5)
             time.sleep(0.15)  # Reduced wait
-            thorns_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_3'])
+            thorns_on_cd = not check_skill_available(COORDS.toolbelt_3)
             if waited or thorns_on_cd:
                 if retry_attempt > 0:
                     log_and_print('info', f"Thorns fired on retry attempt {retry_attempt+1}")
@@ -459,7 +515,7 @@ def execute_morph_burst(stop_event):
         log_and_print('info', "STEP 1 SKIP: Thorns not ready")
     
     # STEP 2: Offensive Protocol: Obliterate - with retry if it doesn't fire
-    obliterate_ready = check_skill_available(DEFAULT_COORDS['toolbelt_4'])
+    obliterate_ready = check_skill_available(COORDS.toolbelt_4)
     if obliterate_ready:
         log_and_print('info', ">>> STEP 2/6: Using Offensive Protocol: Obliterate (F4)")
         time.sleep(0.15)  # Small delay to ensure previous skill finished
@@ -469,9 +525,9 @@ def execute_morph_burst(stop_event):
         for retry_attempt in range(2):  # Try up to 2 times
             button_mash('4', presses=6, delay=0.05)  # Increased to 6 presses
             time.sleep(0.4)  # Increased wait for skill to register and animation to start
-            waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_4'], timeout_seconds=2.0)
+            waited = wait_until_on_cooldown(COORDS.toolbelt_4, timeout_seconds=2.0)
             time.sleep(0.3)  # Additional wait after cooldown check
-            obliterate_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_4'])
+            obliterate_on_cd = not check_skill_available(COORDS.toolbelt_4)
             if waited or obliterate_on_cd:
                 if retry_attempt > 0:
                     log_and_print('info', f"Obliterate fired on retry attempt {retry_attempt+1}")
@@ -488,17 +544,17 @@ def execute_morph_burst(stop_event):
         log_and_print('info', "STEP 2 SKIP: Obliterate not ready")
     
     # STEP 3: Offensive Protocol: Demolish (F2 if available)
-    demolish_ready = check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+    demolish_ready = check_skill_available(COORDS.toolbelt_2)
     if demolish_ready:
         log_and_print('info', ">>> STEP 3/6: Using Offensive Protocol: Demolish (F2)")
         button_mash('2', presses=5, delay=0.05)  # Increased to 5 presses
         time.sleep(0.1)  # Reduced delay
-        waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_2'], timeout_seconds=1.8)
+        waited = wait_until_on_cooldown(COORDS.toolbelt_2, timeout_seconds=1.8)
         time.sleep(0.15)  # Reduced wait
-        demolish_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+        demolish_on_cd = not check_skill_available(COORDS.toolbelt_2)
         if not demolish_on_cd and waited:
             time.sleep(0.1)
-            demolish_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+            demolish_on_cd = not check_skill_available(COORDS.toolbelt_2)
         elif not waited:
             log_and_print('info', "WARNING: Demolish may not have fired (timeout)")
         log_and_print('info', f"Demolish on cooldown: {demolish_on_cd}")
@@ -526,7 +582,7 @@ def execute_morph_burst(stop_event):
     # STEP 5: Offensive Protocol: Obliterate (again, after Evolve reset) - retry to catch reset
     obliterate_fired = False
     for attempt in range(10):  # Increased attempts (morphs can take 1-2s to reset)
-        obliterate_ready = check_skill_available(DEFAULT_COORDS['toolbelt_4'])
+        obliterate_ready = check_skill_available(COORDS.toolbelt_4)
         log_and_print('info', f"Post-Evolve Obliterate check (attempt {attempt+1}/10): {obliterate_ready}")
         if obliterate_ready:
             log_and_print('info', f">>> STEP 5/6: Using Offensive Protocol: Obliterate (F4) - post-Evolve")
@@ -544,7 +600,7 @@ def execute_morph_burst(stop_event):
     # STEP 6: Offensive Protocol: Demolish (again, after Evolve reset) - retry to catch reset
     demolish_fired = False
     for attempt in range(8):  # Increased attempts since morphs can take time to reset
-        demolish_ready = check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+        demolish_ready = check_skill_available(COORDS.toolbelt_2)
         log_and_print('info', f"Post-Evolve Demolish check (attempt {attempt+1}/8): {demolish_ready}")
         if demolish_ready:
             log_and_print('info', f">>> STEP 6/6: Using Offensive Protocol: Demolish (F2) - post-Evolve")
@@ -578,27 +634,27 @@ def execute_filler_burst(stop_event):
     try_flux_state(stop_event)
     
     # Switch to Flamethrower
-    if not is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+    if not KITS.is_active('flamethrower'):
         log_and_print('info', "Switching to Flamethrower for filler burst")
         ensure_flamethrower_mode(stop_event)
         if check_stop_condition(stop_event): return False
         time.sleep(0.2)
     
     # STEP 1: Flame Blast (Flamethrower Skill 2)
-    flame_blast_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+    flame_blast_ready = check_skill_available(COORDS.weapon_2)
     if flame_blast_ready:
         log_and_print('info', ">>> STEP 1/2: Using Flame Blast (Flamethrower Skill 2)")
-        button_mash(key_mapping['numpad2'], presses=2, delay=0.05)
+        button_mash(KEYS.numpad2, presses=2, delay=0.05)
         time.sleep(0.3)
         if check_stop_condition(stop_event): return False
     
     # STEP 2: Blunderbuss (Rifle Skill 2) - switch back to Rifle
     ensure_rifle_mode(stop_event)
-    time.sleep(0.8)  # Increased wait for weapon swap animation and skill bar to fully update
+    time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
     # Retry checking Blunderbuss in case skill bar is still updating
     blunderbuss_ready = False
     for attempt in range(3):
-        blunderbuss_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+        blunderbuss_ready = check_skill_available(COORDS.weapon_2)
         if blunderbuss_ready:
             break
         elif attempt < 2:
@@ -609,11 +665,11 @@ def execute_filler_burst(stop_event):
         waited = False
         blunderbuss_on_cd = False
         for retry_attempt in range(2):  # Try up to 2 times
-            button_mash(key_mapping['numpad2'], presses=4, delay=0.05)  # Increased to 4 presses
+            button_mash(KEYS.numpad2, presses=4, delay=0.05)  # Increased to 4 presses
             time.sleep(3.0)  # Increased wait for skill to register and animation to complete (3s for Blunderbuss)
-            waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_2'], timeout_seconds=3.5)
+            waited = wait_until_on_cooldown(COORDS.weapon_2, timeout_seconds=3.5)
             time.sleep(0.5)  # Additional wait after cooldown check
-            blunderbuss_on_cd = not check_skill_available(DEFAULT_COORDS['weapon_2'])
+            blunderbuss_on_cd = not check_skill_available(COORDS.weapon_2)
             if waited or blunderbuss_on_cd:
                 if retry_attempt > 0:
                     log_and_print('info', f"Blunderbuss fired on retry attempt {retry_attempt+1}")
@@ -638,73 +694,30 @@ def execute_filler_burst(stop_event):
 
 def ensure_rifle_mode(stop_event):
     """Ensure we're in Rifle mode - cancel out of any kit"""
-    global last_kit_toggle_time, kit_switch_in_progress
-    
-    if kit_switch_in_progress or just_toggled_recently():
-        return True
-    
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
-        log_and_print('info', "Switching to Rifle (NumPad8)")
-        kit_switch_in_progress = True
-        press_and_release(key_mapping['numpad8'])
-        last_kit_toggle_time = time.time()
-        time.sleep(0.8)
-        kit_switch_in_progress = False
-        return True
-    elif is_kit_equipped(DEFAULT_COORDS['utility_elixir']):
-        log_and_print('info', "Switching to Rifle (NumPad7)")
-        kit_switch_in_progress = True
-        press_and_release(key_mapping['numpad7'])
-        last_kit_toggle_time = time.time()
-        time.sleep(0.8)
-        kit_switch_in_progress = False
-        return True
-    else:
+    if KITS.is_active('rifle') and not KITS.pending:
         return True
+    log_and_print('info', f"Switching to Rifle from {KITS.mode}")
+    return KITS.ensure('rifle', stop_event=stop_event)
 
 def ensure_flamethrower_mode(stop_event):
     """Ensure we're in Flamethrower mode"""
-    global last_kit_toggle_time, kit_switch_in_progress
-    
-    if kit_switch_in_progress or just_toggled_recently():
-        return True
-    
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+    if KITS.is_active('flamethrower') and not KITS.pending:
         return True
-    
     log_and_print('info', "Switching to Flamethrower Kit (NumPad8)")
-    kit_switch_in_progress = True
-    press_and_release(key_mapping['numpad8'])
-    last_kit_toggle_time = time.time()
-    time.sleep(0.8)
-    kit_switch_in_progress = False
-    
-    switched = is_kit_equipped(DEFAULT_COORDS['utility_flamethrower'])
+    switched = KITS.ensure('flamethrower', stop_event=stop_event)
     log_and_print('info', f"Flamethrower switch result: {switched}")
     return switched
 
 def is_elixir_gun_equipped():
-    """Check if Elixir Gun is equipped"""
-    return is_kit_equipped(DEFAULT_COORDS['utility_elixir'])
+    """Check if Elixir Gun is equipped (tracked state, no pixel read)"""
+    return KITS.is_active('elixir_gun')
 
 def ensure_elixir_gun_mode(stop_event):
     """Ensure we're in Elixir Gun mode"""
-    global last_kit_toggle_time, kit_switch_in_progress
-    
-    if kit_switch_in_progress or just_toggled_recently():
-        return True
-    
-    if is_elixir_gun_equipped():
+    if KITS.is_active('elixir_gun') and not KITS.pending:
         return True
-    
     log_and_print('info', "Switching to Elixir Gun Kit (NumPad7)")
-    kit_switch_in_progress = True
-    press_and_release(key_mapping['numpad7'])
-    last_kit_toggle_time = time.time()
-    time.sleep(0.8)
-    kit_switch_in_progress = False
-    
-    switched = is_elixir_gun_equipped()
+    switched = KITS.ensure('elixir_gun', stop_event=stop_event)
     log_and_print('info', f"Elixir Gun switch result: {switched}")
     return switched
 
@@ -734,15 +747,15 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
     try_flux_state(stop_event)
     
     # STEP 1: Plasmatic State (if available)
-    plasmatic_ready = check_skill_available(DEFAULT_COORDS['utility_3'])
+    plasmatic_ready = check_skill_available(COORDS.utility_3)
     if plasmatic_ready:
         log_and_print('info', ">>> STEP 1/12: Using Plasmatic State")
         # Retry logic to ensure it fires
         plasmatic_on_cd = False
         for retry_attempt in range(3):  # Try up to 3 times
-            button_mash(key_mapping['numpad9'], presses=6, delay=0.05)  # Increased to 6 presses
+            button_mash(KEYS.numpad9, presses=6, delay=0.05)  # Increased to 6 presses
             time.sleep(0.5)  # Increased wait for skill to register
-            plasmatic_on_cd = not check_skill_available(DEFAULT_COORDS['utility_3'])
+            plasmatic_on_cd = not check_skill_available(COORDS.utility_3)
             if plasmatic_on_cd:
                 if retry_attempt > 0:
                     log_and_print('info', f"Plasmatic State fired on retry attempt {retry_attempt+1}")
@@ -759,15 +772,15 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
     # STEP 2: Napalm (if ready)
     if napalm_ready:
         log_and_print('info', ">>> STEP 2/12: Using Napalm (Flamethrower Skill 5)")
-        if not is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+        if not KITS.is_active('flamethrower'):
             ensure_flamethrower_mode(stop_event)
-            time.sleep(0.7)  # Give more time for kit to equip and skill bar to update
+            time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
         else:
             # Already in Flamethrower, but skill bar might need a moment to update after other actions
             time.sleep(0.3)  # Small wait to ensure skill bar is fully updated
         
         # Verify we're actually in Flamethrower mode
-        in_flamethrower_check = is_kit_equipped(DEFAULT_COORDS['utility_flamethrower'])
+        in_flamethrower_check = KITS.is_active('flamethrower')
         log_and_print('info', f"In Flamethrower mode check: {in_flamethrower_check}")
         
         # Retry checking Napalm - skill bar might need time to update
@@ -775,13 +788,13 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
         napalm_fired = False
         for attempt in range(6):  # More attempts to catch skill bar updates
             # Try multipoint check - check multiple spots on the skill icon
-            napalm_check, color, checked_coords = check_skill_available_multipoint(DEFAULT_COORDS['weapon_5'], invert_logic=True)
+            napalm_check, color, checked_coords = check_skill_available_multipoint(COORDS.weapon_5, invert_logic=True)
             log_and_print('info', f"Napalm ready check after switch (attempt {attempt+1}/6): {napalm_check}")
             log_and_print('info', f"Napalm pixel color at {checked_coords}: {color}, sum: {sum(color) if color else 0}")
             
             if napalm_check:
                 log_and_print('info', f">>> STEP 2/12: Using Napalm (Flamethrower Skill 5) - detected at {checked_coords}")
-                button_mash(key_mapping['numpad5'], presses=2, delay=0.05)
+                button_mash(KEYS.numpad5, presses=2, delay=0.05)
                 time.sleep(0.3)
                 napalm_fired = True
                 if check_stop_condition(stop_event): return False
@@ -796,16 +809,16 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
     # Try Jump Shot before Acid Bomb if both are ready
     jump_shot_ready = False
     if acid_bomb_ready:  # If acid_bomb_with_jump_shot combo is ready, try Jump Shot first
-        jump_shot_ready = check_skill_available(DEFAULT_COORDS['weapon_5'])
+        jump_shot_ready = check_skill_available(COORDS.weapon_5)
         if jump_shot_ready:
             log_and_print('info', ">>> STEP 3/12: Using Jump Shot (Rifle Skill 5)")
-            if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']) or is_kit_equipped(DEFAULT_COORDS['utility_elixir']):
+            if KITS.is_active('flamethrower') or KITS.is_active('elixir_gun'):
                 ensure_rifle_mode(stop_event)
-                time.sleep(0.8)  # Increased wait for weapon swap animation and skill bar to fully update
+                time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
             # Re-check after switching - retry in case skill bar is still updating
             jump_shot_ready = False
             for attempt in range(3):
-                jump_shot_ready = check_skill_available(DEFAULT_COORDS['weapon_5'])
+                jump_shot_ready = check_skill_available(COORDS.weapon_5)
                 if jump_shot_ready:
                     break
                 elif attempt < 2:
@@ -816,11 +829,11 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
                 waited = False
                 jump_shot_on_cd = False
                 for retry_attempt in range(2):  # Try up to 2 times
-                    button_mash(key_mapping['numpad5'], presses=4, delay=0.05)  # Jump Shot is Rifle 5 = NumPad5
+                    button_mash(KEYS.numpad5, presses=4, delay=0.05)  # Jump Shot is Rifle 5 = NumPad5
                     time.sleep(1.0)  # Wait for skill to register and animation to complete (1s for Jump Shot)
-                    waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_5'], timeout_seconds=2.5)
+                    waited = wait_until_on_cooldown(COORDS.weapon_5, timeout_seconds=2.5)
                     time.sleep(0.3)  # Additional wait after cooldown check
-                    js_color_check_25 = pixel_get_color(DEFAULT_COORDS['weapon_5'][0], DEFAULT_COORDS['weapon_5'][1])
+                    js_color_check_25 = pixel_get_color(COORDS.weapon_5[0], COORDS.weapon_5[1])
                     jump_shot_on_cd = not (js_color_check_25 is not None and js_color_check_25 != (0, 0, 0) and sum(js_color_check_25) > 30)
                     if waited or jump_shot_on_cd:
                         if retry_attempt > 0:
@@ -845,39 +858,41 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
     # STEP 4: Acid Bomb (always try if we're in ideal burst - Acid Bomb is high priority per guide)
     log_and_print('info', ">>> STEP 4/12: Using Acid Bomb (Elixir Gun Skill 4) - will cancel")
     ensure_elixir_gun_mode(stop_event)
-    time.sleep(0.8)  # Wait for Elixir Gun kit to equip and skill bar to update
+    time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
     
     # Simple check if Acid Bomb is ready
-    acid_bomb_ready_check = check_skill_available(DEFAULT_COORDS['weapon_4'])
+    acid_bomb_ready_check = check_skill_available(COORDS.weapon_4)
     log_and_print('info', f"Acid Bomb ready check: {acid_bomb_ready_check}")
     
     if acid_bomb_ready_check:
         log_and_print('info', ">>> STEP 4/12: Pressing Acid Bomb (NumPad4) - will cancel with F1")
-        button_mash(key_mapping['numpad4'], presses=2, delay=0.05)
+        button_mash(KEYS.numpad4, presses=2, delay=0.05)
         time.sleep(0.6)  # Wait for Acid Bomb to start casting
         log_and_print('info', ">>> STEP 4/12: Canceling Acid Bomb with F1 (weapon swap)")
-        button_mash(key_mapping['f1'], presses=2, delay=0.05)
+        button_mash(KEYS.f1, presses=2, delay=0.05)
         time.sleep(0.5)  # Wait after cancel to ensure weapon swap completes
+        # Weapon swap is not a kit toggle, so re-read the kit icons
+        KITS.sync()
         # Ensure we're back in Rifle mode before using toolbelt skills (Evolve)
-        if is_kit_equipped(DEFAULT_COORDS['utility_elixir']) or is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+        if KITS.is_active('elixir_gun') or KITS.is_active('flamethrower'):
             ensure_rifle_mode(stop_event)
-            time.sleep(0.3)  # Wait for weapon swap to complete
+            time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
         if check_stop_condition(stop_event): return False
     
     # STEP 5-10: Morph skills (ALWAYS check if Evolve is ready, regardless of morph_ready parameter)
     # Per Metabattle: Stack morphs before Evolve, then use them again after Evolve resets
-    evolve_ready = check_skill_available(DEFAULT_COORDS['toolbelt_5'])
+    evolve_ready = check_skill_available(COORDS.toolbelt_5)
     if evolve_ready:
         log_and_print('info', "Evolve is ready - stacking morphs before Evolve")
         
         # Ensure we're in Rifle mode before using toolbelt skills (cleaner execution)
-        if is_kit_equipped(DEFAULT_COORDS['utility_elixir']) or is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+        if KITS.is_active('elixir_gun') or KITS.is_active('flamethrower'):
             log_and_print('info', "Ensuring Rifle mode before Evolve")
             ensure_rifle_mode(stop_event)
-            time.sleep(0.6)  # Increased wait for weapon swap animation and skill bar to fully update
+            time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
         
         # STEP 5: Thorns (if available) - with retry if it doesn't fire
-        thorns_ready = check_skill_available(DEFAULT_COORDS['toolbelt_3'])
+        thorns_ready = check_skill_available(COORDS.toolbelt_3)
         if thorns_ready:
             log_and_print('info', ">>> STEP 5/12: Using Defensive Protocol: Thorns (F3) - pre-Evolve")
             time.sleep(0.25)  # Increased delay to ensure we're not animation locked
@@ -887,9 +902,9 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
             for retry_attempt in range(2):  # Try up to 2 times
                 button_mash('3', presses=6, delay=0.05)  # Increased to 6 presses
                 time.sleep(0.4)  # Increased wait for skill to register
-                waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_3'], timeout_seconds=2.0)
+                waited = wait_until_on_cooldown(COORDS.toolbelt_3, timeout_seconds=2.0)
                 time.sleep(0.3)  # Increased wait after cooldown check
-                thorns_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_3'])
+                thorns_on_cd = not check_skill_available(COORDS.toolbelt_3)
                 if waited or thorns_on_cd:
                     if retry_attempt > 0:
                         log_and_print('info', f"Thorns fired on retry attempt {retry_attempt+1}")
@@ -906,7 +921,7 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
             log_and_print('info', "STEP 5 SKIP: Thorns not ready")
         
         # STEP 6: Obliterate (if available) - with retry if it doesn't fire
-        obliterate_ready = check_skill_available(DEFAULT_COORDS['toolbelt_4'])
+        obliterate_ready = check_skill_available(COORDS.toolbelt_4)
         if obliterate_ready:
             log_and_print('info', ">>> STEP 6/12: Using Offensive Protocol: Obliterate (F4) - pre-Evolve")
             time.sleep(0.4)  # Increased delay to ensure previous skill finished
@@ -916,9 +931,9 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
             for retry_attempt in range(3):  # Try up to 3 times
                 button_mash('4', presses=7, delay=0.05)  # Increased to 7 presses for reliability
                 time.sleep(0.5)  # Increased wait for skill to register and animation to start
-                waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_4'], timeout_seconds=2.5)
+                waited = wait_until_on_cooldown(COORDS.toolbelt_4, timeout_seconds=2.5)
                 time.sleep(0.4)  # Increased wait after cooldown check
-                obliterate_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_4'])
+                obliterate_on_cd = not check_skill_available(COORDS.toolbelt_4)
                 if waited or obliterate_on_cd:
                     if retry_attempt > 0:
                         log_and_print('info', f"Obliterate fired on retry attempt {retry_attempt+1}")
@@ -935,7 +950,7 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
             log_and_print('info', "STEP 6 SKIP: Obliterate not ready")
         
         # STEP 7: Demolish (if available) - with retry if it doesn't fire
-        demolish_ready = check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+        demolish_ready = check_skill_available(COORDS.toolbelt_2)
         if demolish_ready:
             log_and_print('info', ">>> STEP 7/12: Using Offensive Protocol: Demolish (F2) - pre-Evolve")
             time.sleep(0.3)  # Increased delay to ensure previous skill finished
@@ -945,9 +960,9 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
             for retry_attempt in range(2):  # Try up to 2 times
                 button_mash('2', presses=6, delay=0.05)  # Increased to 6 presses
                 time.sleep(0.4)  # Increased wait for skill to register
-                waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_2'], timeout_seconds=2.0)
+                waited = wait_until_on_cooldown(COORDS.toolbelt_2, timeout_seconds=2.0)
                 time.sleep(0.3)  # Increased wait after cooldown check
-                demolish_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+                demolish_on_cd = not check_skill_available(COORDS.toolbelt_2)
                 if waited or demolish_on_cd:
                     if retry_attempt > 0:
                         log_and_print('info', f"Demolish fired on retry attempt {retry_attempt+1}")
@@ -980,7 +995,7 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
         # STEP 9: Obliterate (post-Evolve) - check multiple times to catch reset
         obliterate_fired = False
         for attempt in range(10):  # Try up to 10 times (morphs can take 1-2s to reset)
-            obliterate_ready = check_skill_available(DEFAULT_COORDS['toolbelt_4'])
+            obliterate_ready = check_skill_available(COORDS.toolbelt_4)
             log_and_print('info', f"Post-Evolve Obliterate check (attempt {attempt+1}/10): {obliterate_ready}")
             if obliterate_ready:
                 log_and_print('info', f">>> STEP 9/12: Using Offensive Protocol: Obliterate (F4) - post-Evolve")
@@ -998,7 +1013,7 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
         # STEP 10: Demolish (post-Evolve) - check multiple times
         demolish_fired = False
         for attempt in range(5):  # More attempts since Obliterate might have fired
-            demolish_ready = check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+            demolish_ready = check_skill_available(COORDS.toolbelt_2)
             if demolish_ready:
                 log_and_print('info', f">>> STEP 10/12: Using Offensive Protocol: Demolish (F2) - post-Evolve (attempt {attempt+1})")
                 button_mash('2', presses=4, delay=0.05)  # Increased from 3 to 4 presses
@@ -1014,24 +1029,24 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
     
     # STEP 11-12: Filler burst (if available)
     if filler_ready:
-        if not is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+        if not KITS.is_active('flamethrower'):
             ensure_flamethrower_mode(stop_event)
-            time.sleep(0.2)
+            time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
         
-        flame_blast_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+        flame_blast_ready = check_skill_available(COORDS.weapon_2)
         if flame_blast_ready:
             log_and_print('info', ">>> STEP 11/12: Using Flame Blast (Flamethrower Skill 2)")
-            button_mash(key_mapping['numpad2'], presses=2, delay=0.05)
+            button_mash(KEYS.numpad2, presses=2, delay=0.05)
             time.sleep(0.25)
             if check_stop_condition(stop_event): return False
         
         # Blunderbuss is Rifle Skill 2 - switch to Rifle first
         ensure_rifle_mode(stop_event)
-        time.sleep(0.8)  # Increased wait for weapon swap animation and skill bar to fully update
+        time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
         # Retry checking Blunderbuss in case skill bar is still updating
         blunderbuss_ready = False
         for attempt in range(3):
-            blunderbuss_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+            blunderbuss_ready = check_skill_available(COORDS.weapon_2)
             if blunderbuss_ready:
                 break
             elif attempt < 2:
@@ -1043,11 +1058,11 @@ def execute_ideal_combined_burst(stop_event, napalm_ready, acid_bomb_ready, morp
             waited = False
             blunderbuss_on_cd = False
             for retry_attempt in range(2):  # Try up to 2 times
-                button_mash(key_mapping['numpad2'], presses=4, delay=0.05)  # Increased to 4 presses
+                button_mash(KEYS.numpad2, presses=4, delay=0.05)  # Increased to 4 presses
                 time.sleep(3.0)  # Increased wait for skill to register and animation to complete (3s for Blunderbuss)
-                waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_2'], timeout_seconds=3.5)
+                waited = wait_until_on_cooldown(COORDS.weapon_2, timeout_seconds=3.5)
                 time.sleep(0.3)  # Additional wait after cooldown check
-                blunderbuss_on_cd = not check_skill_available(DEFAULT_COORDS['weapon_2'])
+                blunderbuss_on_cd = not check_skill_available(COORDS.weapon_2)
                 if waited or blunderbuss_on_cd:
                     if retry_attempt > 0:
                         log_and_print('info', f"Blunderbuss fired on retry attempt {retry_attempt+1}")
@@ -1084,23 +1099,31 @@ def power_amalgam_rifle_rotation(stop_event):
     last_napalm_check = 0
     last_napalm_use = 0
     last_kit_switch = 0  # Debounce kit switches
+    KITS.reset()  # The first frame below re-reads the equipped kit
     
+    TICKER.start()
     while not stop_event.is_set():
         rotation_count += 1
         
         if check_stop_condition(stop_event): break
         
-        # Check current mode
-        in_flamethrower = is_kit_equipped(DEFAULT_COORDS['utility_flamethrower'])
-        in_elixir = is_kit_equipped(DEFAULT_COORDS['utility_elixir'])
+        # Read every skill state from one frame
+        frame = get_frame_capture_service().get_frame()
+        ready = SKILL_BOARD.evaluate_dict(frame)
+        
+        # Check current mode (kit icons come from the same frame)
+        KITS.observe({'flamethrower': ready['in_flamethrower'], 'elixir_gun': ready['in_elixir']},
+                     frame.timestamp if frame is not None else None)
+        in_flamethrower = KITS.is_active('flamethrower')
+        in_elixir = KITS.is_active('elixir_gun')
         current_mode_str = 'Flamethrower' if in_flamethrower else ('Elixir Gun' if in_elixir else 'Rifle')
         
         # Check all skill cooldowns
         current_time = time.time()
-        evolve_ready = check_skill_available(DEFAULT_COORDS['toolbelt_5'])
-        obliterate_ready = check_skill_available(DEFAULT_COORDS['toolbelt_4'])
-        thorns_ready = check_skill_available(DEFAULT_COORDS['toolbelt_3'])
-        demolish_ready = check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+        evolve_ready = ready['evolve']
+        obliterate_ready = ready['obliterate']
+        thorns_ready = ready['thorns']
+        demolish_ready = ready['demolish']
         
         # CRITICAL: Only check Rifle skill readiness when in Rifle mode!
         # When in kit mode, weapon_2/weapon_5 show kit skills, not Rifle skills
@@ -1109,13 +1132,10 @@ def power_amalgam_rifle_rotation(stop_event):
         rifle_2_ready = False  # Blunderbuss (Rifle 2)
         if not in_flamethrower and not in_elixir:
             # We're in Rifle mode - can safely check Rifle skills
-            # Use same threshold as Priority 6 (not black = ready, sum > 100)
-            jump_shot_color = pixel_get_color(DEFAULT_COORDS['weapon_5'][0], DEFAULT_COORDS['weapon_5'][1])
-            blunderbuss_color = pixel_get_color(DEFAULT_COORDS['weapon_2'][0], DEFAULT_COORDS['weapon_2'][1])
-            rifle_5_ready = jump_shot_color is not None and jump_shot_color != (0, 0, 0) and sum(jump_shot_color) > 100
-            rifle_2_ready = blunderbuss_color is not None and blunderbuss_color != (0, 0, 0) and sum(blunderbuss_color) > 100
+            rifle_5_ready = ready['weapon_5_dim']
+            rifle_2_ready = ready['weapon_2_dim']
         
-        elixir_ready = check_skill_available(DEFAULT_COORDS['utility_elixir'])
+        elixir_ready = ready['elixir']
         # Flamethrower kit is always available to switch unless we're already in it or just switched
         # We can't use check_skill_available for kits - instead check if we can switch
         flamethrower_ready = not in_flamethrower  # Kit is "ready" if we can switch to it
@@ -1123,12 +1143,12 @@ def power_amalgam_rifle_rotation(stop_event):
         # Check Flamethrower skills
         flamethrower_napalm_ready = False
         if in_flamethrower:
-            flamethrower_napalm_ready = check_skill_available_multipoint(DEFAULT_COORDS['weapon_5'], invert_logic=True)[0]  # Napalm uses inverted logic
+            flamethrower_napalm_ready = ready['napalm']
         
         # Check Elixir Gun skills
         elixir_acid_bomb_ready = False
         if in_elixir:
-            elixir_acid_bomb_ready = check_skill_available(DEFAULT_COORDS['weapon_4'])
+            elixir_acid_bomb_ready = ready['weapon_4']
         
         time_since_elixir = current_time - last_elixir_use
         
@@ -1163,17 +1183,17 @@ def power_amalgam_rifle_rotation(stop_event):
         morph_burst_ready = evolve_ready and has_morphs_available and time_since_evolve >= 15.0
         
         # Check Plasmatic State availability (for Priority 3.5)
-        plasmatic_ready = check_skill_available(DEFAULT_COORDS['utility_3'])
+        plasmatic_ready = ready['plasmatic']
         
         # Check if Flamethrower/Rifle skills are ready for filler burst
         # Filler burst: Flame Blast (Flamethrower 2) + Blunderbuss (Rifle 2)
         flamethrower_flame_blast_ready = False
         rifle_blunderbuss_ready = False
         if in_flamethrower:
-            flamethrower_flame_blast_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+            flamethrower_flame_blast_ready = ready['weapon_2']
         # Blunderbuss is a Rifle skill - only check if in Rifle mode
         if not in_flamethrower and not in_elixir:
-            rifle_blunderbuss_ready = check_skill_available(DEFAULT_COORDS['weapon_2'])
+            rifle_blunderbuss_ready = ready['weapon_2']
         
         # Filler burst is ready if either Flame Blast (in Flamethrower) or Blunderbuss (in Rifle) is available
         filler_burst_ready = flamethrower_flame_blast_ready or rifle_blunderbuss_ready
@@ -1205,8 +1225,8 @@ def power_amalgam_rifle_rotation(stop_event):
         # This prevents Priority 1 from interrupting Rifle skill usage
         if not in_flamethrower and not in_elixir and (rifle_5_ready or rifle_2_ready):
             # Re-check skills to get current state (not black = ready)
-            jump_shot_color = pixel_get_color(DEFAULT_COORDS['weapon_5'][0], DEFAULT_COORDS['weapon_5'][1])
-            blunderbuss_color = pixel_get_color(DEFAULT_COORDS['weapon_2'][0], DEFAULT_COORDS['weapon_2'][1])
+            jump_shot_color = pixel_get_color(COORDS.weapon_5[0], COORDS.weapon_5[1])
+            blunderbuss_color = pixel_get_color(COORDS.weapon_2[0], COORDS.weapon_2[1])
             
             # Jump Shot may be darker when ready - use lower threshold (30 instead of 100)
             # Blunderbuss is brighter when ready - keep higher threshold (100)
@@ -1223,11 +1243,11 @@ def power_amalgam_rifle_rotation(stop_event):
                 waited = False
                 jump_shot_on_cd = False
                 for retry_attempt in range(2):  # Try up to 2 times
-                    button_mash(key_mapping['numpad5'], presses=4, delay=0.05)  # Jump Shot is Rifle 5 = NumPad5
+                    button_mash(KEYS.numpad5, presses=4, delay=0.05)  # Jump Shot is Rifle 5 = NumPad5
                     time.sleep(1.0)  # Wait for skill to register and animation to complete (1s for Jump Shot)
-                    waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_5'], timeout_seconds=2.5)
+                    waited = wait_until_on_cooldown(COORDS.weapon_5, timeout_seconds=2.5)
                     time.sleep(0.5)  # Additional wait after cooldown check
-                    js_color_check = pixel_get_color(DEFAULT_COORDS['weapon_5'][0], DEFAULT_COORDS['weapon_5'][1])
+                    js_color_check = pixel_get_color(COORDS.weapon_5[0], COORDS.weapon_5[1])
                     jump_shot_on_cd = not (js_color_check is not None and js_color_check != (0, 0, 0) and sum(js_color_check) > 30)
                     if waited or jump_shot_on_cd:
                         if retry_attempt > 0:
@@ -1255,11 +1275,11 @@ def power_amalgam_rifle_rotation(stop_event):
                 blunderbuss_on_cd = False
                 # Retry logic if skill doesn't fire
                 for retry_attempt in range(2):  # Try up to 2 times
-                    button_mash(key_mapping['numpad2'], presses=4, delay=0.05)  # Blunderbuss is Rifle 2 = NumPad2
+                    button_mash(KEYS.numpad2, presses=4, delay=0.05)  # Blunderbuss is Rifle 2 = NumPad2
                     time.sleep(3.0)  # Increased wait for skill to register and animation to complete (3s for Blunderbuss)
-                    waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_2'], timeout_seconds=3.5)
+                    waited = wait_until_on_cooldown(COORDS.weapon_2, timeout_seconds=3.5)
                     time.sleep(0.5)  # Additional wait after cooldown check
-                    bb_color_check = pixel_get_color(DEFAULT_COORDS['weapon_2'][0], DEFAULT_COORDS['weapon_2'][1])
+                    bb_color_check = pixel_get_color(COORDS.weapon_2[0], COORDS.weapon_2[1])
                     blunderbuss_on_cd = not (bb_color_check is not None and bb_color_check != (0, 0, 0) and sum(bb_color_check) > 100)
                     if waited or blunderbuss_on_cd:
                         if retry_attempt > 0:
@@ -1286,9 +1306,9 @@ def power_amalgam_rifle_rotation(stop_event):
             # Retry logic to ensure it fires
             plasmatic_on_cd = False
             for retry_attempt in range(3):  # Try up to 3 times
-                button_mash(key_mapping['numpad9'], presses=6, delay=0.05)  # Increased to 6 presses
+                button_mash(KEYS.numpad9, presses=6, delay=0.05)  # Increased to 6 presses
                 time.sleep(0.5)  # Increased wait for skill to register
-                plasmatic_on_cd = not check_skill_available(DEFAULT_COORDS['utility_3'])
+                plasmatic_on_cd = not check_skill_available(COORDS.utility_3)
                 if plasmatic_on_cd:
                     if retry_attempt > 0:
                         log_and_print('info', f"Plasmatic State fired on retry attempt {retry_attempt+1}")
@@ -1316,15 +1336,15 @@ def power_amalgam_rifle_rotation(stop_event):
         
         if not should_save_morphs and (obliterate_ready or demolish_ready or thorns_ready):
             # Ensure we're in Rifle mode to use toolbelt skills (protocols)
-            if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']) or is_kit_equipped(DEFAULT_COORDS['utility_elixir']):
+            if KITS.is_active('flamethrower') or KITS.is_active('elixir_gun'):
                 log_and_print('info', ">>> PRIORITY 0.8: Ensuring Rifle mode for protocols")
                 ensure_rifle_mode(stop_event)
-                time.sleep(0.6)  # Increased wait for weapon swap animation and skill bar to fully update
+                time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
             
             # Re-check morph availability after switching (might have changed)
-            obliterate_ready = check_skill_available(DEFAULT_COORDS['toolbelt_4'])
-            demolish_ready = check_skill_available(DEFAULT_COORDS['toolbelt_2'])
-            thorns_ready = check_skill_available(DEFAULT_COORDS['toolbelt_3'])
+            obliterate_ready = check_skill_available(COORDS.toolbelt_4)
+            demolish_ready = check_skill_available(COORDS.toolbelt_2)
+            thorns_ready = check_skill_available(COORDS.toolbelt_3)
             
             morphs_fired = False
             
@@ -1338,9 +1358,9 @@ def power_amalgam_rifle_rotation(stop_event):
                 for retry_attempt in range(3):  # Try up to 3 times
                     button_mash('4', presses=7, delay=0.05)  # Increased to 7 presses
                     time.sleep(0.5)  # Increased wait for skill to register and animation to start
-                    waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_4'], timeout_seconds=2.5)
+                    waited = wait_until_on_cooldown(COORDS.toolbelt_4, timeout_seconds=2.5)
                     time.sleep(0.4)  # Increased wait after cooldown check
-                    obliterate_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_4'])
+                    obliterate_on_cd = not check_skill_available(COORDS.toolbelt_4)
                     if waited or obliterate_on_cd:
                         if retry_attempt > 0:
                             log_and_print('info', f"Obliterate fired on retry attempt {retry_attempt+1}")
@@ -1360,13 +1380,13 @@ def power_amalgam_rifle_rotation(stop_event):
                 log_and_print('info', ">>> PRIORITY 0.8: Using Offensive Protocol: Demolish (F2)")
                 button_mash('2', presses=5, delay=0.05)  # Increased to 5 presses
                 time.sleep(0.1)  # Reduced delay
-                waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_2'], timeout_seconds=1.8)
+                waited = wait_until_on_cooldown(COORDS.toolbelt_2, timeout_seconds=1.8)
                 time.sleep(0.15)  # Reduced wait
                 # Check multiple times to confirm cooldown
-                demolish_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+                demolish_on_cd = not check_skill_available(COORDS.toolbelt_2)
                 if not demolish_on_cd and waited:
                     time.sleep(0.1)
-                    demolish_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_2'])
+                    demolish_on_cd = not check_skill_available(COORDS.toolbelt_2)
                 elif not waited:
                     log_and_print('info', "WARNING: Demolish may not have fired (timeout)")
                 log_and_print('info', f"Priority 0.8 Demolish on cooldown: {demolish_on_cd}")
@@ -1383,9 +1403,9 @@ def power_amalgam_rifle_rotation(stop_event):
                 for retry_attempt in range(2):  # Try up to 2 times
                     button_mash('3', presses=6, delay=0.05)  # Increased to 6 presses
                     time.sleep(0.4)  # Increased wait for skill to register
-                    waited = wait_until_on_cooldown(DEFAULT_COORDS['toolbelt_3'], timeout_seconds=2.0)
+                    waited = wait_until_on_cooldown(COORDS.toolbelt_3, timeout_seconds=2.0)
                     time.sleep(0.3)  # Increased wait after cooldown check
-                    thorns_on_cd = not check_skill_available(DEFAULT_COORDS['toolbelt_3'])
+                    thorns_on_cd = not check_skill_available(COORDS.toolbelt_3)
                     if waited or thorns_on_cd:
                         if retry_attempt > 0:
                             log_and_print('info', f"Thorns fired on retry attempt {retry_attempt+1}")
@@ -1417,9 +1437,9 @@ def power_amalgam_rifle_rotation(stop_event):
                         last_kit_switch = time.time()  # Use actual time, not current_time
                         priority_1_switched = True
                         ensure_flamethrower_mode(stop_event)
-                        time.sleep(0.8)  # Give more time for kit to equip and skill bar to update
+                        time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
                         if check_stop_condition(stop_event): break
-                        in_flamethrower = is_kit_equipped(DEFAULT_COORDS['utility_flamethrower'])
+                        in_flamethrower = KITS.is_active('flamethrower')
                     else:
                         log_and_print('info', f"Priority 1 SKIP: Only {time_since_kit_switch:.1f}s since last kit switch (debounce)")
                 
@@ -1432,7 +1452,7 @@ def power_amalgam_rifle_rotation(stop_event):
                     # Napalm uses INVERTED logic: NOT black = ready, black = on cooldown
                     flamethrower_napalm_ready = False
                     for attempt in range(5):  # More attempts to catch skill bar updates
-                        flamethrower_napalm_ready, color, checked_coords = check_skill_available_multipoint(DEFAULT_COORDS['weapon_5'], invert_logic=True)
+                        flamethrower_napalm_ready, color, checked_coords = check_skill_available_multipoint(COORDS.weapon_5, invert_logic=True)
                         log_and_print('info', f"Priority 1 Napalm check (attempt {attempt+1}/5): {flamethrower_napalm_ready}, color at {checked_coords}: {color}, sum: {sum(color) if color else 0}")
                         if flamethrower_napalm_ready:
                             break
@@ -1455,7 +1475,7 @@ def power_amalgam_rifle_rotation(stop_event):
             jump_shot_actually_ready = False
             if not in_flamethrower and not in_elixir:
                 # Already in Rifle mode - can check directly using lower threshold
-                jump_shot_color_check = pixel_get_color(DEFAULT_COORDS['weapon_5'][0], DEFAULT_COORDS['weapon_5'][1])
+                jump_shot_color_check = pixel_get_color(COORDS.weapon_5[0], COORDS.weapon_5[1])
                 jump_shot_actually_ready = jump_shot_color_check is not None and jump_shot_color_check != (0, 0, 0) and sum(jump_shot_color_check) > 30
             # Don't optimistically assume Jump Shot is ready if we're not in Rifle mode
             # If not in Rifle mode, Priority 2b will handle standalone Acid Bomb instead
@@ -1483,13 +1503,15 @@ def power_amalgam_rifle_rotation(stop_event):
                 # Try to use Acid Bomb standalone (without Jump Shot)
                 if in_elixir:
                     # Already in Elixir Gun - simple check and use
-                    acid_bomb_standalone_ready = check_skill_available(DEFAULT_COORDS['weapon_4'])
+                    acid_bomb_standalone_ready = check_skill_available(COORDS.weapon_4)
                     if acid_bomb_standalone_ready:
                         log_and_print('info', ">>> PRIORITY 2b: Acid Bomb available (already in Elixir Gun), using standalone")
-                        button_mash(key_mapping['numpad4'], presses=2, delay=0.05)
+                        button_mash(KEYS.numpad4, presses=2, delay=0.05)
                         time.sleep(0.6)  # Wait for Acid Bomb to start casting
-                        button_mash(key_mapping['f1'], presses=2, delay=0.05)
+                        button_mash(KEYS.f1, presses=2, delay=0.05)
                         time.sleep(0.5)  # Wait after cancel
+                        # Weapon swap is not a kit toggle, so re-read the kit icons
+                        KITS.sync()
                         last_acid_bomb_use = current_time
                         if check_stop_condition(stop_event): break
                         continue
@@ -1497,14 +1519,16 @@ def power_amalgam_rifle_rotation(stop_event):
                     # Not in Elixir - switch and use
                     log_and_print('info', ">>> PRIORITY 2b: Acid Bomb available, using standalone")
                     ensure_elixir_gun_mode(stop_event)
-                    time.sleep(0.8)  # Wait for Elixir Gun kit to equip
-                    acid_bomb_standalone_ready = check_skill_available(DEFAULT_COORDS['weapon_4'])
+                    time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
+                    acid_bomb_standalone_ready = check_skill_available(COORDS.weapon_4)
                     if acid_bomb_standalone_ready:
                         log_and_print('info', "Using Acid Bomb (standalone)")
-                        button_mash(key_mapping['numpad4'], presses=2, delay=0.05)
+                        button_mash(KEYS.numpad4, presses=2, delay=0.05)
                         time.sleep(0.6)  # Wait for Acid Bomb to start casting
-                        button_mash(key_mapping['f1'], presses=2, delay=0.05)
+                        button_mash(KEYS.f1, presses=2, delay=0.05)
                         time.sleep(0.5)  # Wait after cancel
+                        # Weapon swap is not a kit toggle, so re-read the kit icons
+                        KITS.sync()
                         last_acid_bomb_use = current_time
                         if check_stop_condition(stop_event): break
                         continue
@@ -1524,14 +1548,14 @@ def power_amalgam_rifle_rotation(stop_event):
         # Use same threshold as Priority 0.5/6 (100) for consistency
         if time_since_jump_shot >= 8.0:
             log_and_print('info', ">>> PRIORITY 2.5: Using Jump Shot (standalone, Acid Bomb on CD)")
-            if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']) or is_kit_equipped(DEFAULT_COORDS['utility_elixir']):
+            if KITS.is_active('flamethrower') or KITS.is_active('elixir_gun'):
                 ensure_rifle_mode(stop_event)
-                time.sleep(0.8)  # Increased wait for weapon swap animation and skill bar to fully update
+                time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
             # Re-check after switching - retry in case skill bar is still updating
             # Use same threshold as Priority 0.5/6 (not black, sum > 100)
             jump_shot_ready = False
             for attempt in range(3):
-                jump_shot_color_check = pixel_get_color(DEFAULT_COORDS['weapon_5'][0], DEFAULT_COORDS['weapon_5'][1])
+                jump_shot_color_check = pixel_get_color(COORDS.weapon_5[0], COORDS.weapon_5[1])
                 jump_shot_ready = jump_shot_color_check is not None and jump_shot_color_check != (0, 0, 0) and sum(jump_shot_color_check) > 30
                 if jump_shot_ready:
                     break
@@ -1543,11 +1567,11 @@ def power_amalgam_rifle_rotation(stop_event):
                 waited = False
                 jump_shot_on_cd = False
                 for retry_attempt in range(2):  # Try up to 2 times
-                    button_mash(key_mapping['numpad5'], presses=4, delay=0.05)  # Jump Shot is Rifle 5 = NumPad5
+                    button_mash(KEYS.numpad5, presses=4, delay=0.05)  # Jump Shot is Rifle 5 = NumPad5
                     time.sleep(1.0)  # Wait for skill to register and animation to complete (1s for Jump Shot)
-                    waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_5'], timeout_seconds=2.5)
+                    waited = wait_until_on_cooldown(COORDS.weapon_5, timeout_seconds=2.5)
                     time.sleep(0.3)  # Additional wait after cooldown check
-                    js_color_check_25 = pixel_get_color(DEFAULT_COORDS['weapon_5'][0], DEFAULT_COORDS['weapon_5'][1])
+                    js_color_check_25 = pixel_get_color(COORDS.weapon_5[0], COORDS.weapon_5[1])
                     jump_shot_on_cd = not (js_color_check_25 is not None and js_color_check_25 != (0, 0, 0) and sum(js_color_check_25) > 30)
                     if waited or jump_shot_on_cd:
                         if retry_attempt > 0:
@@ -1577,7 +1601,7 @@ def power_amalgam_rifle_rotation(stop_event):
             if not flamethrower_flame_blast_ready and not flamethrower_napalm_ready:
                 log_and_print('info', "No more Flamethrower skills ready, switching back to Rifle")
                 ensure_rifle_mode(stop_event)
-                time.sleep(0.3)
+                time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
             continue
         
         # PRIORITY 5b: If stuck in Flamethrower with no skills, switch back to Rifle
@@ -1589,7 +1613,7 @@ def power_amalgam_rifle_rotation(stop_event):
                 log_and_print('info', ">>> PRIORITY 5b: No Flamethrower skills ready, switching back to Rifle")
                 last_kit_switch = actual_time
                 ensure_rifle_mode(stop_event)
-                time.sleep(0.3)
+                time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
                 if check_stop_condition(stop_event): break
                 continue
             else:
@@ -1600,8 +1624,8 @@ def power_amalgam_rifle_rotation(stop_event):
         if not in_flamethrower and not in_elixir:
             # We're in Rifle mode - re-check skills to get current state (not black = ready)
             # Re-check to ensure we have the most current state
-            jump_shot_color = pixel_get_color(DEFAULT_COORDS['weapon_5'][0], DEFAULT_COORDS['weapon_5'][1])
-            blunderbuss_color = pixel_get_color(DEFAULT_COORDS['weapon_2'][0], DEFAULT_COORDS['weapon_2'][1])
+            jump_shot_color = pixel_get_color(COORDS.weapon_5[0], COORDS.weapon_5[1])
+            blunderbuss_color = pixel_get_color(COORDS.weapon_2[0], COORDS.weapon_2[1])
             
             # Jump Shot may be darker when ready - use lower threshold (30 instead of 100)
             # Blunderbuss is brighter when ready - keep higher threshold (100)
@@ -1618,11 +1642,11 @@ def power_amalgam_rifle_rotation(stop_event):
                 waited = False
                 jump_shot_on_cd = False
                 for retry_attempt in range(2):  # Try up to 2 times
-                    button_mash(key_mapping['numpad5'], presses=4, delay=0.05)  # Jump Shot is Rifle 5 = NumPad5
+                    button_mash(KEYS.numpad5, presses=4, delay=0.05)  # Jump Shot is Rifle 5 = NumPad5
                     time.sleep(1.0)  # Wait for skill to register and animation to complete (1s for Jump Shot)
-                    waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_5'], timeout_seconds=2.5)
+                    waited = wait_until_on_cooldown(COORDS.weapon_5, timeout_seconds=2.5)
                     time.sleep(0.5)  # Additional wait after cooldown check
-                    jump_shot_on_cd = not check_skill_available(DEFAULT_COORDS['weapon_5'])
+                    jump_shot_on_cd = not check_skill_available(COORDS.weapon_5)
                     if waited or jump_shot_on_cd:
                         if retry_attempt > 0:
                             log_and_print('info', f"Jump Shot fired on retry attempt {retry_attempt+1}")
@@ -1649,11 +1673,11 @@ def power_amalgam_rifle_rotation(stop_event):
                 blunderbuss_on_cd = False
                 # Retry logic if skill doesn't fire
                 for retry_attempt in range(2):  # Try up to 2 times
-                    button_mash(key_mapping['numpad2'], presses=4, delay=0.05)  # Blunderbuss is Rifle 2 = NumPad2
+                    button_mash(KEYS.numpad2, presses=4, delay=0.05)  # Blunderbuss is Rifle 2 = NumPad2
                     time.sleep(3.0)  # Increased wait for skill to register and animation to complete (3s for Blunderbuss)
-                    waited = wait_until_on_cooldown(DEFAULT_COORDS['weapon_2'], timeout_seconds=3.5)
+                    waited = wait_until_on_cooldown(COORDS.weapon_2, timeout_seconds=3.5)
                     time.sleep(0.5)  # Additional wait after cooldown check
-                    blunderbuss_on_cd = not check_skill_available(DEFAULT_COORDS['weapon_2'])
+                    blunderbuss_on_cd = not check_skill_available(COORDS.weapon_2)
                     if waited or blunderbuss_on_cd:
                         if retry_attempt > 0:
                             log_and_print('info', f"Blunderbuss fired on retry attempt {retry_attempt+1}")
@@ -1675,18 +1699,20 @@ def power_amalgam_rifle_rotation(stop_event):
         # PRIORITY 7: Sustained damage - Auto-attack
         if in_flamethrower:
             log_and_print('info', ">>> PRIORITY 7: Flamethrower auto-attack (Flame Jet)")
-            button_mash(key_mapping['numpad1'], presses=2, delay=0.05)
+            button_mash(KEYS.numpad1, presses=2, delay=0.05)
             time.sleep(0.6)
         elif in_elixir:
             log_and_print('info', ">>> PRIORITY 7: Canceling out of Elixir Gun")
             ensure_rifle_mode(stop_event)
-            time.sleep(0.5)
+            time.sleep(SKILL_BAR_SETTLE_SECONDS)  # Kit icon already confirmed the swap
         else:
             log_and_print('info', ">>> PRIORITY 7: Rifle auto-attack (Aimed Shot)")
-            button_mash(key_mapping['numpad1'], presses=2, delay=0.05)
+            button_mash(KEYS.numpad1, presses=2, delay=0.05)
             time.sleep(0.6)
         
-        time.sleep(0.1)
+        if not TICKER.wait_next(stop_event, hold_key=KEYS.numpad1):
+            break
+    TICKER.stop()
 
 def run(stop_event):
     """Main entry point for Power Amalgam Rifle (WvW) spec"""
@@ -1696,14 +1722,21 @@ def run(stop_event):
     log_and_print('info', "Burst priority (per Metabattle): Napalm > Acid Bomb > Morph skills > Filler")
     log_and_print('info', "Toolbelt skills on keys 1-5, weapon/kit skills on numpad")
     
+    # Only capture the skill bar instead of the whole desktop
+    plan_capture(points=COORDS.all_points + SKILL_BOARD.points)
+    
     while not stop_event.is_set():
         if stop_event.is_set():
             logger.info("Stop event detected")
             break
         
-        if keyboard.is_pressed(key_mapping['numpad1']):
+        if keyboard.is_pressed(KEYS.numpad1):
             log_and_print('info', "NumPad1 pressed - starting rotation")
-            power_amalgam_rifle_rotation(stop_event)
+            try:
+                power_amalgam_rifle_rotation(stop_event)
+            finally:
+                # An exception in a pass must not leave the ticker running
+                TICKER.stop()
         
         time.sleep(0.05)
     
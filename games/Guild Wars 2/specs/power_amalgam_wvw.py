@@ -41,9 +41,16 @@ Utilities: numpad6-0
 import time
 import keyboard
 from libs.pixel_get_color import get_color as pixel_get_color
+from libs.pixel_watch import wait_until, below
 from libs.keyboard_actions_monitored import press_and_release, button_mash
 from libs.key_mapping import key_mapping
+from libs.key_state import is_pressed as is_key_pressed
 from libs.logger import get_logger
+from libs.capture_planner import plan_capture
+from libs.cooldowns import CooldownTracker
+from libs.kit_modes import KitStateMachine
+from libs.input_scheduler import get_input_scheduler
+from libs.tick_scheduler import TickScheduler
 import sys
 
 logger = get_logger('power_amalgam_wvw')
@@ -80,46 +87,53 @@ DEFAULT_COORDS = {
     'utility_elite': (3178, 1013),   # NumPad0 - Elite
 }
 
-# Debounce for kit toggles to avoid racing inputs
-DEBOUNCE_WINDOW_SECONDS = 0.6
-last_kit_toggle_time = 0.0
-kit_switch_in_progress = False
-current_mode = 'hammer'  # 'hammer', 'elixir', or 'flamethrower'
+# Remembers each skill's cooldown so checks skip pixel reads until it may be ready
+COOLDOWNS = CooldownTracker()
 
-def just_toggled_recently() -> bool:
-    """Return True if a kit toggle happened within the debounce window."""
-    return (time.time() - last_kit_toggle_time) < DEBOUNCE_WINDOW_SECONDS
+# Tracks the equipped kit from sent toggles; each toggle is confirmed from one icon
+KITS = KitStateMachine(base='hammer', send=press_and_release)
+KITS.add_kit('flamethrower', DEFAULT_COORDS['utility_flamethrower'], key_mapping['numpad8'])
+KITS.add_kit('elixir_gun', DEFAULT_COORDS['utility_elixir'], key_mapping['numpad7'])
+
+# Rotation passes start 0.1s apart; a pass that casts simply overruns.
+# Passes re-read skills right after casting, so keep the short freshness window
+TICKER = TickScheduler(rate=10, name='wvw', adapt_freshness=False)
 
 def check_stop_condition(stop_event):
     """Check if we should stop the rotation"""
-    return not keyboard.is_pressed(key_mapping['numpad1']) or stop_event.is_set()
+    return not is_key_pressed(key_mapping['numpad1']) or stop_event.is_set()
 
-def check_skill_available(coords):
-    """Check if a skill is available (not on cooldown)"""
+def read_skill_available(coords):
+    """Read a skill's icon pixel: bright means available"""
     color = pixel_get_color(coords[0], coords[1])
     return color is not None and color != (0, 0, 0) and sum(color) > 300
 
+def cooldown_key(coords):
+    """Tracker key for a skill slot: each kit puts a different skill in it"""
+    return (KITS.mode, coords)
+
+def check_skill_available(coords):
+    """Check if a skill is available (not on cooldown)
+    Answered from the cooldown tracker; the pixel is only read when a check is due."""
+    if KITS.pending:
+        # Mid-swap the slot may show either kit's skill
+        return read_skill_available(coords)
+    return COOLDOWNS.is_ready(cooldown_key(coords), lambda: read_skill_available(coords))
+
 def wait_until_on_cooldown(coords, timeout_seconds: float = 1.8, poll_seconds: float = 0.05) -> bool:
     """Wait until the given skill pixel turns dark (goes on cooldown).
     Returns True if it turned dark within timeout, False otherwise.
+    The pixel watcher checks every new frame, so poll_seconds is no longer used.
     """
-    start = time.time()
-    while (time.time() - start) < timeout_seconds:
-        color = pixel_get_color(coords[0], coords[1])
-        if color is None:
-            return True
-        if color == (0, 0, 0) or sum(color) <= 300:
-            return True
-        time.sleep(poll_seconds)
-    return False
-
-def is_kit_equipped(kit_coords):
-    """Check if a kit is equipped by looking for white color"""
-    color = pixel_get_color(kit_coords[0], kit_coords[1])
-    if color is None:
-        return False
-    # Check if color is white or close to white (all RGB values high)
-    return color[0] > 200 and color[1] > 200 and color[2] > 200
+    # The tracker learns the cooldown from this cast; stamp it with the
+    # time this thread's queued key was actually sent
+    start = get_input_scheduler().wait_own(timeout=1.0)
+    COOLDOWNS.record_cast(cooldown_key(coords), start)
+    # Dark means black or R+G+B <= 300; an unreadable pixel counts as dark
+    fired = wait_until(coords[0], coords[1], below(301), timeout=timeout_seconds,
+                       unreadable=(0, 0, 0)) is not None
+    COOLDOWNS.observe(cooldown_key(coords), ready=not fired)
+    return fired
 
 def execute_evolve_spike(stop_event):
     """
@@ -215,110 +229,47 @@ def execute_evolve_spike(stop_event):
 def ensure_flamethrower_mode(stop_event):
     """
     Ensure we're in Flamethrower mode - switch if not equipped
-    Returns True if already in Flamethrower or successfully switched
+    Returns True if already in Flamethrower or the switch was confirmed
     """
-    global last_kit_toggle_time, kit_switch_in_progress, current_mode
-    
-    if kit_switch_in_progress or just_toggled_recently():
-        return True  # Wait for current switch to complete
-    
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
-        current_mode = 'flamethrower'
+    if KITS.is_active('flamethrower') and not KITS.pending:
         return True
-    
-    # Not in Flamethrower - switch to it
     logger.info("Switching to Flamethrower Kit (NumPad8)")
-    kit_switch_in_progress = True
-    press_and_release(key_mapping['numpad8'])
-    last_kit_toggle_time = time.time()
-    time.sleep(0.8)
-    kit_switch_in_progress = False
-    
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
-        current_mode = 'flamethrower'
-        return True
-    
-    return False
+    return KITS.ensure('flamethrower', stop_event=stop_event)
 
 def is_elixir_gun_equipped():
-    """Check if Elixir Gun is equipped"""
-    return is_kit_equipped(DEFAULT_COORDS['utility_elixir'])
+    """Check if Elixir Gun is equipped (tracked state, no pixel read)"""
+    return KITS.is_active('elixir_gun')
 
 def ensure_hammer_mode(stop_event):
     """
     Ensure we're in Hammer mode - switch from kit if needed
-    Returns True if already in Hammer or successfully switched
+    Returns True if already in Hammer or the switch was confirmed
     """
-    global last_kit_toggle_time, kit_switch_in_progress, current_mode
-    
-    if kit_switch_in_progress or just_toggled_recently():
-        return True  # Wait for current switch to complete
-    
-    # Check if we're in any kit (Flamethrower or Elixir Gun)
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
-        # In Flamethrower - switch back to Hammer
-        logger.info("Switching to Hammer (NumPad8)")
-        kit_switch_in_progress = True
-        press_and_release(key_mapping['numpad8'])
-        last_kit_toggle_time = time.time()
-        time.sleep(0.8)
-        kit_switch_in_progress = False
-        current_mode = 'hammer'
-        return True
-    elif is_elixir_gun_equipped():
-        # In Elixir Gun - switch back to Hammer
-        logger.info("Switching to Hammer (NumPad7)")
-        kit_switch_in_progress = True
-        press_and_release(key_mapping['numpad7'])
-        last_kit_toggle_time = time.time()
-        time.sleep(0.8)
-        kit_switch_in_progress = False
-        current_mode = 'hammer'
-        return True
-    else:
-        # Already in Hammer
-        current_mode = 'hammer'
+    if KITS.is_active('hammer') and not KITS.pending:
         return True
+    logger.info(f"Switching to Hammer from {KITS.mode}")
+    return KITS.ensure('hammer', stop_event=stop_event)
 
 def ensure_elixir_gun_mode(stop_event):
     """
     Ensure we're in Elixir Gun mode - switch if not equipped
-    Returns True if already in Elixir Gun or successfully switched
+    Returns True if already in Elixir Gun or the switch was confirmed
     """
-    global last_kit_toggle_time, kit_switch_in_progress, current_mode
-    
-    if kit_switch_in_progress or just_toggled_recently():
+    if KITS.is_active('elixir_gun') and not KITS.pending:
         return True
-    
-    if is_elixir_gun_equipped():
-        current_mode = 'elixir'
-        return True
-    
-    # Not in Elixir Gun - switch to it
     logger.info("Switching to Elixir Gun Kit (NumPad7)")
-    kit_switch_in_progress = True
-    press_and_release(key_mapping['numpad7'])
-    last_kit_toggle_time = time.time()
-    time.sleep(0.8)
-    kit_switch_in_progress = False
-    
-    if is_elixir_gun_equipped():
-        current_mode = 'elixir'
-        return True
-    
-    return False
+    return KITS.ensure('elixir_gun', stop_event=stop_event)
 
 def cancel_out_of_kit(stop_event):
     """
     Cancel out of current kit using weapon swap (F1) - like healing_mechanist.py
     """
-    global current_mode
-    
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']) or is_elixir_gun_equipped():
+    if not KITS.is_active('hammer'):
         logger.info("Canceling out of kit with weapon swap (F1)")
         press_and_release(key_mapping['f1'])
         time.sleep(0.5)
-        current_mode = 'hammer'
+        # Weapon swap is not a kit toggle, so re-read the kit icons
+        KITS.sync()
         return True
     return False
 
@@ -361,7 +312,7 @@ def use_flamethrower_cleave(stop_event):
     Use Flamethrower for sustained cleave damage
     Assumes we're already in Flamethrower mode
     """
-    if not is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+    if not KITS.is_active('flamethrower'):
         logger.warning("Not in Flamethrower mode - skipping cleave")
         return False
     
@@ -405,7 +356,7 @@ def use_hammer_skills(stop_event):
     Use all available Hammer skills
     Assumes we're already in Hammer mode
     """
-    if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']) or is_elixir_gun_equipped():
+    if KITS.is_active('flamethrower') or is_elixir_gun_equipped():
         logger.warning("Not in Hammer mode - skipping Hammer skills")
         return False
     
@@ -470,14 +421,17 @@ def power_amalgam_wvw_rotation(stop_event):
     flamethrower_usage_count = 0  # Track how many times we've used Flamethrower
     last_evolve_use = 0  # Track when we last used Evolve to prevent double-triggering
     
+    TICKER.start()
     while not stop_event.is_set():
         rotation_count += 1
         
         if check_stop_condition(stop_event): break
         
         # Check current mode
-        in_flamethrower = is_kit_equipped(DEFAULT_COORDS['utility_flamethrower'])
-        in_elixir = is_elixir_gun_equipped()
+        # Both kit icons are read together from one frame
+        KITS.update()
+        in_flamethrower = KITS.is_active('flamethrower')
+        in_elixir = KITS.is_active('elixir_gun')
         current_mode_str = 'Flamethrower' if in_flamethrower else ('Elixir Gun' if in_elixir else 'Hammer')
         
         # Check all skill cooldowns
@@ -712,7 +666,7 @@ def power_amalgam_wvw_rotation(stop_event):
         if hammer_all_on_cd and not in_flamethrower and not in_elixir and time_since_elixir > 5.0:
             log_and_print('info', f">>> PRIORITY 8 TRIGGERED: Switching to Flamethrower (time since Elixir: {time_since_elixir:.1f}s)")
             ensure_flamethrower_mode(stop_event)
-            if is_kit_equipped(DEFAULT_COORDS['utility_flamethrower']):
+            if KITS.is_active('flamethrower'):
                 use_flamethrower_cleave(stop_event)
                 flamethrower_usage_count += 1
                 if check_stop_condition(stop_event): break
@@ -749,8 +703,10 @@ def power_amalgam_wvw_rotation(stop_event):
             button_mash(key_mapping['numpad1'], presses=2, delay=0.05)
             time.sleep(0.6)
         
-        # Small delay before next check
-        time.sleep(0.1)
+        # Wait for the next tick (deadline-based, so the pass time counts towards it)
+        if not TICKER.wait_next(stop_event, hold_key=key_mapping['numpad1']):
+            break
+    TICKER.stop()
 
 def run(stop_event):
     """
@@ -762,6 +718,9 @@ def run(stop_event):
     log_and_print('info', "Focus: Strong spikes with Evolve + morphs for generating downs")
     log_and_print('info', "Toolbelt skills on keys 1-5, weapon/kit skills on numpad")
     
+    # Only capture the skill bar instead of the whole desktop
+    plan_capture(points=DEFAULT_COORDS.values())
+    
     while not stop_event.is_set():
         # Check stop event first
         if stop_event.is_set():
@@ -771,7 +730,11 @@ def run(stop_event):
         # Activate rotation when numpad1 is pressed
         if keyboard.is_pressed(key_mapping['numpad1']):
             log_and_print('info', "NumPad1 pressed - starting rotation")
-            power_amalgam_wvw_rotation(stop_event)
+            try:
+                power_amalgam_wvw_rotation(stop_event)
+            finally:
+                # An exception in a pass must not leave the ticker running
+                TICKER.stop()
         
         # Always sleep to prevent busy-waiting
         time.sleep(0.05)
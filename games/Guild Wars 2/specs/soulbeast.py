@@ -4,10 +4,11 @@ from libs.pixel_search import pixel_search
 from libs.pixel_get_color import get_color as pixel_get_color
 from libs.keyboard_actions import press, release, press_and_release, button_mash
 from libs.key_mapping import key_mapping
+from libs.key_state import is_pressed as is_key_pressed
 
 def check_stop_condition(stop_event):
     """Check if we should stop the rotation"""
-    return not keyboard.is_pressed(key_mapping['numpad1']) or stop_event.is_set()
+    return not is_key_pressed(key_mapping['numpad1']) or stop_event.is_set()
 
 def execute_opener(stop_event):
     """Execute the optimal opener sequence"""
@@ -1,4 +1,4 @@
-from libs.keyboard_actions import press_and_release
+from libs.keyboard_actions import press_and_release, press, release
 from libs.key_mapping import key_mapping
 import time
 import keyboard
@@ -9,9 +9,9 @@ import pyautogui
 def direlord_pull(stop_event):
     try:
         while not stop_event.is_set() and keyboard.is_pressed(key_mapping['numpad1']):
-            keyboard.press('alt')
+            press('alt')
             press_and_release('1')
-            keyboard.release('alt')
+            release('alt')
             press_and_release('1')
             press_and_release('3')        
 
@@ -26,21 +26,21 @@ def direlord_pull(stop_event):
 def direlord_rotation(stop_event):
     try:
         while not stop_event.is_set() and keyboard.is_pressed(key_mapping['numpad4']):
-            keyboard.press('alt')
+            press('alt')
             press_and_release('2')
-            keyboard.release('alt')
+            release('alt')
 
-            keyboard.press('alt')
+            press('alt')
             press_and_release('3')
-            keyboard.release('alt')
+            release('alt')
 
-            keyboard.press('shift')
+            press('shift')
             press_and_release('1')
-            keyboard.release('shift')
+            release('shift')
 
-            keyboard.press('alt')
+            press('alt')
             press_and_release('4')
-            keyboard.release('alt')
+            release('alt')
 
             press_and_release('2')
 
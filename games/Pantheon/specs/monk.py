@@ -1,64 +1,32 @@
-from libs.keyboard_actions import press_and_release
+from libs.keyboard_actions import press_and_release, press_with_modifier
 from libs.key_mapping import key_mapping
-import time
-import keyboard
+from libs.hold_runner import HoldRunner
 import pyautogui
 
 
 
-def monk_pull(stop_event):
-    try:
-        while not stop_event.is_set() and keyboard.is_pressed(key_mapping['numpad1']):
-            keyboard.press('alt')
-            press_and_release('1')
-            keyboard.release('alt')
-            press_and_release('1')        
+def monk_pull():
+    press_with_modifier('alt', '1')
+    press_and_release('1')
 
-            time.sleep(0.2)
 
-        return True
-        
-    except Exception as e:
-        print(f"Error in monk pull: {e}")
-        return False                
+def monk_fists():
+    press_with_modifier('alt', '1')
 
+    press_and_release('2')
+    press_and_release('3')
 
-def monk_fists(stop_event):
-    try:
-        while not stop_event.is_set() and keyboard.is_pressed(key_mapping['numpad4']):
-            keyboard.press('alt')
-            press_and_release('1')
-            keyboard.release('alt')
-                                 
-            press_and_release('2')
-            press_and_release('3')     
-            
-            keyboard.press('alt')
-            press_and_release('2')
-            keyboard.release('alt')
+    press_with_modifier('alt', '2')
 
-            press_and_release('4') 
+    press_and_release('4')
 
-            keyboard.press('shift')
-            press_and_release('1')
-            keyboard.release('shift')
+    press_with_modifier('shift', '1')
 
-            keyboard.press('alt')
-            press_and_release('3')
-            keyboard.release('alt')            
-
-            time.sleep(0.2)
-
-        return True
-        
-    except Exception as e:
-        print(f"Error in monk fists: {e}")
-        return False
+    press_with_modifier('alt', '3')
 
 def run(stop_event):
-    while not stop_event.is_set():
-        if keyboard.is_pressed(key_mapping['numpad1']):
-            monk_pull(stop_event)        
-        if keyboard.is_pressed(key_mapping['numpad4']):
-            monk_fists(stop_event)
-        time.sleep(0.1)
\ No newline at end of file
+    # Each rotation runs every 0.2s while its key is held
+    runner = HoldRunner()
+    runner.bind(key_mapping['numpad1'], monk_pull, period=0.2)
+    runner.bind(key_mapping['numpad4'], monk_fists, period=0.2)
+    runner.run(stop_event)
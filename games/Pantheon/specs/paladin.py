@@ -1,4 +1,4 @@
-from libs.keyboard_actions import press_and_release
+from libs.keyboard_actions import press_and_release, press, release
 from libs.key_mapping import key_mapping
 import time
 import keyboard
@@ -9,13 +9,13 @@ import pyautogui
 def paladin_attack(stop_event):
     try:
         while not stop_event.is_set() and keyboard.is_pressed(key_mapping['numpad4']):
-            keyboard.press('alt')
+            press('alt')
             press_and_release('1')
-            keyboard.release('alt')
+            release('alt')
             press_and_release('2')
-            keyboard.press('shift')
+            press('shift')
             press_and_release('1')
-            keyboard.release('shift')           
+            release('shift')           
             press_and_release('3')        
 
             time.sleep(0.2)
@@ -1,26 +1,28 @@
-from libs.keyboard_actions import press_and_release
+from libs.keyboard_actions import press_and_release, press, release
 from libs.key_mapping import key_mapping
-import time
-import keyboard
+from libs.hotkeys import HotkeyDispatcher
+from libs.waits import sleep
 import pyautogui
 
-def shaman_buff():
+def shaman_buff(stop_event):
     try:
         pyautogui.click()  # Left click
         
-        keyboard.press('shift')
+        press('shift')
         press_and_release('3')
-        keyboard.release('shift')
-        time.sleep(4)
+        release('shift')
+        if not sleep(4, stop_event):
+            return
 
-        keyboard.press('shift')
+        press('shift')
         press_and_release('4')
-        keyboard.release('shift')
-        time.sleep(4)
+        release('shift')
+        if not sleep(4, stop_event):
+            return
 
-        keyboard.press('shift')
+        press('shift')
         press_and_release('5')
-        keyboard.release('shift')
+        release('shift')
         
     except Exception as e:
         print(f"Error in shaman buffs: {e}")
@@ -49,42 +51,47 @@ def shaman_echo():
     except Exception as e:
         print(f"Error in shaman echo: {e}")
 
-def shaman_debuff():
+def shaman_debuff(stop_event):
     try:
-        keyboard.press('alt')
+        press('alt')
         press_and_release('3')
-        keyboard.release('alt')
-        time.sleep(2)
+        release('alt')
+        if not sleep(2, stop_event):
+            return
 
         press_and_release('4')
-        time.sleep(4) 
+        if not sleep(4, stop_event):
+            return
 
         press_and_release('5')
-        time.sleep(4) 
+        sleep(4, stop_event)
 
     except Exception as e:
         print(f"Error in shaman debuff: {e}")
 
-def shaman_dot():
+def shaman_dot(stop_event):
     try:
         press_and_release('`')
-        time.sleep(0.2)
+        if not sleep(0.2, stop_event):
+            return
 
         press_and_release('6')
-        time.sleep(3)
+        if not sleep(3, stop_event):
+            return
 
         press_and_release('7')
-        time.sleep(3)
+        sleep(3, stop_event)
 
     except Exception as e:
         print(f"Error in shaman dot: {e}")
 
-def shaman_bang():
+def shaman_bang(stop_event):
     try:
-        keyboard.press('alt')
+        press('alt')
         press_and_release('2')
-        keyboard.release('alt')
-        time.sleep(1)
+        release('alt')
+        if not sleep(1, stop_event):
+            return
 
         press_and_release('8')
         
@@ -92,71 +99,15 @@ def shaman_bang():
         print(f"Error in shaman bang: {e}")
 
 def run(stop_event):
-    running_states = {
-        'numpad1': False,
-        'numpad2': False,
-        'numpad3': False,
-        'numpad4': False,
-        'numpad5': False,
-        'numpad6': False,
-        'numpad7': False
-    }
-
-    while not stop_event.is_set():
-        if keyboard.is_pressed(key_mapping['numpad1']):
-            if not running_states['numpad1']:
-                running_states['numpad1'] = True
-                shaman_stream()
-            while keyboard.is_pressed(key_mapping['numpad1']) and not stop_event.is_set():
-                time.sleep(0.05)
-            running_states['numpad1'] = False
-
-        if keyboard.is_pressed(key_mapping['numpad2']):
-            if not running_states['numpad2']:
-                running_states['numpad2'] = True
-                shaman_replenish()
-            while keyboard.is_pressed(key_mapping['numpad2']) and not stop_event.is_set():
-                time.sleep(0.05)
-            running_states['numpad2'] = False
-
-        if keyboard.is_pressed(key_mapping['numpad3']):
-            if not running_states['numpad3']:
-                running_states['numpad3'] = True
-                shaman_echo()
-            while keyboard.is_pressed(key_mapping['numpad3']) and not stop_event.is_set():
-                time.sleep(0.05)
-            running_states['numpad3'] = False
-
-        if keyboard.is_pressed(key_mapping['numpad4']):
-            if not running_states['numpad4']:
-                running_states['numpad4'] = True
-                shaman_debuff()
-            while keyboard.is_pressed(key_mapping['numpad4']) and not stop_event.is_set():
-                time.sleep(0.05)
-            running_states['numpad4'] = False
-
-        if keyboard.is_pressed(key_mapping['numpad5']):
-            if not running_states['numpad5']:
-                running_states['numpad5'] = True
-                shaman_dot()
-            while keyboard.is_pressed(key_mapping['numpad5']) and not stop_event.is_set():
-                time.sleep(0.05)
-            running_states['numpad5'] = False
-
-        if keyboard.is_pressed(key_mapping['numpad6']):
-            if not running_states['numpad6']:
-                running_states['numpad6'] = True
-                shaman_buff()
-            while keyboard.is_pressed(key_mapping['numpad6']) and not stop_event.is_set():
-                time.sleep(0.05)
-            running_states['numpad6'] = False
-
-        if keyboard.is_pressed(key_mapping['numpad7']):
-            if not running_states['numpad7']:
-                running_states['numpad7'] = True
-                shaman_bang()
-            while keyboard.is_pressed(key_mapping['numpad7']) and not stop_event.is_set():
-                time.sleep(0.05)
-            running_states['numpad7'] = False
-
-        time.sleep(0.05)
\ No newline at end of file
+    # Each numpad key fires its ability once per press; handlers are queued
+    # from keyboard events, so there is no polling delay. Waits inside a
+    # handler end as soon as stop_event is set
+    hotkeys = HotkeyDispatcher()
+    hotkeys.on_press(key_mapping['numpad1'], shaman_stream)
+    hotkeys.on_press(key_mapping['numpad2'], shaman_replenish)
+    hotkeys.on_press(key_mapping['numpad3'], shaman_echo)
+    hotkeys.on_press(key_mapping['numpad4'], lambda: shaman_debuff(stop_event))
+    hotkeys.on_press(key_mapping['numpad5'], lambda: shaman_dot(stop_event))
+    hotkeys.on_press(key_mapping['numpad6'], lambda: shaman_buff(stop_event))
+    hotkeys.on_press(key_mapping['numpad7'], lambda: shaman_bang(stop_event))
+    hotkeys.run(stop_event)
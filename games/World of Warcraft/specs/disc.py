@@ -1,10 +1,9 @@
 from libs.pixel_get_color import get_color as pixel_get_color, get_multiple_pixel_colors
 from libs.keyboard_actions import press_and_release
 from libs.key_mapping import key_mapping
+from libs.hold_runner import HoldRunner
 from libs.logger import get_logger
 from libs.wow_helpers import get_coords, log_coords_once
-import time
-import keyboard
 
 logger = get_logger('disc')
 
@@ -16,60 +15,47 @@ def handle_pixel_action(condition_color, key):
     if condition_color and condition_color != DEFAULT_COLOR:
         press_and_release(key)
 
-# Disc rotation logic for numpad4
-def wow4_rotation(stop_event):
-    try:
-        # Get coordinates from config
-        focus_health, health_below_50 = get_coords('focus_health', 'health_below_50')
-        log_coords_once({'focus_health': focus_health, 'health_below_50': health_below_50})
-        
-        while not stop_event.is_set() and keyboard.is_pressed(key_mapping['numpad4']):
-            # Get pixel colors efficiently
-            colors = get_multiple_pixel_colors([focus_health, health_below_50])
-            
-            if len(colors) == 2:
-                focus_health, health_below_50 = colors
-                
-                # Handle actions based on pixel colors
-                handle_pixel_action(focus_health, '=')
-                handle_pixel_action(health_below_50, '-')
+# Disc rotation logic for numpad4 (one pass; the runner repeats it while held)
+def wow4_rotation():
+    # Get coordinates from config
+    focus_health, health_below_50 = get_coords('focus_health', 'health_below_50')
+    log_coords_once({'focus_health': focus_health, 'health_below_50': health_below_50})
 
-            # Default key press
-            press_and_release(key_mapping['numpad4'])
-            time.sleep(0.2)  
+    # Get pixel colors efficiently
+    colors = get_multiple_pixel_colors([focus_health, health_below_50])
 
-    except Exception as e:
-        logger.exception(f"An error occurred during wow4 rotation: {e}")
+    if len(colors) == 2:
+        focus_health, health_below_50 = colors
 
-# Disc rotation logic for numpad7
-def wow7_rotation(stop_event):
-    try:
-        # Get coordinates from config
-        focus_health, health_below_50 = get_coords('focus_health', 'health_below_50')
-        
-        while not stop_event.is_set() and keyboard.is_pressed(key_mapping['numpad7']):
-            # Get pixel colors efficiently
-            colors = get_multiple_pixel_colors([focus_health, health_below_50])
-            
-            if len(colors) == 2:
-                focus_health, health_below_50 = colors
-                
-                # Handle actions based on pixel colors
-                handle_pixel_action(focus_health, '=')
-                handle_pixel_action(health_below_50, '-')
+        # Handle actions based on pixel colors
+        handle_pixel_action(focus_health, '=')
+        handle_pixel_action(health_below_50, '-')
 
-            # Default key press
-            press_and_release(key_mapping['numpad7'])
-            time.sleep(0.2)  
+    # Default key press
+    press_and_release(key_mapping['numpad4'])
 
-    except Exception as e:
-        logger.exception(f"An error occurred during wow7 rotation: {e}")
+# Disc rotation logic for numpad7 (one pass; the runner repeats it while held)
+def wow7_rotation():
+    # Get coordinates from config
+    focus_health, health_below_50 = get_coords('focus_health', 'health_below_50')
+
+    # Get pixel colors efficiently
+    colors = get_multiple_pixel_colors([focus_health, health_below_50])
+
+    if len(colors) == 2:
+        focus_health, health_below_50 = colors
+
+        # Handle actions based on pixel colors
+        handle_pixel_action(focus_health, '=')
+        handle_pixel_action(health_below_50, '-')
+
+    # Default key press
+    press_and_release(key_mapping['numpad7'])
 
 # Main run function
 def run(stop_event):
-    while not stop_event.is_set():
-        if keyboard.is_pressed(key_mapping['numpad4']):
-            wow4_rotation(stop_event)
-        elif keyboard.is_pressed(key_mapping['numpad7']):
-            wow7_rotation(stop_event)
-        time.sleep(0.1)  # Sleep to avoid busy-waiting
+    # Rotations start on keydown and repeat every 0.2s until their key is released
+    runner = HoldRunner()
+    runner.bind(key_mapping['numpad4'], wow4_rotation, period=0.2)
+    runner.bind(key_mapping['numpad7'], wow7_rotation, period=0.2)
+    runner.run(stop_event)
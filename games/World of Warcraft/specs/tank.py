@@ -4,6 +4,7 @@ from libs.keyboard_actions import press_and_release
 from libs.key_mapping import key_mapping
 from libs.pixel_get_color import get_multiple_pixel_colors
 from libs.logger import get_logger
+from libs.capture_planner import plan_capture
 from libs.wow_helpers import get_coords, log_coords_once
 
 logger = get_logger('tank')
@@ -30,6 +31,9 @@ def tank_rotation(stop_event):
             'health_75': health75
         })
         
+        # Only capture the configured pixels instead of the whole desktop
+        plan_capture(points=[interrupt, health50, health35, health25, health75])
+        
         while not stop_event.is_set():
             # Check stop event first
             if stop_event.is_set():
@@ -1,5 +1,5 @@
 from libs.pixel_get_color import get_color as pixel_get_color
-from libs.keyboard_actions import press_and_release, press
+from libs.keyboard_actions import press_and_release, press, release
 from libs.key_mapping import key_mapping
 from PIL import ImageGrab
 import time
@@ -45,7 +45,7 @@ def druidheals_rotation(stop_event):
                     # Sending a modified input equivalent to Control + NumPad4
                     press('ctrl')
                     press_and_release(key_mapping['numpad4'])
-                    keyboard.release('ctrl')
+                    release('ctrl')
 
                     time.sleep(0.25)  # Sleep 250ms as per AHK script
 
@@ -0,0 +1,233 @@
+"""
+X11 screen capture backends for EvilHotKeys
+
+The mss backend keeps one long-lived mss handle per thread (mss handles are
+not thread safe) so the X connection and its buffers are set up once instead
+of on every grab. Threads close their handle with close() when they finish;
+handles left by threads that exited without it are closed on the next open.
+If mss is missing or fails, captures fall back to PIL ImageGrab, and mss is
+retried after a back-off so one transient failure does not drop it for good.
+
+Backends hand out frames as read-only NumPy arrays together with their
+channel order, so callers reorder channels by index instead of copying.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from PIL import Image, ImageGrab
+from libs.logger import get_logger
+
+logger = get_logger('capture_backends')
+
+# Box format: (x1, y1, x2, y2) with x2/y2 exclusive, None for the full desktop
+Box = Tuple[int, int, int, int]
+
+# Seconds a failed backend is skipped before it is retried (doubles per
+# consecutive failure, up to MAX_RETRY_DELAY)
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+
+# Index of the R, G and B channels for each channel order
+CHANNEL_INDEX = {
+    'BGRA': (2, 1, 0),
+    'RGB': (0, 1, 2),
+}
+
+
+def image_to_array(image) -> np.ndarray:
+    """Convert a PIL image to a read-only RGB array (one copy per capture)"""
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    array = np.asarray(image)
+    array.flags.writeable = False
+    return array
+
+
+class MssBackend:
+    """Capture backend holding a persistent mss handle per thread"""
+
+    name = 'mss'
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._handles: Dict[threading.Thread, Any] = {}
+
+    def available(self) -> bool:
+        """Check if mss can be imported"""
+        try:
+            import mss  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def _get_sct(self):
+        """Get (or open) the mss handle for the calling thread"""
+        sct = getattr(self._local, 'sct', None)
+        if sct is None:
+            import mss
+            self.reap()
+            sct = mss.mss()
+            self._local.sct = sct
+            with self._lock:
+                self._handles[threading.current_thread()] = sct
+        return sct
+
+    def reap(self):
+        """Close the handles of threads that exited without close()"""
+        with self._lock:
+            dead = [thread for thread in self._handles if not thread.is_alive()]
+            handles = [self._handles.pop(thread) for thread in dead]
+        for sct in handles:
+            try:
+                sct.close()
+            except Exception as e:
+                logger.debug(f"Error closing mss handle of an exited thread: {e}")
+
+    def grab_raw(self, box: Optional[Box] = None):
+        """Grab a box and return the raw mss ScreenShot"""
+        sct = self._get_sct()
+        if box is None:
+            return sct.grab(sct.monitors[0])
+        x1, y1, x2, y2 = box
+        return sct.grab({'left': x1, 'top': y1, 'width': x2 - x1, 'height': y2 - y1})
+
+    def grab(self, box: Optional[Box] = None):
+        """Grab a box (or the full desktop) as an RGB image"""
+        shot = self.grab_raw(box)
+        return Image.frombytes('RGB', shot.size, shot.rgb)
+
+    def grab_array(self, box: Optional[Box] = None) -> Tuple[np.ndarray, str]:
+        """Grab a box as a read-only HxWx4 view over mss's raw BGRA buffer"""
+        shot = self.grab_raw(box)
+        array = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        array.flags.writeable = False
+        return array, 'BGRA'
+
+    def close(self):
+        """Close the calling thread's mss handle and any left by exited threads"""
+        sct = getattr(self._local, 'sct', None)
+        if sct is not None:
+            with self._lock:
+                self._handles.pop(threading.current_thread(), None)
+            self._local.sct = None
+            sct.close()
+        self.reap()
+
+
+class ImageGrabBackend:
+    """Capture backend using PIL ImageGrab"""
+
+    name = 'imagegrab'
+
+    def available(self) -> bool:
+        return True
+
+    def grab(self, box: Optional[Box] = None):
+        """Grab a box (or the full desktop) as an RGB image"""
+        image = ImageGrab.grab(bbox=box)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return image
+
+    def grab_array(self, box: Optional[Box] = None) -> Tuple[np.ndarray, str]:
+        """Grab a box as a read-only HxWx3 RGB array"""
+        return image_to_array(ImageGrab.grab(bbox=box)), 'RGB'
+
+    def close(self):
+        pass
+
+
+class CaptureChain:
+    """Tries capture backends in order, backing off from ones that fail"""
+
+    def __init__(self, backends: List):
+        self.backends = [backend for backend in backends if backend.available()]
+        self._retry_at: Dict[str, float] = {}  # Backend name -> monotonic retry time
+        self._delay: Dict[str, float] = {}  # Backend name -> current back-off
+
+    def _usable(self, index: int, now: float) -> bool:
+        """Whether a backend may be tried (the last one always is)"""
+        if index == len(self.backends) - 1:
+            return True
+        return self._retry_at.get(self.backends[index].name, 0.0) <= now
+
+    @property
+    def active(self):
+        """The backend currently used for captures"""
+        now = time.monotonic()
+        for index, backend in enumerate(self.backends):
+            if self._usable(index, now):
+                return backend
+        return None
+
+    def _call(self, method: str, box: Optional[Box]):
+        """Call a grab method on the first backend that succeeds
+
+        A backend that fails is skipped for a back-off period, then retried.
+
+        Raises:
+            RuntimeError: If every backend failed
+        """
+        now = time.monotonic()
+        for index, backend in enumerate(self.backends):
+            if not self._usable(index, now):
+                continue
+            try:
+                result = getattr(backend, method)(box)
+            except Exception as e:
+                if index == len(self.backends) - 1:
+                    raise
+                # A broken handle would keep failing; reopen it on retry
+                try:
+                    backend.close()
+                except Exception as close_error:
+                    logger.debug(f"Error closing capture backend '{backend.name}': {close_error}")
+                delay = min(self._delay.get(backend.name, RETRY_DELAY / 2) * 2, MAX_RETRY_DELAY)
+                self._delay[backend.name] = delay
+                self._retry_at[backend.name] = now + delay
+                logger.warning(f"Capture backend '{backend.name}' failed ({e}), "
+                               f"falling back to '{self.backends[index + 1].name}' for {delay:.0f}s")
+                continue
+            if self._delay.pop(backend.name, None) is not None:
+                logger.info(f"Capture backend '{backend.name}' recovered")
+            return result
+        raise RuntimeError("No screen capture backend available")
+
+    def grab(self, box: Optional[Box] = None):
+        """Grab a box (or the full desktop) as an RGB image"""
+        return self._call('grab', box)
+
+    def grab_array(self, box: Optional[Box] = None) -> Tuple[np.ndarray, str]:
+        """Grab a box (or the full desktop) as a read-only array
+
+        Returns:
+            Tuple of (array, channel order), see CHANNEL_INDEX
+        """
+        return self._call('grab_array', box)
+
+    def close(self):
+        """Release the calling thread's backend resources"""
+        for backend in self.backends:
+            backend.close()
+
+    def reap(self):
+        """Release resources left by threads that have exited"""
+        for backend in self.backends:
+            if hasattr(backend, 'reap'):
+                backend.reap()
+
+
+# Global instance
+_capture_backend: Optional[CaptureChain] = None
+
+
+def get_capture_backend() -> CaptureChain:
+    """Get the global X11 capture backend chain (mss, then ImageGrab)"""
+    global _capture_backend
+    if _capture_backend is None:
+        _capture_backend = CaptureChain([MssBackend(), ImageGrabBackend()])
+        if _capture_backend.active:
+            logger.debug(f"Using capture backend: {_capture_backend.active.name}")
+    return _capture_backend
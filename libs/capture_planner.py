@@ -0,0 +1,164 @@
+"""
+Region-of-interest capture planning for EvilHotKeys
+
+Specs only ever look at a few dozen pixels around the skill bar, so instead
+of grabbing the whole desktop the planner collects every coordinate and
+search region a spec registers and merges them into a handful of small
+bounding boxes that the frame capture service grabs on each frame.
+"""
+from typing import Iterable, List, Optional, Sequence, Tuple
+from libs.capture_backends import Box
+from libs.config_manager import get_config_manager
+from libs.logger import get_logger
+
+logger = get_logger('capture_planner')
+
+# Default pixels added around every registered point
+DEFAULT_PADDING = 8
+
+# Boxes closer than this many pixels are merged into one
+DEFAULT_MERGE_GAP = 64
+
+# Upper bound on the number of boxes grabbed per frame
+DEFAULT_MAX_BOXES = 4
+
+
+def _box_area(box: Box) -> int:
+    return (box[2] - box[0]) * (box[3] - box[1])
+
+
+def _union(a: Box, b: Box) -> Box:
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _gap(a: Box, b: Box) -> int:
+    """Distance in pixels between the edges of two boxes (0 if they overlap)"""
+    dx = max(a[0] - b[2], b[0] - a[2], 0)
+    dy = max(a[1] - b[3], b[1] - a[3], 0)
+    return max(dx, dy)
+
+
+class CapturePlanner:
+    """Collects registered coordinates and merges them into capture boxes"""
+
+    def __init__(self, padding: int = DEFAULT_PADDING, merge_gap: int = DEFAULT_MERGE_GAP,
+                 max_boxes: int = DEFAULT_MAX_BOXES, screen_size: Optional[Tuple[int, int]] = None):
+        """Initialize the planner.
+
+        Args:
+            padding: Pixels added around every registered point
+            merge_gap: Boxes closer than this are merged
+            max_boxes: Maximum number of boxes in the final plan
+            screen_size: (width, height) boxes are clamped to; padding near
+                         the right or bottom edge would otherwise grab off
+                         screen, which mss rejects (None: only clamp at 0)
+        """
+        self.padding = padding
+        self.merge_gap = merge_gap
+        self.max_boxes = max_boxes
+        self.screen_size = screen_size
+        self._boxes: List[Box] = []
+
+    def _clamp(self, box: Box) -> Optional[Box]:
+        """Clip a box to the screen (None if nothing is left)"""
+        x1, y1, x2, y2 = max(box[0], 0), max(box[1], 0), box[2], box[3]
+        if self.screen_size is not None:
+            x2, y2 = min(x2, self.screen_size[0]), min(y2, self.screen_size[1])
+        if x2 <= x1 or y2 <= y1:
+            return None
+        return (x1, y1, x2, y2)
+
+    def register_point(self, x: int, y: int, offsets: Optional[Sequence[Tuple[int, int]]] = None):
+        """Register a pixel (and optional probe offsets around it)"""
+        for dx, dy in (offsets or ((0, 0),)):
+            px, py = x + dx, y + dy
+            p = self.padding
+            self._boxes.append((px - p, py - p, px + p + 1, py + p + 1))
+
+    def register_points(self, coordinates: Iterable[Tuple[int, int]],
+                        offsets: Optional[Sequence[Tuple[int, int]]] = None):
+        """Register several pixels, e.g. the values of a spec's coordinate dict"""
+        for (x, y) in coordinates:
+            self.register_point(x, y, offsets)
+
+    def register_region(self, x1: int, y1: int, x2: int, y2: int):
+        """Register a search region (same corners as pixel_search)"""
+        self._boxes.append((min(x1, x2), min(y1, y2), max(x1, x2) + 1, max(y1, y2) + 1))
+
+    def clear(self):
+        """Forget everything registered so far"""
+        self._boxes = []
+
+    def plan(self) -> List[Box]:
+        """Compute the merged capture boxes.
+
+        Returns:
+            List of (x1, y1, x2, y2) boxes, x2/y2 exclusive
+        """
+        boxes = [box for box in map(self._clamp, self._boxes) if box is not None]
+
+        # Merge boxes that touch or sit within merge_gap of each other
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(boxes)):
+                for j in range(i + 1, len(boxes)):
+                    if _gap(boxes[i], boxes[j]) <= self.merge_gap:
+                        boxes[i] = _union(boxes[i], boxes[j])
+                        del boxes[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+
+        # Still too many boxes: merge the pair that adds the least extra area
+        while len(boxes) > max(self.max_boxes, 1):
+            best = None
+            for i in range(len(boxes)):
+                for j in range(i + 1, len(boxes)):
+                    union = _union(boxes[i], boxes[j])
+                    cost = _box_area(union) - _box_area(boxes[i]) - _box_area(boxes[j])
+                    if best is None or cost < best[0]:
+                        best = (cost, i, j, union)
+            _, i, j, union = best
+            boxes[i] = union
+            del boxes[j]
+
+        return boxes
+
+    def describe(self) -> str:
+        """Human readable summary of the plan for logging"""
+        boxes = self.plan()
+        pixels = sum(_box_area(box) for box in boxes)
+        return f"{len(boxes)} box(es), {pixels} pixels: {boxes}"
+
+
+def plan_capture(points: Iterable[Tuple[int, int]] = (), regions: Iterable[Box] = (),
+                 offsets: Optional[Sequence[Tuple[int, int]]] = None) -> List[Box]:
+    """Register a spec's coordinates with the shared frame capture service.
+
+    Args:
+        points: Pixel coordinates the spec reads
+        regions: (x1, y1, x2, y2) regions the spec searches
+        offsets: Optional probe offsets applied around every point
+
+    Returns:
+        The capture boxes now in use
+    """
+    from libs.coordinate_registry import parse_resolution
+    from libs.frame_capture import get_frame_capture_service
+
+    try:
+        screen_size = parse_resolution(get_config_manager().get('display.resolution', '5760x1080'))
+    except ValueError as e:
+        logger.warning(f"Not clamping the capture plan to the screen: {e}")
+        screen_size = None
+    planner = CapturePlanner(screen_size=screen_size)
+    planner.register_points(points, offsets)
+    for region in regions:
+        planner.register_region(*region)
+
+    boxes = planner.plan()
+    get_frame_capture_service().set_capture_plan(boxes)
+    logger.info(f"Capture plan: {planner.describe()}")
+    return boxes
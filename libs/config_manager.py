@@ -15,6 +15,9 @@ DEFAULT_CONFIG = {
     'performance': {
         'profile': 'balanced',  # fast, balanced, responsive, debug
         'screenshot_cache_duration': 0.5,
+        'frame_freshness': 0.015,  # Max age of the shared frame used by pixel reads
+        'prefetch': False,  # Keep the shared frame refreshed from a background thread
+        'prefetch_fps': 60,
         'debug_timing': False
     },
     'logging': {
@@ -22,6 +25,10 @@ DEFAULT_CONFIG = {
         'log_to_file': False,
         'log_file_path': 'evilhotkeys.log'
     },
+    'input': {
+        'min_key_spacing': 0.02,  # Seconds between inputs (games.<name>.input overrides)
+        'queue_size': 16  # Pending inputs before submitters wait for room
+    },
     'keybinds': {
         'pause': 'end',
         'stop': 'esc'
@@ -87,6 +94,9 @@ class ConfigManager:
             if user_config:
                 # Deep merge user config with defaults
                 self._merge_config(self.config, user_config)
+                # Coordinates are resolved from the config, so drop stale ones
+                from libs.coordinate_registry import clear_coordinate_registries
+                clear_coordinate_registries()
                 logger.info(f"Loaded configuration from {self.config_path}")
                 return True
             else:
@@ -241,24 +251,15 @@ class ConfigManager:
             coord_name: Name of the coordinate (e.g., 'interrupt', 'health_50')
             resolution: Screen resolution (uses config default if not specified)
         
+        Coordinates recorded for another resolution, or given as normalized
+        or anchor-relative layout entries, are resolved for this resolution
+        (see libs.coordinate_registry).
+        
         Returns:
             Tuple of (x, y) coordinates or None if not found
         """
-        game_config = self.get_game_config(game_name)
-        
-        if not game_config:
-            return None
-        
-        if resolution is None:
-            resolution = self.get('display.resolution', '5760x1080')
-        
-        coords = game_config.get('coordinates', {}).get(resolution, {})
-        coord_data = coords.get(coord_name)
-        
-        if coord_data and isinstance(coord_data, (list, tuple)) and len(coord_data) == 2:
-            return tuple(coord_data)
-        
-        return None
+        from libs.coordinate_registry import get_coordinate_registry
+        return get_coordinate_registry(game_name, resolution).get(coord_name)
 
 
 # Global config instance
@@ -0,0 +1,219 @@
+"""
+Cooldown tracking for EvilHotKeys
+
+Instead of re-reading a skill icon on every check, the tracker remembers
+when each ability was sent, what its pixels last said, and how long its
+cooldown is (declared, or learned from observed casts). Checks are answered
+from that prediction and the pixel is only read again when the answer may
+have changed: at the predicted expiry, to confirm a cast landed, or after
+a short recheck interval.
+
+Example:
+    COOLDOWNS = CooldownTracker()
+    COOLDOWNS.register('napalm', cooldown=20.0)   # optional, else learned
+
+    if COOLDOWNS.is_ready('napalm', lambda: check_pixel(...)):
+        press_and_release(...)
+        COOLDOWNS.record_cast('napalm')
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+from libs.logger import get_logger
+
+logger = get_logger('cooldowns')
+
+# Seconds an "on cooldown" verdict is trusted when no expiry is predicted
+DEFAULT_RECHECK = 0.25
+
+# Seconds a "ready" verdict is trusted, and between reads once a predicted
+# expiry has passed
+DEFAULT_EXPIRY_POLL = 0.05
+
+# Seconds after a cast before checking that it landed
+DEFAULT_CONFIRM_DELAY = 0.3
+
+
+class CooldownState:
+    """What the tracker knows about one ability"""
+
+    def __init__(self, cooldown: Optional[float] = None):
+        self.cooldown = cooldown           # Declared cooldown in seconds
+        self.learned: Optional[float] = None  # Shortest observed cooldown
+        self.ready: Optional[bool] = None  # Last pixel verdict (None: never read)
+        self.checked_at = 0.0              # Time of the last pixel read
+        self.sent_at: Optional[float] = None  # Time of the last cast
+        self.confirmed = False             # Pixels showed that cast go on cooldown
+        self.cooldown_from: Optional[float] = None  # Earliest time the cooldown can have started
+        self.next_check = 0.0              # Time the next pixel read is due
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Best known cooldown length"""
+        return self.cooldown if self.cooldown is not None else self.learned
+
+    @property
+    def ready_at(self) -> Optional[float]:
+        """Earliest time the ability can be ready again (None if unknown)"""
+        if self.cooldown_from is None or self.duration is None:
+            return None
+        return self.cooldown_from + self.duration
+
+
+class CooldownTracker:
+    """Predicts ability readiness and verifies it from pixels only when due"""
+
+    def __init__(self, recheck: float = DEFAULT_RECHECK, expiry_poll: float = DEFAULT_EXPIRY_POLL,
+                 confirm_delay: float = DEFAULT_CONFIRM_DELAY):
+        """Initialize the tracker.
+
+        Args:
+            recheck: Seconds an "on cooldown" verdict is trusted when no
+                     expiry is predicted
+            expiry_poll: Seconds a "ready" verdict is trusted, and between
+                         reads once a predicted expiry passed
+            confirm_delay: Seconds after a cast before checking it landed
+        """
+        self.recheck = recheck
+        self.expiry_poll = expiry_poll
+        self.confirm_delay = confirm_delay
+        self._states: Dict[Hashable, CooldownState] = {}
+        self._lock = threading.Lock()
+        self.reads = 0
+        self.predicted = 0
+
+    def _state(self, key: Hashable) -> CooldownState:
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = CooldownState()
+        return state
+
+    def register(self, key: Hashable, cooldown: Optional[float] = None):
+        """Declare an ability and (optionally) its cooldown in seconds"""
+        with self._lock:
+            self._state(key).cooldown = cooldown
+
+    def record_cast(self, key: Hashable, now: Optional[float] = None):
+        """Record that the ability's key was just sent"""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            state = self._state(key)
+            state.sent_at = now
+            state.confirmed = False
+            state.cooldown_from = now
+            state.ready = False
+            state.next_check = now + self.confirm_delay
+
+    def observe(self, key: Hashable, ready: bool, now: Optional[float] = None):
+        """Record a pixel verdict for the ability"""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            state = self._state(key)
+            was_ready, last_checked = state.ready, state.checked_at
+            state.ready = ready
+            state.checked_at = now
+
+            if ready:
+                # Came off the cooldown of a confirmed cast: learn how long it was
+                if state.confirmed and state.sent_at is not None:
+                    elapsed = now - state.sent_at
+                    if state.learned is None or elapsed < state.learned:
+                        state.learned = elapsed
+                        logger.debug(f"Learned cooldown for {key}: {elapsed:.2f}s")
+                state.sent_at = None
+                state.confirmed = False
+                state.cooldown_from = None
+                # Ready stays ready until cast, but casts by hand are not seen
+                state.next_check = now + self.expiry_poll
+                return
+
+            if state.sent_at is not None:
+                state.confirmed = True
+            elif was_ready:
+                # Went on cooldown without a recorded cast (e.g. cast by hand);
+                # it started after the last ready reading
+                state.cooldown_from = last_checked
+
+            ready_at = state.ready_at
+            if ready_at is not None and state.cooldown is None:
+                # Learned cooldowns include up to one recheck of polling slack
+                ready_at -= self.recheck
+            if ready_at is not None and ready_at > now:
+                state.next_check = ready_at
+            elif ready_at is not None:
+                state.next_check = now + self.expiry_poll
+            else:
+                state.next_check = now + self.recheck
+
+    def predict(self, key: Hashable, now: Optional[float] = None) -> Optional[bool]:
+        """Predicted readiness without reading pixels.
+
+        Returns:
+            True/False while the last verdict is still trusted,
+            None when a pixel read is due
+        """
+        if now is None:
+            now = time.time()
+        state = self._states.get(key)
+        if state is None or state.ready is None or now >= state.next_check:
+            return None
+        return state.ready
+
+    def is_ready(self, key: Hashable, read: Callable[[], bool], now: Optional[float] = None) -> bool:
+        """Check readiness, reading pixels only when due.
+
+        Args:
+            key: Ability key (name or coordinates)
+            read: Function reading the pixel verdict (True = ready)
+            now: Current time (default: time.time())
+        """
+        if now is None:
+            now = time.time()
+        predicted = self.predict(key, now)
+        if predicted is not None:
+            self.predicted += 1
+            return predicted
+
+        self.reads += 1
+        ready = bool(read())
+        self.observe(key, ready, now)
+        return ready
+
+    def remaining(self, key: Hashable, now: Optional[float] = None) -> Optional[float]:
+        """Predicted seconds until the ability is ready (0 if ready, None if unknown)"""
+        if now is None:
+            now = time.time()
+        state = self._states.get(key)
+        if state is None or state.ready is None:
+            return None
+        if state.ready:
+            return 0.0
+        ready_at = state.ready_at
+        return None if ready_at is None else max(ready_at - now, 0.0)
+
+    def reset(self, key: Optional[Hashable] = None):
+        """Forget pixel verdicts (of one ability, or all); cooldown lengths are kept"""
+        with self._lock:
+            states = [self._states[key]] if key in self._states else (
+                list(self._states.values()) if key is None else [])
+            for state in states:
+                state.ready = None
+                state.sent_at = None
+                state.confirmed = False
+                state.cooldown_from = None
+                state.next_check = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pixel read counters.
+
+        Returns:
+            Dict with reads, predicted (checks answered without a read) and skip_rate
+        """
+        total = self.reads + self.predicted
+        return {
+            'reads': self.reads,
+            'predicted': self.predicted,
+            'skip_rate': (self.predicted / total) if total else 0.0
+        }
@@ -0,0 +1,222 @@
+"""
+Resolution-independent coordinate registry for EvilHotKeys
+
+Coordinates are described once and resolved to absolute pixels for the
+active display when the registry is built, so reads are a plain dict or
+array lookup with no per-read scaling.
+
+A coordinate can be given in config as:
+    [x, y]                                      absolute, at a known resolution
+    {norm: [0.81, 0.92]}                        fraction of the display size
+    {anchor: bottom_right, offset: [-70, -85]}  offset from a screen anchor,
+                                                scaled with the UI (display height)
+
+Example config.yaml:
+    games:
+      World of Warcraft:
+        layout:
+          base_resolution: 5760x2160     # resolution the offsets were measured at
+          coordinates:
+            interrupt: {anchor: bottom_right, offset: [-1070, -400]}
+            focus_health: {norm: [0.407, 0.424]}
+        coordinates:
+          5760x1080:
+            interrupt: [4690, 760]       # exact entries for a resolution win
+
+Lookup order for a name: exact coordinates for the active resolution, then
+the layout, then coordinates recorded at another resolution with the same
+aspect ratio, scaled uniformly (other aspect ratios are skipped with a
+warning).
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from libs.config_manager import get_config_manager
+from libs.logger import get_logger
+
+logger = get_logger('coordinate_registry')
+
+Point = Tuple[int, int]
+
+# Anchor name -> fraction of the display width/height
+ANCHORS = {
+    'top_left': (0.0, 0.0),
+    'top': (0.5, 0.0),
+    'top_right': (1.0, 0.0),
+    'left': (0.0, 0.5),
+    'center': (0.5, 0.5),
+    'right': (1.0, 0.5),
+    'bottom_left': (0.0, 1.0),
+    'bottom': (0.5, 1.0),
+    'bottom_right': (1.0, 1.0),
+}
+
+
+def parse_resolution(resolution: str) -> Tuple[int, int]:
+    """Parse a 'WIDTHxHEIGHT' string
+
+    Raises:
+        ValueError: If the string is not a resolution
+    """
+    try:
+        width, height = str(resolution).lower().split('x')
+        return int(width), int(height)
+    except ValueError:
+        raise ValueError(f"Invalid resolution: {resolution!r} (expected WIDTHxHEIGHT)")
+
+
+class CoordinateRegistry:
+    """Named screen coordinates resolved for one display resolution"""
+
+    def __init__(self, resolution: str, base_resolution: Optional[str] = None):
+        """Initialize the registry.
+
+        Args:
+            resolution: Active display resolution ('WIDTHxHEIGHT')
+            base_resolution: Resolution anchor offsets were measured at
+                             (default: the active resolution, i.e. no scaling)
+        """
+        self.resolution = resolution
+        self.width, self.height = parse_resolution(resolution)
+        self.base_resolution = base_resolution or resolution
+        self.base_width, self.base_height = parse_resolution(self.base_resolution)
+        self._points: Dict[str, Point] = {}
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._index: Dict[str, int] = {}
+
+    def resolve(self, spec: Any, resolution: Optional[str] = None) -> Point:
+        """Resolve one coordinate description to absolute pixels.
+
+        Args:
+            spec: [x, y], {'norm': [fx, fy]} or {'anchor': name, 'offset': [dx, dy]}
+            resolution: Resolution an absolute [x, y] was recorded at
+                        (default: the base resolution)
+
+        Raises:
+            ValueError: If the description is not understood
+        """
+        if isinstance(spec, (list, tuple)) and len(spec) == 2:
+            width, height = parse_resolution(resolution or self.base_resolution)
+            # Per-axis factors would stretch the UI (5760x1080 -> 1920x1080
+            # divides x by 3), so only a same-aspect resolution is scaled
+            if width * self.height != height * self.width:
+                raise ValueError(f"recorded at {width}x{height}, which has a different aspect ratio "
+                                 f"than {self.resolution}; record it for {self.resolution} or use norm/anchor")
+            scale = self.height / height
+            return (round(spec[0] * scale), round(spec[1] * scale))
+
+        if isinstance(spec, dict) and 'norm' in spec:
+            fx, fy = spec['norm']
+            return (round(fx * (self.width - 1)), round(fy * (self.height - 1)))
+
+        if isinstance(spec, dict) and 'anchor' in spec:
+            if spec['anchor'] not in ANCHORS:
+                raise ValueError(f"Unknown anchor: {spec['anchor']!r}")
+            ax, ay = ANCHORS[spec['anchor']]
+            dx, dy = spec.get('offset', (0, 0))
+            # Game UIs scale with the display height
+            scale = self.height / self.base_height
+            return (round(ax * (self.width - 1) + dx * scale), round(ay * (self.height - 1) + dy * scale))
+
+        raise ValueError(f"Invalid coordinate: {spec!r}")
+
+    def add(self, name: str, spec: Any, resolution: Optional[str] = None) -> Point:
+        """Resolve and store a coordinate (see resolve)"""
+        point = self.resolve(spec, resolution)
+        self._points[name] = point
+        self._arrays = None
+        return point
+
+    def get(self, name: str, default: Optional[Point] = None) -> Optional[Point]:
+        """Get the absolute (x, y) of a coordinate"""
+        return self._points.get(name, default)
+
+    def __getitem__(self, name: str) -> Point:
+        return self._points[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._points
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    @property
+    def names(self) -> List[str]:
+        """Coordinate names in index order"""
+        return list(self._points)
+
+    def as_dict(self) -> Dict[str, Point]:
+        """Flat {name: (x, y)} lookup table"""
+        return dict(self._points)
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """All coordinates as (xs, ys) index arrays, in names order"""
+        if self._arrays is None:
+            points = list(self._points.values())
+            self._arrays = (np.array([p[0] for p in points], dtype=np.intp),
+                            np.array([p[1] for p in points], dtype=np.intp))
+            self._index = {name: i for i, name in enumerate(self._points)}
+        return self._arrays
+
+    def index(self, name: str) -> int:
+        """Position of a coordinate in arrays()"""
+        self.arrays()
+        return self._index[name]
+
+    @classmethod
+    def from_game_config(cls, game_config: Dict[str, Any], resolution: str) -> 'CoordinateRegistry':
+        """Build a registry from a game's config section"""
+        layout = game_config.get('layout', {}) or {}
+        registry = cls(resolution, layout.get('base_resolution'))
+        recorded = game_config.get('coordinates', {}) or {}
+
+        # Coordinates recorded at other resolutions are scaled, lowest priority
+        for other, coords in recorded.items():
+            if other == resolution or not coords:
+                continue
+            for name, spec in coords.items():
+                if name not in registry:
+                    try:
+                        registry.add(name, spec, other)
+                    except ValueError as e:
+                        logger.warning(f"Skipping coordinate '{name}' at {other}: {e}")
+
+        for name, spec in (layout.get('coordinates', {}) or {}).items():
+            try:
+                registry.add(name, spec)
+            except ValueError as e:
+                logger.warning(f"Skipping layout coordinate '{name}': {e}")
+
+        for name, spec in (recorded.get(resolution, {}) or {}).items():
+            try:
+                registry.add(name, spec, resolution)
+            except ValueError as e:
+                logger.warning(f"Skipping coordinate '{name}': {e}")
+
+        return registry
+
+
+# Registries per (game, resolution), built once
+_registries: Dict[Tuple[str, str], CoordinateRegistry] = {}
+
+
+def get_coordinate_registry(game_name: str, resolution: Optional[str] = None) -> CoordinateRegistry:
+    """Get the coordinate registry of a game for a resolution
+
+    Args:
+        game_name: Name of the game
+        resolution: Display resolution (default: display.resolution from config)
+    """
+    config = get_config_manager()
+    if resolution is None:
+        resolution = config.get('display.resolution', '5760x1080')
+
+    key = (game_name, resolution)
+    if key not in _registries:
+        _registries[key] = CoordinateRegistry.from_game_config(config.get_game_config(game_name), resolution)
+        logger.debug(f"Resolved {len(_registries[key])} coordinates for {game_name} at {resolution}")
+    return _registries[key]
+
+
+def clear_coordinate_registries():
+    """Drop resolved registries (after the config changed)"""
+    _registries.clear()
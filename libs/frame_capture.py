@@ -0,0 +1,671 @@
+"""
+Shared frame capture service for EvilHotKeys
+
+Every pixel read (get_color, get_multiple_pixel_colors, pixel_search) goes
+through a single service that grabs at most one frame per freshness window
+and hands the same frame to every caller inside that window.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from libs.capture_backends import CHANNEL_INDEX, Box, get_capture_backend, image_to_array
+from libs.environment import is_gnome_wayland, check_gnome_screenshot_support
+from libs.config_manager import get_config_manager
+from libs.logger import get_logger
+
+logger = get_logger('frame_capture')
+
+# Default freshness window in seconds (roughly one frame at 60 FPS)
+DEFAULT_FRESHNESS = 0.015
+
+# Default target rate of the background prefetch thread
+DEFAULT_PREFETCH_FPS = 60
+
+# Mask selecting the 0x00RRGGBB bits of a packed color
+RGB_MASK = 0xFFFFFF
+
+
+def pack_rgb(color: Tuple[int, int, int]) -> int:
+    """Pack an (R, G, B) tuple into a 0x00RRGGBB integer"""
+    r, g, b = color
+    return (int(r) << 16) | (int(g) << 8) | int(b)
+
+
+def unpack_rgb(value: int) -> Tuple[int, int, int]:
+    """Unpack a 0x00RRGGBB integer into an (R, G, B) tuple"""
+    value = int(value)
+    return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+
+
+def pack_pixels(rgb: np.ndarray) -> np.ndarray:
+    """Pack an ...x3 RGB array into a uint32 array of 0x00RRGGBB values"""
+    rgb = np.asarray(rgb)
+    return ((rgb[..., 0].astype(np.uint32) << 16)
+            | (rgb[..., 1].astype(np.uint32) << 8)
+            | rgb[..., 2].astype(np.uint32))
+
+
+class FrameRegion:
+    """One captured box of the screen, anchored at its top-left corner
+
+    Pixels are kept as a read-only array in whatever channel order the
+    backend produced; RGB access reorders channels by index, never by copy.
+    """
+
+    def __init__(self, left: int, top: int, pixels: np.ndarray, channel_order: str = 'RGB'):
+        self.left = left
+        self.top = top
+        self.pixels = pixels
+        self.channel_order = channel_order
+        self.height, self.width = pixels.shape[:2]
+        r, g, b = CHANNEL_INDEX[channel_order]
+        self.rgb_index = (r, g, b)
+        # Slice picking R, G, B in order; a basic slice keeps views views
+        self._rgb_slice = slice(0, 3) if r == 0 else slice(2, None, -1)
+        self._packed: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_image(cls, left: int, top: int, image) -> 'FrameRegion':
+        """Build a region from a PIL image"""
+        return cls(left, top, image_to_array(image), 'RGB')
+
+    def contains(self, x: int, y: int) -> bool:
+        """Check if absolute screen coordinates fall inside this region"""
+        return (self.left <= x < self.left + self.width and
+                self.top <= y < self.top + self.height)
+
+    def contains_box(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """Check if an (x1, y1, x2, y2) box, x2/y2 exclusive, fits in this region"""
+        return (self.left <= x1 and self.top <= y1 and
+                x2 <= self.left + self.width and y2 <= self.top + self.height)
+
+    def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        """Get the (R, G, B) color at absolute screen coordinates"""
+        pixel = self.pixels[y - self.top, x - self.left]
+        r, g, b = self.rgb_index
+        return (int(pixel[r]), int(pixel[g]), int(pixel[b]))
+
+    def rgb_view(self, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+        """Get an HxWx3 RGB view of a box in absolute screen coordinates"""
+        return self.pixels[y1 - self.top:y2 - self.top, x1 - self.left:x2 - self.left, self._rgb_slice]
+
+    @property
+    def packed(self) -> np.ndarray:
+        """The whole region as a read-only HxW uint32 array of 0x00RRGGBB values
+
+        Built once per region; use packed_view() for part of a large region.
+        """
+        if self._packed is None:
+            packed = self.packed_view(self.left, self.top, self.left + self.width, self.top + self.height)
+            packed.flags.writeable = False
+            self._packed = packed
+        return self._packed
+
+    def packed_view(self, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+        """Get an HxW packed 0x00RRGGBB array of a box in absolute screen coordinates
+
+        Only the box is packed, never the whole region (a full desktop is
+        tens of MB). Little-endian BGRA pixels already are 0xAARRGGBB words,
+        so they only need the alpha byte masked off.
+        """
+        if self._packed is not None:
+            return self._packed[y1 - self.top:y2 - self.top, x1 - self.left:x2 - self.left]
+        if (self.channel_order == 'BGRA' and self.pixels.flags.c_contiguous
+                and self.pixels.dtype.byteorder in ('=', '|') and np.little_endian):
+            words = self.pixels.view(np.uint32).reshape(self.height, self.width)
+            return words[y1 - self.top:y2 - self.top, x1 - self.left:x2 - self.left] & RGB_MASK
+        return pack_pixels(self.rgb_view(x1, y1, x2, y2))
+
+
+class Frame:
+    """A set of captured screen regions and the time they were taken"""
+
+    def __init__(self, regions: List[FrameRegion], timestamp: float):
+        self.regions = regions
+        self.timestamp = timestamp
+        self.sequence = 0  # Assigned by the capture service when published
+
+    @classmethod
+    def from_image(cls, image, timestamp: float, left: int = 0, top: int = 0) -> 'Frame':
+        """Build a frame from a single PIL image"""
+        return cls([FrameRegion.from_image(left, top, image)], timestamp)
+
+    @property
+    def age(self) -> float:
+        """Seconds since this frame was captured"""
+        return time.time() - self.timestamp
+
+    def find_region(self, x: int, y: int) -> Optional[FrameRegion]:
+        """Get the region containing absolute screen coordinates"""
+        for region in self.regions:
+            if region.contains(x, y):
+                return region
+        return None
+
+    def find_region_for_box(self, x1: int, y1: int, x2: int, y2: int) -> Optional[FrameRegion]:
+        """Get the region holding the whole (x1, y1, x2, y2) box"""
+        for region in self.regions:
+            if region.contains_box(x1, y1, x2, y2):
+                return region
+        return None
+
+    def covers(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """Check if one region holds the whole (x1, y1, x2, y2) box"""
+        return self.find_region_for_box(x1, y1, x2, y2) is not None
+
+    def get_pixel(self, x: int, y: int) -> Optional[Tuple[int, int, int]]:
+        """Get the (R, G, B) color at absolute screen coordinates
+
+        Returns None if the pixel is outside every captured region.
+        """
+        region = self.find_region(x, y)
+        if region is None:
+            return None
+        return region.get_pixel(x, y)
+
+    def get_array(self, x1: int, y1: int, x2: int, y2: int) -> Optional[np.ndarray]:
+        """Get an HxWx3 RGB view of the box between two absolute screen coordinates
+
+        Returns None if no single captured region holds the whole box.
+        """
+        region = self.find_region_for_box(x1, y1, x2, y2)
+        if region is None:
+            return None
+        return region.rgb_view(x1, y1, x2, y2)
+
+    def get_packed(self, x1: int, y1: int, x2: int, y2: int) -> Optional[np.ndarray]:
+        """Get an HxW packed 0x00RRGGBB view of the box between two absolute screen coordinates
+
+        Returns None if no single captured region holds the whole box.
+        """
+        region = self.find_region_for_box(x1, y1, x2, y2)
+        if region is None:
+            return None
+        return region.packed_view(x1, y1, x2, y2)
+
+    def sample(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Read many pixels at once with fancy indexing
+
+        Args:
+            xs: Array of absolute X coordinates
+            ys: Array of absolute Y coordinates
+
+        Returns:
+            Tuple of (Nx3 RGB array, N-length bool array of pixels found in the frame)
+        """
+        colors = np.zeros((len(xs), 3), dtype=np.int32)
+        found = np.zeros(len(xs), dtype=bool)
+        for region in self.regions:
+            inside = ((xs >= region.left) & (xs < region.left + region.width) &
+                      (ys >= region.top) & (ys < region.top + region.height) & ~found)
+            if not inside.any():
+                continue
+            pixels = region.pixels[ys[inside] - region.top, xs[inside] - region.left]
+            colors[inside] = pixels[:, region.rgb_index]
+            found |= inside
+        return colors, found
+
+
+class FrameCaptureService:
+    """Captures screen frames and shares them between all pixel readers"""
+
+    def __init__(self, freshness: Optional[float] = None):
+        """Initialize the capture service.
+
+        Args:
+            freshness: Maximum age in seconds of a shared frame
+                       (default: performance.frame_freshness from config)
+        """
+        if freshness is None:
+            freshness = get_config_manager().get('performance.frame_freshness', DEFAULT_FRESHNESS)
+
+        self.freshness = freshness
+        self.base_freshness = freshness
+        self._freshness_requests: Dict[str, float] = {}
+        self._frame: Optional[Frame] = None
+        self._lock = threading.Lock()
+        self._frame_published = threading.Condition(self._lock)
+        self._sequence = 0
+        self._prefetch_thread: Optional[threading.Thread] = None
+        self._prefetch_stop = threading.Event()
+        self._wayland_supported: Optional[bool] = None
+        self._gnome_manager = None
+        self._capture_plan: List[Box] = []
+        self.hits = 0
+        self.misses = 0
+        self.uncovered = 0
+        self.prefetched = 0
+
+    def _get_wayland_support(self) -> bool:
+        """Check if Wayland support is available"""
+        if self._wayland_supported is None:
+            self._wayland_supported = is_gnome_wayland() and check_gnome_screenshot_support()
+        return self._wayland_supported
+
+    def _get_gnome_manager(self):
+        """Get the GNOME screenshot manager"""
+        if self._gnome_manager is None and self._get_wayland_support():
+            try:
+                from libs.gnome_screenshot import get_gnome_screenshot_manager
+                self._gnome_manager = get_gnome_screenshot_manager()
+            except ImportError as e:
+                logger.error(f"Failed to import GNOME screenshot support: {e}")
+                logger.info("Install required dependencies: dbus-python PyGObject")
+        return self._gnome_manager
+
+    def _grab_region(self, box: Optional[Box] = None) -> FrameRegion:
+        """Grab one (x1, y1, x2, y2) box of the screen (or all of it)"""
+        pixels, channel_order = get_capture_backend().grab_array(box)
+        left, top = (box[0], box[1]) if box else (0, 0)
+        return FrameRegion(left, top, pixels, channel_order)
+
+    def _capture(self, force_new: bool = False) -> Optional[Frame]:
+        """Grab a new frame from the active backend
+
+        Args:
+            force_new: Bypass the GNOME full-screenshot cache on Wayland
+        """
+        # Use Wayland/GNOME backend if available
+        if self._get_wayland_support():
+            gnome_manager = self._get_gnome_manager()
+            if gnome_manager:
+                # With a capture plan, grab just the planned boxes so the
+                # freshness window applies instead of the full-screen cache
+                if self._capture_plan:
+                    timestamp = time.time()
+                    regions = []
+                    for box in self._capture_plan:
+                        image = gnome_manager.capture_area(*box)
+                        if image is None:
+                            break
+                        regions.append(FrameRegion.from_image(box[0], box[1], image))
+                    else:
+                        return Frame(regions, timestamp)
+                pixels = gnome_manager.get_screenshot_array(force_new)
+                if pixels is None:
+                    return None
+                return Frame([FrameRegion(0, 0, pixels)], gnome_manager.session_timestamp)
+
+        # Fall back to X11 backend, grabbing only the planned boxes if any
+        timestamp = time.time()
+        if self._capture_plan:
+            return Frame([self._grab_region(box) for box in self._capture_plan], timestamp)
+        return Frame([self._grab_region()], timestamp)
+
+    def _read_uncovered(self, x1: int, y1: int, x2: int, y2: int) -> Optional[FrameRegion]:
+        """Grab a box the capture plan does not cover"""
+        self.uncovered += 1
+        if self._get_wayland_support() and self._get_gnome_manager():
+            image = self._get_gnome_manager().get_region_screenshot(x1, y1, x2, y2)
+            return FrameRegion.from_image(x1, y1, image) if image is not None else None
+        return self._grab_region((x1, y1, x2, y2))
+
+    def set_capture_plan(self, boxes: List[Box]):
+        """Capture only these (x1, y1, x2, y2) boxes instead of the full desktop
+
+        Reads outside the plan still work but grab their own pixels.
+        """
+        with self._lock:
+            self._capture_plan = list(boxes)
+            self._frame = None
+
+    def clear_capture_plan(self):
+        """Go back to capturing the full desktop"""
+        self.set_capture_plan([])
+
+    def request_freshness(self, owner: str, seconds: float):
+        """Ask for a freshness window (e.g. matched to a rotation's tick rate)
+
+        The strictest (shortest) window among active requests applies; with
+        no requests the configured window does.
+        """
+        with self._lock:
+            self._freshness_requests[owner] = seconds
+            self._apply_freshness()
+
+    def release_freshness(self, owner: str):
+        """Drop a freshness request"""
+        with self._lock:
+            self._freshness_requests.pop(owner, None)
+            self._apply_freshness()
+
+    def _apply_freshness(self):
+        """Must be called with the lock held"""
+        requests = self._freshness_requests.values()
+        freshness = min(requests) if requests else self.base_freshness
+        if freshness != self.freshness:
+            logger.debug(f"Frame freshness {self.freshness * 1000:.0f}ms -> {freshness * 1000:.0f}ms")
+        self.freshness = freshness
+
+    def _publish(self, frame: Frame):
+        """Make a frame the shared frame and wake anyone waiting for it
+
+        Must be called with the lock held.
+        """
+        self._sequence += 1
+        frame.sequence = self._sequence
+        self._frame = frame
+        self._frame_published.notify_all()
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the latest published frame"""
+        return self._sequence
+
+    @property
+    def prefetching(self) -> bool:
+        """Whether the background prefetch thread is running"""
+        return self._prefetch_thread is not None and self._prefetch_thread.is_alive()
+
+    def get_frame(self, max_age: Optional[float] = None) -> Optional[Frame]:
+        """Get a frame no older than the freshness window.
+
+        While prefetching, this returns the latest frame without ever
+        blocking on capture (max_age is then only a hint to the thread).
+        On Wayland without a capture plan, frames come from GNOME's
+        full-screen cache and can be up to its cache_duration old.
+
+        Args:
+            max_age: Override the freshness window for this call
+
+        Returns:
+            Shared Frame or None if capture failed
+        """
+        if max_age is None:
+            max_age = self.freshness
+
+        with self._lock:
+            frame = self._frame
+            if self.prefetching:
+                if frame is None:
+                    # Only happens before the first frame or after a plan change
+                    self._frame_published.wait(timeout=1.0)
+                    frame = self._frame
+                if frame is not None:
+                    self.hits += 1
+                return frame
+
+            if frame is not None and frame.age < max_age:
+                self.hits += 1
+                return frame
+
+            try:
+                captured = self._capture()
+            except Exception as e:
+                self.misses += 1
+                logger.error(f"Error capturing frame: {e}")
+                return None
+
+            if captured is not None and frame is not None and captured.timestamp <= frame.timestamp:
+                # The GNOME full-screen cache handed back the screenshot we
+                # already hold: same pixels, so no new frame or sequence
+                self.hits += 1
+                return frame
+            self.misses += 1
+            if captured is not None:
+                self._publish(captured)
+            return captured
+
+    def _capture_now(self) -> Optional[Frame]:
+        """Capture and publish a brand new frame, bypassing every cache"""
+        with self._lock:
+            self.misses += 1
+            try:
+                frame = self._capture(force_new=True)
+            except Exception as e:
+                logger.error(f"Error capturing frame: {e}")
+                return None
+            if frame is not None:
+                self._publish(frame)
+            return frame
+
+    def wait_for_frame(self, newer_than: int, timeout: Optional[float] = None) -> Optional[Frame]:
+        """Wait for a frame with a sequence number above newer_than.
+
+        Args:
+            newer_than: Sequence number the caller has already seen
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            The newer frame, or None on timeout or capture failure
+        """
+        if not self.prefetching:
+            # Nothing captures in the background, so capture one now
+            return self._capture_now()
+
+        with self._lock:
+            if not self._frame_published.wait_for(
+                    lambda: self._frame is not None and self._frame.sequence > newer_than,
+                    timeout=timeout):
+                return None
+            return self._frame
+
+    def wait_for_frame_after(self, timestamp: float, timeout: Optional[float] = None) -> Optional[Frame]:
+        """Wait for a frame captured after a point in time.
+
+        Use this after sending a key so verification never looks at a frame
+        taken before the key went out. Pass the returned frame to the reads
+        that verify it: it also becomes the shared frame, but a later
+        get_frame() captures again once it is older than the freshness window.
+
+        Args:
+            timestamp: time.time() value the frame must be newer than
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            The newer frame, or None on timeout or capture failure
+        """
+        with self._lock:
+            frame = self._frame
+            if frame is not None and frame.timestamp > timestamp:
+                self.hits += 1
+                return frame
+
+            if self.prefetching:
+                if not self._frame_published.wait_for(
+                        lambda: self._frame is not None and self._frame.timestamp > timestamp,
+                        timeout=timeout):
+                    return None
+                return self._frame
+
+        # Captures record when they started, so don't start before timestamp
+        delay = timestamp - time.time()
+        if delay > 0:
+            if timeout is not None and delay > timeout:
+                return None
+            time.sleep(delay)
+        return self._capture_now()
+
+    def start_prefetch(self, fps: Optional[float] = None):
+        """Start a background thread that keeps the shared frame refreshed.
+
+        Frames are captured into a back buffer outside the lock and then
+        swapped in, so readers never wait on a capture.
+
+        Args:
+            fps: Target capture rate (default: performance.prefetch_fps from config)
+        """
+        if self.prefetching:
+            return
+        if fps is None:
+            fps = get_config_manager().get('performance.prefetch_fps', DEFAULT_PREFETCH_FPS)
+
+        self._prefetch_stop.clear()
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_loop, args=(1.0 / fps,), name='frame-prefetch', daemon=True)
+        self._prefetch_thread.start()
+        logger.info(f"Started frame prefetch at {fps} FPS")
+
+    def stop_prefetch(self, timeout: float = 1.0):
+        """Stop the background prefetch thread"""
+        thread = self._prefetch_thread
+        if thread is None:
+            return
+        self._prefetch_stop.set()
+        thread.join(timeout=timeout)
+        self._prefetch_thread = None
+
+    def _prefetch_loop(self, interval: float):
+        """Capture frames continuously until stopped"""
+        next_capture = time.monotonic()
+        try:
+            while not self._prefetch_stop.is_set():
+                try:
+                    # Bypass the GNOME screenshot cache, or the loop would
+                    # republish one old screenshot at the prefetch rate
+                    frame = self._capture(force_new=True)
+                except Exception as e:
+                    logger.error(f"Error capturing frame: {e}")
+                    frame = None
+
+                with self._lock:
+                    # Only pixels newer than the shared frame get a new sequence number
+                    if frame is not None and (self._frame is None or frame.timestamp > self._frame.timestamp):
+                        self.prefetched += 1
+                        self._publish(frame)
+
+                # Keep a steady rate; if capture overran, don't try to catch up
+                next_capture = max(next_capture + interval, time.monotonic())
+                self._prefetch_stop.wait(next_capture - time.monotonic())
+        finally:
+            get_capture_backend().close()
+
+    def get_color(self, x: int, y: int, frame: Optional[Frame] = None) -> Optional[Tuple[int, int, int]]:
+        """Get the color of one pixel from a frame (default: the shared frame)"""
+        if frame is None:
+            frame = self.get_frame()
+        if frame is None:
+            return None
+        return self._get_pixel(frame, x, y)
+
+    def get_colors(self, coordinates, frame: Optional[Frame] = None) -> List[Optional[Tuple[int, int, int]]]:
+        """Get the colors of several pixels from one frame (default: the shared frame)"""
+        if frame is None:
+            frame = self.get_frame()
+        if frame is None:
+            return [None] * len(coordinates)
+        return [self._get_pixel(frame, x, y) for (x, y) in coordinates]
+
+    def _get_pixel(self, frame: Frame, x: int, y: int) -> Optional[Tuple[int, int, int]]:
+        """Read one pixel from a frame, grabbing it directly if uncovered"""
+        region = frame.find_region(x, y)
+        if region is None:
+            region = self._read_uncovered(x, y, x + 1, y + 1)
+            if region is None:
+                return None
+        try:
+            return region.get_pixel(x, y)
+        except Exception as e:
+            logger.error(f"Error getting pixel color at ({x}, {y}): {e}")
+            return None
+
+    def sample(self, xs: np.ndarray, ys: np.ndarray, frame: Optional[Frame] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Read many pixels from one shared frame with a single vectorized lookup
+
+        Args:
+            xs: Array of absolute X coordinates
+            ys: Array of absolute Y coordinates
+            frame: Frame to read from (default: the shared frame)
+
+        Returns:
+            Tuple of (Nx3 RGB array, N-length bool array of pixels that could be read)
+        """
+        if frame is None:
+            frame = self.get_frame()
+        if frame is None:
+            return np.zeros((len(xs), 3), dtype=np.int32), np.zeros(len(xs), dtype=bool)
+
+        colors, found = frame.sample(xs, ys)
+        for i in np.flatnonzero(~found):
+            color = self._get_pixel(frame, int(xs[i]), int(ys[i]))
+            if color is not None:
+                colors[i] = color
+                found[i] = True
+        return colors, found
+
+    def get_region(self, x1: int, y1: int, x2: int, y2: int, packed: bool = False) -> Optional[np.ndarray]:
+        """Get a region of the shared frame as an array view
+
+        Args:
+            x1, y1: Top-left corner of the region
+            x2, y2: Bottom-right corner of the region (exclusive)
+            packed: Return an HxW uint32 array of 0x00RRGGBB values
+                    instead of an HxWx3 RGB array
+
+        Returns:
+            Array view of the region, or None if it could not be captured
+        """
+        # Without a plan on X11, grabbing just the box is far cheaper than
+        # the full desktop, unless a fresh shared frame already holds it
+        if not self._capture_plan and not self.prefetching and not self._get_wayland_support():
+            frame = self._frame
+            if frame is None or frame.age >= self.freshness or frame.find_region_for_box(x1, y1, x2, y2) is None:
+                self.misses += 1
+                try:
+                    region = self._grab_region((x1, y1, x2, y2))
+                except Exception as e:
+                    logger.error(f"Error capturing region ({x1}, {y1}, {x2}, {y2}): {e}")
+                    return None
+                return region.packed_view(x1, y1, x2, y2) if packed else region.rgb_view(x1, y1, x2, y2)
+
+        # Boxes outside the capture plan are grabbed on their own (an area
+        # capture on Wayland); plan the box to share it with other readers
+        frame = self.get_frame()
+        if frame is None:
+            return None
+        pixels = frame.get_packed(x1, y1, x2, y2) if packed else frame.get_array(x1, y1, x2, y2)
+        if pixels is None:
+            region = self._read_uncovered(x1, y1, x2, y2)
+            if region is None:
+                return None
+            pixels = region.packed_view(x1, y1, x2, y2) if packed else region.rgb_view(x1, y1, x2, y2)
+        return pixels
+
+    def invalidate(self):
+        """Drop the shared frame so the next read captures a new one"""
+        with self._lock:
+            self._frame = None
+
+    def set_freshness(self, seconds: float):
+        """Set the configured freshness window in seconds
+
+        Active request_freshness() requests still win while they are shorter.
+        """
+        with self._lock:
+            self.base_freshness = seconds
+            self._apply_freshness()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get frame cache hit/miss counters.
+
+        Returns:
+            Dict with hits, misses, uncovered reads, prefetched frames and hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'uncovered': self.uncovered,
+            'prefetched': self.prefetched,
+            'hit_rate': (self.hits / total) if total else 0.0
+        }
+
+    def reset_stats(self):
+        """Reset the hit/miss counters"""
+        self.hits = 0
+        self.misses = 0
+        self.uncovered = 0
+        self.prefetched = 0
+
+
+# Global instance
+_frame_capture_service: Optional[FrameCaptureService] = None
+
+
+def get_frame_capture_service() -> FrameCaptureService:
+    """Get the global frame capture service instance"""
+    global _frame_capture_service
+    if _frame_capture_service is None:
+        _frame_capture_service = FrameCaptureService()
+    return _frame_capture_service
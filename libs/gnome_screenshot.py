@@ -1,23 +1,41 @@
+import atexit
 import dbus
 import tempfile
 import os
+import threading
 import time
 from PIL import Image
 import io
+from libs.capture_backends import image_to_array
 from libs.logger import get_logger
 
 logger = get_logger('gnome_screenshot')
 
+def _get_capture_dir():
+    """Get a RAM-backed directory for GNOME to write screenshots into"""
+    for path in (os.environ.get('XDG_RUNTIME_DIR'), '/dev/shm'):
+        if path and os.path.isdir(path) and os.access(path, os.W_OK):
+            return path
+    return tempfile.gettempdir()
+
 class GnomeScreenshotManager:
     """Manager for GNOME Wayland screenshot functionality"""
     
     def __init__(self):
         self.bus = None
         self.screenshot_interface = None
+        self.area_interface = None
+        self.capture_dir = _get_capture_dir()
+        self._capture_paths = set()
         self.permission_granted = False
         self.session_screenshot = None  # Cache for screenshot
+        self.session_pixels = None  # Read-only RGB array of the cached screenshot
         self.session_timestamp = 0
         self.cache_duration = 0.5  # Increased from 0.1 to 0.5 seconds
+        self.region_cache = {}  # (x1, y1, x2, y2) -> (image, timestamp)
+        self._region_lock = threading.Lock()  # Region reads come from several threads
+        self.region_cache_duration = 0.02  # Area captures are cheap, keep them fresh
+        self.region_cache_size = 32
         self.debug_timing = False  # Set to True to enable timing output
         self._initialize_dbus()
     
@@ -28,6 +46,9 @@ class GnomeScreenshotManager:
             self.screenshot_interface = self.bus.get_object(
                 'org.gnome.Shell', '/org/gnome/Shell'
             ).get_dbus_method('Screenshot', 'org.gnome.Shell.Screenshot')
+            self.area_interface = self.bus.get_object(
+                'org.gnome.Shell', '/org/gnome/Shell'
+            ).get_dbus_method('ScreenshotArea', 'org.gnome.Shell.Screenshot')
             return True
         except Exception as e:
             logger.error(f"Failed to initialize D-Bus connection: {e}")
@@ -53,6 +74,32 @@ class GnomeScreenshotManager:
             logger.error(f"Error requesting permission: {e}")
             return False
     
+    def _get_capture_path(self):
+        """Get this thread's reusable capture file in the RAM-backed capture dir"""
+        path = os.path.join(self.capture_dir, f'evilhotkeys-{os.getpid()}-{threading.get_ident()}.png')
+        if path not in self._capture_paths:
+            self._capture_paths.add(path)
+            atexit.register(self._remove_capture_file, path)
+        return path
+    
+    @staticmethod
+    def _remove_capture_file(path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    
+    def _load_capture(self, path):
+        """Read a capture file into memory and decode it"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        image = Image.open(io.BytesIO(data))
+        image.load()
+        # Convert to RGB if needed
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return image
+    
     def _take_screenshot_internal(self):
         """Internal method to take screenshot using D-Bus"""
         if not self.screenshot_interface:
@@ -61,9 +108,9 @@ class GnomeScreenshotManager:
         start_time = time.time()
         
         try:
-            # Create a temporary file for the screenshot
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                tmp_path = tmp_file.name
+            # GNOME writes into a reused file on tmpfs, so there is no disk
+            # I/O and no temp file to create and delete on every capture
+            tmp_path = self._get_capture_path()
             
             # Take screenshot
             dbus_start = time.time()
@@ -74,32 +121,25 @@ class GnomeScreenshotManager:
             )
             dbus_time = time.time() - dbus_start
             
-            if result:
-                # Load the image and delete the temporary file
+            if result and result[0]:
                 load_start = time.time()
-                try:
-                    image = Image.open(tmp_path)
-                    # Convert to RGB if needed
-                    if image.mode != 'RGB':
-                        image = image.convert('RGB')
-                    
-                    # Cache the screenshot
-                    self.session_screenshot = image
-                    self.session_timestamp = time.time()
-                    
-                    load_time = time.time() - load_start
-                    total_time = time.time() - start_time
-                    
-                    if self.debug_timing:
-                        logger.debug(f"Screenshot timing - D-Bus: {dbus_time:.3f}s, Load: {load_time:.3f}s, Total: {total_time:.3f}s")
-                    
-                    return True
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.unlink(tmp_path)
-                    except:
-                        pass
+                image = self._load_capture(tmp_path)
+                
+                # Cache the screenshot and its pixel array
+                self.session_screenshot = image
+                self.session_pixels = image_to_array(image)
+                # Stamp the request, not its end: the pixels can be as old as
+                # the D-Bus call, so a frame stamped after it could pass for
+                # one captured after a key that went out mid-call
+                self.session_timestamp = dbus_start
+                
+                load_time = time.time() - load_start
+                total_time = time.time() - start_time
+                
+                if self.debug_timing:
+                    logger.debug(f"Screenshot timing - D-Bus: {dbus_time:.3f}s, Load: {load_time:.3f}s, Total: {total_time:.3f}s")
+                
+                return True
             
             return False
             
@@ -107,6 +147,40 @@ class GnomeScreenshotManager:
             logger.error(f"Error taking screenshot: {e}")
             return False
     
+    def capture_area(self, x1, y1, x2, y2):
+        """Capture just the (x1, y1, x2, y2) box, x2/y2 exclusive, using ScreenshotArea
+        
+        Much cheaper than a full-desktop screenshot since GNOME only encodes
+        the requested pixels. Not cached; callers decide how fresh they need it.
+        
+        Returns:
+            RGB image of the box or None if capture failed
+        """
+        if not self.area_interface:
+            return None
+        if not self.permission_granted:
+            if not self.request_permission():
+                return None
+        
+        try:
+            tmp_path = self._get_capture_path()
+            start_time = time.time()
+            result = self.area_interface(
+                x1, y1, x2 - x1, y2 - y1,
+                False,  # flash
+                tmp_path
+            )
+            if not (result and result[0]):
+                return None
+            
+            image = self._load_capture(tmp_path)
+            if self.debug_timing:
+                logger.debug(f"Area screenshot ({x2 - x1}x{y2 - y1}) took {time.time() - start_time:.3f}s")
+            return image
+        except Exception as e:
+            logger.error(f"Error capturing area ({x1}, {y1}, {x2}, {y2}): {e}")
+            return None
+    
     def get_screenshot(self, force_new=False):
         """Get a screenshot, using cache if available"""
         if not self.permission_granted:
@@ -133,27 +207,34 @@ class GnomeScreenshotManager:
         
         return None
     
+    def get_screenshot_array(self, force_new=False):
+        """Get the screenshot as a read-only HxWx3 RGB array"""
+        if self.get_screenshot(force_new) is None:
+            return None
+        return self.session_pixels
+    
     def get_pixel_color(self, x, y):
         """Get color of pixel at coordinates"""
-        screenshot = self.get_screenshot()
-        if screenshot:
+        pixels = self.get_screenshot_array()
+        if pixels is not None:
             try:
-                return screenshot.getpixel((x, y))
+                r, g, b = pixels[y, x]
+                return (int(r), int(g), int(b))
             except Exception as e:
                 logger.error(f"Error getting pixel color at ({x}, {y}): {e}")
         return None
     
     def get_multiple_pixel_colors(self, coordinates):
         """Get colors of multiple pixels efficiently using one screenshot"""
-        screenshot = self.get_screenshot()
-        if not screenshot:
+        pixels = self.get_screenshot_array()
+        if pixels is None:
             return [None] * len(coordinates)
         
         colors = []
         for (x, y) in coordinates:
             try:
-                color = screenshot.getpixel((x, y))
-                colors.append(color)
+                r, g, b = pixels[y, x]
+                colors.append((int(r), int(g), int(b)))
             except Exception as e:
                 logger.error(f"Error getting pixel color at ({x}, {y}): {e}")
                 colors.append(None)
@@ -161,19 +242,55 @@ class GnomeScreenshotManager:
         return colors
     
     def get_region_screenshot(self, x1, y1, x2, y2):
-        """Get screenshot of a specific region"""
-        screenshot = self.get_screenshot()
-        if screenshot:
+        """Get screenshot of a specific region
+        
+        Uses ScreenshotArea for just the requested box, with its own cache per
+        box, so searches don't pay for a full-desktop screenshot. A fresh
+        full screenshot is cropped instead if one is already cached.
+        """
+        box = (x1, y1, x2, y2)
+        current_time = time.time()
+        
+        with self._region_lock:
+            cached = self.region_cache.get(box)
+        if cached and current_time - cached[1] < self.region_cache_duration:
+            return cached[0]
+        
+        # Reuse the full screenshot if it's at least as fresh as we need
+        if (self.session_screenshot and
+                current_time - self.session_timestamp < self.region_cache_duration):
             try:
-                return screenshot.crop((x1, y1, x2, y2))
+                return self.session_screenshot.crop(box)
             except Exception as e:
                 logger.error(f"Error cropping region ({x1}, {y1}, {x2}, {y2}): {e}")
-        return None
+        
+        image = self.capture_area(x1, y1, x2, y2)
+        if image is None:
+            # Fall back to cropping a full screenshot
+            screenshot = self.get_screenshot()
+            if screenshot:
+                try:
+                    return screenshot.crop(box)
+                except Exception as e:
+                    logger.error(f"Error cropping region ({x1}, {y1}, {x2}, {y2}): {e}")
+            return None
+        
+        with self._region_lock:
+            if box not in self.region_cache and len(self.region_cache) >= self.region_cache_size:
+                # Evict the oldest region
+                oldest = min(self.region_cache, key=lambda key: self.region_cache[key][1])
+                del self.region_cache[oldest]
+            self.region_cache[box] = (image, time.time())
+        return image
     
     def set_cache_duration(self, seconds):
         """Set the cache duration in seconds"""
         self.cache_duration = seconds
     
+    def set_region_cache_duration(self, seconds):
+        """Set the per-region cache duration in seconds"""
+        self.region_cache_duration = seconds
+    
     def enable_debug_timing(self, enable=True):
         """Enable or disable debug timing output"""
         self.debug_timing = enable
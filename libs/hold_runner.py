@@ -0,0 +1,171 @@
+"""
+Hold-to-run rotations for EvilHotKeys
+
+Most specs wrap their rotation in the same loop:
+
+    while not stop_event.is_set() and keyboard.is_pressed(key):
+        ...one pass...
+        time.sleep(0.2)
+
+The runner owns that loop instead. A spec binds one pass of a rotation to a
+key; the pass starts on the keydown event (no polling delay), repeats every
+`period` seconds while the key is held, and is cancelled on keyup or stop
+(the wait between passes wakes at once, no trailing sleep to sit out).
+
+Every binding runs on its own worker from a small pool, so two held keys
+run their rotations side by side instead of one waiting for the other.
+Keys still go out through the input scheduler, one at a time; use
+press_with_modifier() for chords so concurrent rotations cannot split them.
+
+Example:
+    runner = HoldRunner()
+    runner.bind(KEYS.numpad4, attack_pass, period=0.2)
+    runner.bind(KEYS.numpad2, shield_pass, period=0.2)
+    runner.run(stop_event)                          # until stop_event is set
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+from libs.capture_backends import get_capture_backend
+from libs.key_state import get_key_state
+from libs.logger import get_logger
+
+logger = get_logger('hold_runner')
+
+# Seconds between two passes of a held rotation
+DEFAULT_PERIOD = 0.2
+
+# Upper bound on workers (one per binding up to this)
+MAX_WORKERS = 4
+
+# Seconds run() waits for running passes to finish after stop
+STOP_TIMEOUT = 1.0
+
+
+class HoldBinding:
+    """One pass of a rotation bound to a held key"""
+
+    def __init__(self, key: Any, step: Callable[[], Any], period: float, name: str):
+        self.key = key
+        self.codes = frozenset(get_key_state().scan_codes(key))
+        self.step = step
+        self.period = period
+        self.name = name
+        self.cancel = threading.Event()  # Set on keyup or stop
+        self.running = False
+        self.future: Optional[Future] = None
+
+        # Statistics
+        self.holds = 0
+        self.passes = 0
+
+
+class HoldRunner:
+    """Runs bound rotations while their keys are held"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the runner.
+
+        Args:
+            max_workers: Worker threads (default: one per binding, up to MAX_WORKERS)
+        """
+        self.max_workers = max_workers
+        self._bindings: List[HoldBinding] = []
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def bind(self, key: Any, step: Callable[[], Any], period: float = DEFAULT_PERIOD,
+             name: Optional[str] = None) -> HoldBinding:
+        """Run step() every period seconds while key is held.
+
+        Args:
+            key: Trigger key (scan code or key name)
+            step: One pass of the rotation; must not loop on the key itself
+            period: Seconds from the end of one pass to the start of the next
+            name: Name for logging (default: the step's function name)
+        """
+        binding = HoldBinding(key, step, period, name or getattr(step, '__name__', str(key)))
+        self._bindings.append(binding)
+        return binding
+
+    def _on_key(self, code: int, down: bool, repeat: bool):
+        """Key state listener: start or cancel the bindings on the key"""
+        if repeat:
+            return
+        for binding in self._bindings:
+            if code in binding.codes:
+                if down:
+                    self._start(binding)
+                else:
+                    binding.cancel.set()
+
+    def _start(self, binding: HoldBinding):
+        """Start a binding's hold (or keep the current one going)"""
+        with self._lock:
+            if self._pool is None:
+                return
+            binding.cancel.clear()
+            if binding.running:
+                return  # Re-pressed before the last pass finished: carry on
+            binding.running = True
+            binding.holds += 1
+            binding.future = self._pool.submit(self._hold, binding)
+
+    def _hold(self, binding: HoldBinding):
+        """Worker: run passes until the binding is cancelled"""
+        logger.debug(f"{binding.name} started")
+        try:
+            while True:
+                if not binding.cancel.is_set():
+                    try:
+                        binding.step()
+                    except Exception as e:
+                        logger.error(f"Error in {binding.name}: {e}")
+                    binding.passes += 1
+                    if not binding.cancel.wait(binding.period):
+                        continue
+                with self._lock:
+                    # A keydown between the cancel and here cleared it again
+                    if binding.cancel.is_set():
+                        binding.running = False
+                        break
+        finally:
+            binding.running = False
+        logger.debug(f"{binding.name} stopped")
+
+    def run(self, stop_event: threading.Event):
+        """Run bound rotations on the worker pool until stop_event is set"""
+        workers = self.max_workers or max(1, min(len(self._bindings), MAX_WORKERS))
+        key_state = get_key_state()
+        with self._lock:
+            self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hold')
+        key_state.add_listener(self._on_key)
+        try:
+            # Keys already held when the spec started get no keydown event
+            for binding in self._bindings:
+                if key_state.is_pressed(binding.key):
+                    self._start(binding)
+            stop_event.wait()
+        finally:
+            key_state.remove_listener(self._on_key)
+            with self._lock:
+                pool, self._pool = self._pool, None
+                for binding in self._bindings:
+                    binding.cancel.set()
+            running = [b.future for b in self._bindings if b.future is not None]
+            _, not_done = wait(running, timeout=STOP_TIMEOUT)
+            if not_done:
+                logger.warning(f"{len(not_done)} rotation(s) still running after stop")
+            # Once the workers have exited, close the capture handles they
+            # opened (idle ones included); stragglers are reaped on the next open
+            pool.shutdown(wait=not not_done)
+            get_capture_backend().reap()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-binding statistics.
+
+        Returns:
+            {name: {'holds', 'passes', 'running'}}
+        """
+        return {b.name: {'holds': b.holds, 'passes': b.passes, 'running': b.running}
+                for b in self._bindings}
@@ -0,0 +1,148 @@
+"""
+Event-driven hotkey dispatch for EvilHotKeys
+
+Specs used to spin on keyboard.is_pressed() for every trigger key with a
+50-100ms sleep between rounds, so a keypress could wait up to 100ms to be
+noticed and the loop burned CPU while idle. The dispatcher listens to
+keyboard events instead (through the shared key state, libs.key_state), and
+registered handlers are queued the moment their key goes down.
+
+Handlers run one at a time on the thread that called run(), never on the
+keyboard hook thread, so a slow handler cannot delay event delivery. A
+binding is queued at most once: pressing its key again while it is still
+waiting to run does not stack up another run.
+
+Example:
+    hotkeys = HotkeyDispatcher()
+    hotkeys.on_press(KEYS.numpad1, shaman_stream)          # once per keydown
+    hotkeys.on_hold(KEYS.numpad2, rotation_step)           # repeatedly while held
+    hotkeys.on_release(KEYS.numpad3, lambda: print('up'))
+    hotkeys.run(stop_event)                                # until stop_event is set
+"""
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from libs.key_state import get_key_state
+from libs.logger import get_logger
+
+logger = get_logger('hotkeys')
+
+# How often run() re-checks the stop event while idle
+STOP_CHECK_INTERVAL = 0.05
+
+
+class Binding:
+    """A handler bound to one key"""
+
+    def __init__(self, key: Any, handler: Callable[[], Any], kind: str):
+        self.key = key
+        self.codes = frozenset(get_key_state().scan_codes(key))
+        self.handler = handler
+        self.kind = kind  # 'press', 'hold' or 'release'
+        self.pending = False  # Queued and not yet started
+
+
+class HotkeyDispatcher:
+    """Dispatches handlers from keyboard events"""
+
+    def __init__(self):
+        self._bindings: Dict[str, List[Binding]] = {'press': [], 'hold': [], 'release': []}
+        self._events: 'queue.Queue[Binding]' = queue.Queue()
+        self._pending_lock = threading.Lock()
+        self._keydown = threading.Condition()
+        self._listening = False
+
+    def on_press(self, key: Any, handler: Callable[[], Any]) -> Binding:
+        """Run handler once each time key goes down (auto-repeat is ignored)"""
+        return self._bind(key, handler, 'press')
+
+    def on_hold(self, key: Any, handler: Callable[[], Any]) -> Binding:
+        """Run handler over and over from keydown until key is released"""
+        return self._bind(key, handler, 'hold')
+
+    def on_release(self, key: Any, handler: Callable[[], Any]) -> Binding:
+        """Run handler once each time key goes up"""
+        return self._bind(key, handler, 'release')
+
+    def _bind(self, key: Any, handler: Callable[[], Any], kind: str) -> Binding:
+        binding = Binding(key, handler, kind)
+        self._bindings[kind].append(binding)
+        return binding
+
+    def is_pressed(self, key: Any) -> bool:
+        """Whether a key is down, from the event-tracked state (no device query)"""
+        return get_key_state().is_pressed(key)
+
+    def _queue(self, binding: Binding):
+        """Queue a binding unless it is already waiting to run"""
+        with self._pending_lock:
+            if binding.pending:
+                return
+            binding.pending = True
+        self._events.put(binding)
+
+    def _on_key(self, code: int, down: bool, repeat: bool):
+        """Key state listener: queue the handlers bound to the key"""
+        if down:
+            if repeat:
+                return
+            for binding in self._bindings['press'] + self._bindings['hold']:
+                if code in binding.codes:
+                    self._queue(binding)
+            with self._keydown:
+                self._keydown.notify_all()
+        else:
+            for binding in self._bindings['release']:
+                if code in binding.codes:
+                    self._queue(binding)
+
+    def start(self):
+        """Start listening to key events (idempotent)"""
+        if not self._listening:
+            get_key_state().add_listener(self._on_key)
+            self._listening = True
+
+    def stop(self):
+        """Stop listening and drop queued handlers"""
+        if self._listening:
+            get_key_state().remove_listener(self._on_key)
+            self._listening = False
+        with self._pending_lock:
+            while not self._events.empty():
+                self._events.get_nowait().pending = False
+
+    def wait_for_keydown(self, timeout: Optional[float] = None) -> bool:
+        """Block until any key goes down.
+
+        Returns:
+            True if a key went down, False on timeout
+        """
+        with self._keydown:
+            return self._keydown.wait(timeout)
+
+    def _run_binding(self, binding: Binding, stop_event: threading.Event):
+        """Run one queued handler (a hold handler loops while its key is down)"""
+        try:
+            if binding.kind != 'hold':
+                binding.handler()
+                return
+            while not stop_event.is_set() and self.is_pressed(binding.key):
+                binding.handler()
+        except Exception as e:
+            logger.error(f"Error in {binding.kind} handler for key {binding.key}: {e}")
+
+    def run(self, stop_event: threading.Event):
+        """Dispatch handlers on this thread until stop_event is set"""
+        self.start()
+        try:
+            while not stop_event.is_set():
+                try:
+                    binding = self._events.get(timeout=STOP_CHECK_INTERVAL)
+                except queue.Empty:
+                    continue
+                # A keydown from here on queues the binding again
+                with self._pending_lock:
+                    binding.pending = False
+                self._run_binding(binding, stop_event)
+        finally:
+            self.stop()
@@ -0,0 +1,323 @@
+"""
+Central input scheduler for EvilHotKeys
+
+Specs used to send keys straight from their own threads and sleep after
+each one (0.02s here, 0.1s there) to keep the game from eating inputs.
+The scheduler owns the keyboard device instead: specs submit actions into
+a bounded queue and return immediately, and one thread sends them in order,
+never closer together than the game's minimum key spacing.
+
+Config (config.yaml):
+    input:
+      min_key_spacing: 0.02       # seconds between any two inputs
+      queue_size: 16              # pending actions before submitters wait for room
+    games:
+      Guild Wars 2:
+        input:
+          min_key_spacing: 0.05   # per-game override
+
+Example:
+    scheduler = get_input_scheduler()
+    scheduler.tap(KEYS.numpad5)                     # returns immediately
+    scheduler.tap(KEYS.numpad5, gap=0.05)           # keep 50ms free afterwards
+    ticket = scheduler.tap(KEYS.numpad5)
+    ticket.wait()                                   # block until this tap was sent
+    scheduler.wait_idle()                           # block until everything was sent
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional
+import keyboard
+from libs.config_manager import get_config_manager
+from libs.logger import get_logger
+
+logger = get_logger('input_scheduler')
+
+DEFAULT_MIN_KEY_SPACING = 0.02
+DEFAULT_QUEUE_SIZE = 16
+
+# Seconds a submitter waits for room in a full queue before dropping its input
+DEFAULT_SUBMIT_TIMEOUT = 1.0
+
+KINDS = ('tap', 'press', 'release')
+
+
+class InputTicket:
+    """Outcome of one queued input, filled in by the scheduler thread"""
+
+    def __init__(self):
+        self.sent_at: Optional[float] = None  # time.time() once the input went out
+        self.cancelled = False                # Skipped by its cancel check or clear()
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether the input was sent or skipped"""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the input was sent or skipped.
+
+        Returns:
+            True if it was sent, False if skipped or still pending at timeout
+        """
+        self._done.wait(timeout)
+        return self.sent_at is not None
+
+    def _finish(self, sent_at: Optional[float]):
+        self.sent_at = sent_at
+        self.cancelled = sent_at is None
+        self._done.set()
+
+
+class InputAction(NamedTuple):
+    """One queued input"""
+    kind: str                                  # 'tap', 'press' or 'release'
+    key: Any                                   # Scan code or key name
+    at: float                                  # Earliest time.monotonic() to send
+    gap: float                                 # Seconds to keep free afterwards
+    cancel: Optional[Callable[[], bool]]       # Skip the action if this returns True
+    submitted: float                           # time.monotonic() when queued
+    ticket: InputTicket                        # Reports when it was sent
+
+
+class InputScheduler:
+    """Sends queued inputs from one thread with a minimum spacing"""
+
+    def __init__(self, min_spacing: Optional[float] = None, queue_size: Optional[int] = None):
+        """Initialize the scheduler.
+
+        Args:
+            min_spacing: Minimum seconds between two inputs
+                         (default: input.min_key_spacing from config)
+            queue_size: Pending actions before submitters wait for room
+                        (default: input.queue_size from config)
+        """
+        config = get_config_manager()
+        if min_spacing is None:
+            min_spacing = config.get('input.min_key_spacing', DEFAULT_MIN_KEY_SPACING)
+        if queue_size is None:
+            queue_size = config.get('input.queue_size', DEFAULT_QUEUE_SIZE)
+
+        self.min_spacing = float(min_spacing)
+        self.queue_size = int(queue_size)
+        self._queue: Deque[InputAction] = deque()
+        self._cond = threading.Condition()
+        self._batch = threading.RLock()  # Held by a thread queueing an uninterrupted sequence
+        self._thread: Optional[threading.Thread] = None
+        self._sending = False
+        self._next_free = 0.0
+        self._local = threading.local()  # Last ticket queued by each thread
+
+        # Statistics
+        self.sent = 0
+        self.dropped = 0
+        self.cancelled = 0
+        self.max_lag = 0.0
+
+    def configure_for_game(self, game_name: str):
+        """Apply a game's input.min_key_spacing override (if any)"""
+        config = get_config_manager()
+        game_input = config.get_game_config(game_name).get('input', {}) or {}
+        self.min_spacing = float(game_input.get(
+            'min_key_spacing', config.get('input.min_key_spacing', DEFAULT_MIN_KEY_SPACING)))
+        logger.info(f"Input spacing for {game_name}: {self.min_spacing * 1000:.0f}ms")
+
+    def submit(self, kind: str, key: Any, delay: float = 0.0, gap: float = 0.0,
+               cancel: Optional[Callable[[], bool]] = None,
+               timeout: float = DEFAULT_SUBMIT_TIMEOUT) -> Optional[InputTicket]:
+        """Queue an input without waiting for it to be sent.
+
+        A full queue applies backpressure: the caller waits for room, so a
+        loop producing keys faster than the game accepts them is slowed to
+        the send rate instead of piling up stale inputs.
+
+        Args:
+            kind: 'tap', 'press' or 'release'
+            key: Scan code or key name
+            delay: Seconds from now before the input may be sent
+            gap: Seconds to keep free after it (the min spacing always applies)
+            cancel: Optional check run just before sending; True skips the input
+            timeout: Seconds to wait for room in a full queue
+
+        Returns:
+            A ticket reporting when the input was sent, or None if the queue
+            stayed full and the input was dropped
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Invalid input kind: {kind!r} (expected one of {KINDS})")
+
+        with self._batch, self._cond:
+            # Releases never wait or drop, or a held key would get stuck
+            if kind != 'release' and not self._cond.wait_for(
+                    lambda: len(self._queue) < self.queue_size, timeout=timeout):
+                self.dropped += 1
+                logger.warning(f"Input queue full ({self.queue_size}), dropped {kind} of {key}")
+                return None
+            now = time.monotonic()
+            ticket = InputTicket()
+            self._queue.append(InputAction(kind, key, now + max(delay, 0.0), max(gap, 0.0), cancel, now, ticket))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='input-scheduler', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        self._local.ticket = ticket
+        return ticket
+
+    def tap(self, key: Any, gap: float = 0.0, delay: float = 0.0,
+            cancel: Optional[Callable[[], bool]] = None) -> Optional[InputTicket]:
+        """Queue a press and release of a key (see submit)"""
+        return self.submit('tap', key, delay, gap, cancel)
+
+    def press(self, key: Any, gap: float = 0.0, delay: float = 0.0) -> Optional[InputTicket]:
+        """Queue a key down (see submit)"""
+        return self.submit('press', key, delay, gap)
+
+    def release(self, key: Any, gap: float = 0.0, delay: float = 0.0) -> Optional[InputTicket]:
+        """Queue a key up (see submit)"""
+        return self.submit('release', key, delay, gap)
+
+    def mash(self, key: Any, presses: int = 3, gap: float = 0.05,
+             cancel: Optional[Callable[[], bool]] = None) -> Optional[List[InputTicket]]:
+        """Queue several taps of a key, gap seconds apart.
+
+        Returns:
+            One ticket per tap, or None if any tap was dropped
+        """
+        tickets = [self.tap(key, gap=gap, cancel=cancel) for _ in range(presses)]
+        return None if None in tickets else tickets
+
+    @contextmanager
+    def batch(self) -> Iterator['InputScheduler']:
+        """Queue several inputs with nothing from other threads in between.
+
+        Example:
+            with scheduler.batch():
+                scheduler.press('alt')
+                scheduler.tap('1')
+                scheduler.release('alt')
+        """
+        with self._batch:
+            yield self
+
+    @property
+    def pending(self) -> int:
+        """Number of queued actions not sent yet"""
+        return len(self._queue)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued action was sent.
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._sending, timeout=timeout)
+
+    def wait_own(self, timeout: Optional[float] = None) -> float:
+        """Block until the last input queued by the calling thread was sent.
+
+        Unlike wait_idle() this ignores inputs queued by other threads.
+
+        Returns:
+            time.time() when that input was sent; now if it was skipped, is
+            still pending at timeout, or the thread queued nothing
+        """
+        ticket = getattr(self._local, 'ticket', None)
+        if ticket is not None and ticket.wait(timeout):
+            return ticket.sent_at
+        return time.time()
+
+    def clear(self):
+        """Drop queued inputs (releases are kept so no key stays held)"""
+        with self._cond:
+            kept = [a for a in self._queue if a.kind == 'release']
+            dropped = [a for a in self._queue if a.kind != 'release']
+            self._queue = deque(kept)
+            self._cond.notify_all()
+        for action in dropped:
+            action.ticket._finish(None)
+        if dropped:
+            logger.debug(f"Cleared {len(dropped)} queued inputs")
+
+    def _send(self, action: InputAction):
+        """Send one action to the keyboard device"""
+        try:
+            if action.kind == 'tap':
+                keyboard.press_and_release(action.key)
+            elif action.kind == 'press':
+                keyboard.press(action.key)
+            else:
+                keyboard.release(action.key)
+        except ValueError as e:
+            logger.error(f"Key '{action.key}' is not recognized: {e}")
+        except Exception as e:
+            logger.error(f"Error sending {action.kind} of key '{action.key}': {e}")
+
+    def _run(self):
+        """Scheduler loop; sends actions in order, spaced out"""
+        while True:
+            with self._cond:
+                if not self._queue:
+                    self._cond.notify_all()  # Wake wait_idle()
+                    self._cond.wait()
+                    continue
+
+                action = self._queue[0]
+                delay = max(action.at, self._next_free) - time.monotonic()
+                if delay > 0:
+                    # Woken early by new actions or clear(); re-check the head
+                    self._cond.wait(delay)
+                    continue
+                self._queue.popleft()
+                self._sending = True
+
+            skipped = False
+            try:
+                skipped = action.cancel is not None and action.cancel()
+            except Exception as e:
+                logger.error(f"Error in cancel check for key '{action.key}': {e}")
+
+            if skipped:
+                self.cancelled += 1
+                action.ticket._finish(None)
+            else:
+                self._send(action)
+                self.sent += 1
+                self.max_lag = max(self.max_lag, time.monotonic() - action.at)
+                action.ticket._finish(time.time())
+
+            with self._cond:
+                self._sending = False
+                if not skipped:
+                    self._next_free = time.monotonic() + max(self.min_spacing, action.gap)
+                self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get input statistics.
+
+        Returns:
+            Dict with sent, dropped, cancelled, pending, max_lag_ms and min_spacing_ms
+        """
+        return {
+            'sent': self.sent,
+            'dropped': self.dropped,
+            'cancelled': self.cancelled,
+            'pending': self.pending,
+            'max_lag_ms': self.max_lag * 1000,
+            'min_spacing_ms': self.min_spacing * 1000
+        }
+
+
+# Global instance
+_input_scheduler: Optional[InputScheduler] = None
+
+
+def get_input_scheduler() -> InputScheduler:
+    """Get the global input scheduler instance"""
+    global _input_scheduler
+    if _input_scheduler is None:
+        _input_scheduler = InputScheduler()
+    return _input_scheduler
@@ -0,0 +1,144 @@
+"""
+Shared pressed-key state for EvilHotKeys
+
+Rotation loops ask "is the hold key still down?" dozens of times per pass
+(every check_stop_condition, every button_mash stop_check). Instead of a
+keyboard library call each time, one keyboard hook keeps a bytearray
+indexed by scan code up to date, and a check is a single array read.
+
+The array is written only by the hook thread, one byte per event, so
+readers need no lock. A key that has not produced an event since the hook
+was installed (e.g. it was already held when the spec started) falls back
+to keyboard.is_pressed() until its first event arrives.
+
+Example:
+    from libs.key_state import is_pressed
+
+    def check_stop_condition(stop_event):
+        return not is_pressed(KEYS.numpad1) or stop_event.is_set()
+"""
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import keyboard
+from libs.logger import get_logger
+
+logger = get_logger('key_state')
+
+# Scan codes are below this on every keyboard backend we use
+MAX_SCAN_CODE = 1024
+
+# Listener(scan_code, down, repeat) called from the hook thread after each event
+Listener = Callable[[int, bool, bool], None]
+
+
+class KeyState:
+    """Pressed state of every scan code, updated from keyboard events"""
+
+    def __init__(self):
+        self.pressed = bytearray(MAX_SCAN_CODE)  # 1 while the key is down
+        self.seen = bytearray(MAX_SCAN_CODE)     # 1 once an event arrived for the key
+        self._codes: Dict[str, Tuple[int, ...]] = {}
+        self._listeners: List[Listener] = []
+        self._hook = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Install the keyboard hook (idempotent)"""
+        with self._lock:
+            if self._hook is None:
+                self.seen[:] = bytes(MAX_SCAN_CODE)
+                self._hook = keyboard.hook(self._on_event)
+                logger.debug("Key state hook installed")
+
+    def stop(self):
+        """Remove the keyboard hook; checks fall back to keyboard.is_pressed()"""
+        with self._lock:
+            if self._hook is not None:
+                try:
+                    keyboard.unhook(self._hook)
+                except (KeyError, ValueError):
+                    pass
+                self._hook = None
+            self.pressed[:] = bytes(MAX_SCAN_CODE)
+            self.seen[:] = bytes(MAX_SCAN_CODE)
+
+    @property
+    def running(self) -> bool:
+        """Whether the hook is installed"""
+        return self._hook is not None
+
+    def add_listener(self, listener: Listener):
+        """Call listener(scan_code, down, repeat) on every key event"""
+        self.start()
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: Listener):
+        """Stop calling a listener (no-op if it is not registered)"""
+        with self._lock:
+            # == rather than is: bound methods are new objects on every access
+            self._listeners = [registered for registered in self._listeners if registered != listener]
+
+    def _on_event(self, event):
+        """keyboard hook callback"""
+        code = event.scan_code
+        if not 0 <= code < MAX_SCAN_CODE:
+            return
+        down = event.event_type == keyboard.KEY_DOWN
+        repeat = down and self.pressed[code] == 1
+        self.pressed[code] = 1 if down else 0
+        self.seen[code] = 1
+        for listener in self._listeners:
+            try:
+                listener(code, down, repeat)
+            except Exception as e:
+                logger.error(f"Error in key listener: {e}")
+
+    def scan_codes(self, key: Any) -> Tuple[int, ...]:
+        """Scan codes of a key given as a scan code or a key name (cached)"""
+        if isinstance(key, int):
+            return (key,)
+        codes = self._codes.get(key)
+        if codes is None:
+            try:
+                codes = tuple(keyboard.key_to_scan_codes(key))
+            except ValueError as e:
+                logger.error(f"Key '{key}' is not recognized: {e}")
+                codes = ()
+            self._codes[key] = codes
+        return codes
+
+    def is_pressed(self, key: Any) -> bool:
+        """Whether a key is down (an array read once the key produced an event)"""
+        if isinstance(key, int) and 0 <= key < MAX_SCAN_CODE:
+            if self.seen[key]:
+                return self.pressed[key] == 1
+        else:
+            codes = self.scan_codes(key)
+            if codes and all(0 <= c < MAX_SCAN_CODE and self.seen[c] for c in codes):
+                return any(self.pressed[c] for c in codes)
+
+        if self._hook is None:
+            self.start()
+        return keyboard.is_pressed(key)
+
+    def snapshot(self) -> bytes:
+        """Copy of the pressed array (index by scan code)"""
+        return bytes(self.pressed)
+
+
+# Global instance
+_key_state: Optional[KeyState] = None
+
+
+def get_key_state() -> KeyState:
+    """Get the global key state instance"""
+    global _key_state
+    if _key_state is None:
+        _key_state = KeyState()
+    return _key_state
+
+
+def is_pressed(key: Any) -> bool:
+    """Whether a key is down, from the shared key state"""
+    return get_key_state().is_pressed(key)
@@ -1,44 +1,57 @@
-import keyboard
-import time
+from libs.input_scheduler import get_input_scheduler
+from libs.key_state import is_pressed as is_key_pressed
 from libs.logger import get_logger
+from libs.waits import sleep
 
 logger = get_logger('keyboard_actions')
 
 # Define a function to press and release a key with an optional delay
+# The input scheduler sends it and keeps `delay` free afterwards, so the
+# caller does not sleep
+# Returns the scheduler's ticket (None if the queue dropped the input)
 def press_and_release(key, delay=0.02):
-    keyboard.press_and_release(key)
-    if delay > 0:
-        time.sleep(delay)
+    return get_input_scheduler().tap(key, gap=delay)
 
 # Define a function to hold down a key while a hotkey is pressed
-def hold_key_while_pressed(hotkey, keys_to_press, delay=0.02):
-    while keyboard.is_pressed(hotkey):
+# The pause between rounds ends as soon as the hotkey is released or
+# stop_event is set
+def hold_key_while_pressed(hotkey, keys_to_press, delay=0.02, stop_event=None):
+    while is_key_pressed(hotkey):
         for key in keys_to_press:
             press_and_release(key, delay)
-        time.sleep(0.05)  # Add a small delay to reduce CPU usage
+        # Don't queue the next round before this one went out
+        get_input_scheduler().wait_own(timeout=1.0)
+        if not sleep(0.05, stop_event, hold_key=hotkey):
+            break
 
-# Define a function to press a key
+# Define a function to press a key (queued on the input scheduler)
 def press(key):
-    try:
-        keyboard.press(key)
-    except ValueError as e:
-        logger.error(f"Key '{key}' is not recognized: {e}")
-    except Exception as e:
-        logger.error(f"Error pressing key '{key}': {e}")
-
-# Define a function to release a key
+    return get_input_scheduler().press(key)
+
+# Define a function to release a key (queued on the input scheduler)
 def release(key):
-    try:
-        keyboard.release(key)
-    except ValueError as e:
-        logger.error(f"Key '{key}' is not recognized: {e}")
-    except Exception as e:
-        logger.error(f"Error releasing key '{key}': {e}")
+    return get_input_scheduler().release(key)
+
+# Define a function to press a key while a modifier is held down
+# The three inputs are queued as one batch, so a rotation running on
+# another thread cannot slip a key in between and split the chord
+def press_with_modifier(modifier, key, delay=0.02):
+    scheduler = get_input_scheduler()
+    with scheduler.batch():
+        scheduler.press(modifier)
+        ticket = scheduler.tap(key, gap=delay)
+        scheduler.release(modifier)
+    return ticket
 
 # Define a function to mash a button multiple times to ensure it registers
 def button_mash(key, presses=3, delay=0.05, stop_check=None):
     """Mash a button multiple times to ensure it registers
     
+    The presses are queued on the input scheduler and sent delay apart;
+    stop_check is re-checked before each one. Without a stop_check the
+    caller carries on at once; with one, the call waits for the presses to
+    go out so a stop in the middle of the mash is reported.
+    
     Args:
         key: The key to press
         presses: Number of times to press the key (default: 3)
@@ -46,12 +59,18 @@ def button_mash(key, presses=3, delay=0.05, stop_check=None):
         stop_check: Optional function that returns True if we should stop
     
     Returns:
-        True if completed all presses, False if stopped early
+        True if all presses were queued (and, with stop_check, sent),
+        False if stopped early
     """
-    for _ in range(presses):
-        if stop_check and stop_check():
-            return False
-        press(key)
-        release(key)
-        time.sleep(delay)
-    return True
+    if stop_check and stop_check():
+        return False
+    scheduler = get_input_scheduler()
+    tickets = scheduler.mash(key, presses=presses, gap=delay, cancel=stop_check)
+    if tickets is None:
+        return False
+    if stop_check is None:
+        return True
+
+    # Only this call's presses matter, not other threads' queued keys
+    tickets[-1].wait(timeout=presses * (delay + scheduler.min_spacing) + 1.0)
+    return not any(ticket.cancelled for ticket in tickets)
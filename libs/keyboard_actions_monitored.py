@@ -2,59 +2,76 @@
 Monitored Keyboard Actions
 Drop-in replacement for keyboard_actions that automatically records activity
 """
-import keyboard
-import time
 from libs.keyboard_actions import press as _press, release as _release
+from libs.keyboard_actions import press_and_release as _press_and_release, button_mash as _button_mash
+from libs.keyboard_actions import press_with_modifier as _press_with_modifier
+from libs.input_scheduler import get_input_scheduler
+from libs.key_state import is_pressed as is_key_pressed
 from libs.spec_monitor import get_monitor
 from libs.logger import get_logger
+from libs.waits import sleep
 
 logger = get_logger('keyboard_actions_monitored')
 
 
 def press_and_release(key, delay=0.02):
     """Press and release a key with monitoring"""
-    keyboard.press_and_release(key)
+    ticket = _press_and_release(key, delay)
     
     # Record to monitor
     monitor = get_monitor()
     if monitor.is_running:
         monitor.record_key_press(key)
-    
-    if delay > 0:
-        time.sleep(delay)
+    return ticket
 
 
-def hold_key_while_pressed(hotkey, keys_to_press, delay=0.02):
+def hold_key_while_pressed(hotkey, keys_to_press, delay=0.02, stop_event=None):
     """Hold down a key while a hotkey is pressed with monitoring"""
-    while keyboard.is_pressed(hotkey):
+    while is_key_pressed(hotkey):
         for key in keys_to_press:
             press_and_release(key, delay)
-        time.sleep(0.05)
+        get_input_scheduler().wait_own(timeout=1.0)
+        if not sleep(0.05, stop_event, hold_key=hotkey):
+            break
 
 
 def press(key):
     """Press a key with monitoring"""
-    _press(key)
+    ticket = _press(key)
     
     # Record to monitor
     monitor = get_monitor()
     if monitor.is_running:
         monitor.record_key_press(key)
+    return ticket
 
 
 def release(key):
     """Release a key (no monitoring needed)"""
-    _release(key)
+    return _release(key)
+
+
+def press_with_modifier(modifier, key, delay=0.02):
+    """Press a key while a modifier is held, with monitoring"""
+    ticket = _press_with_modifier(modifier, key, delay)
+    
+    # Record to monitor
+    monitor = get_monitor()
+    if monitor.is_running:
+        monitor.record_key_press(key)
+    return ticket
 
 
 def button_mash(key, presses=3, delay=0.05, stop_check=None):
     """Mash a button multiple times with monitoring"""
-    for _ in range(presses):
-        if stop_check and stop_check():
-            return False
-        press(key)
-        release(key)
-        time.sleep(delay)
+    if not _button_mash(key, presses=presses, delay=delay, stop_check=stop_check):
+        return False
+    
+    # Record to monitor
+    monitor = get_monitor()
+    if monitor.is_running:
+        for _ in range(presses):
+            monitor.record_key_press(key)
     return True
 
 
@@ -0,0 +1,290 @@
+"""
+Kit/weapon mode state machine for EvilHotKeys
+
+Specs used to re-read every kit icon before each toggle and debounce by wall
+clock ("no toggle within 0.6s of the last one, then sleep 0.8s"). The state
+machine instead tracks the active kit from the inputs it sends:
+
+- a toggle is sent once and the machine records the pending transition
+- the transition is confirmed from a single probe (the target kit's icon
+  lighting up, or the old kit's icon going dark) in the shared frame
+- until it is confirmed no further toggle is sent, so inputs never race,
+  and the wait ends on the first frame that shows the swap
+- rotation loops that already read the kit icons feed them in with
+  observe(), so knowing the mode costs no extra pixel reads
+
+Example:
+    KITS = KitStateMachine(base='rifle', send=press_and_release)
+    KITS.add_kit('flamethrower', COORDS.utility_flamethrower, KEYS.numpad8)
+    KITS.add_kit('elixir_gun', COORDS.utility_elixir, KEYS.numpad7)
+
+    KITS.ensure('flamethrower', stop_event=stop_event)   # toggle and confirm
+    if KITS.is_active('flamethrower'):
+        ...
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+import numpy as np
+from libs.frame_capture import Frame, get_frame_capture_service
+from libs.input_scheduler import InputTicket
+from libs.keyboard_actions import press_and_release
+from libs.logger import get_logger
+from libs.pixel_watch import wait_until
+
+logger = get_logger('kit_modes')
+
+# Seconds a toggle may take to show up before the machine re-reads every kit
+DEFAULT_CONFIRM_TIMEOUT = 1.0
+
+# Seconds request() waits for a queued toggle key to be sent
+SEND_TIMEOUT = 1.0
+
+# Kit icons turn white while the kit is equipped
+DEFAULT_MIN_CHANNEL = 200
+
+
+class Kit:
+    """A kit (or weapon mode) and the probe showing it is equipped"""
+
+    def __init__(self, name: str, coords: Tuple[int, int], key: Any, min_channel: int = DEFAULT_MIN_CHANNEL):
+        self.name = name
+        self.coords = coords
+        self.key = key
+        self.min_channel = min_channel
+
+    def lit(self, color: Optional[Tuple[int, int, int]]) -> bool:
+        """Whether a color read at the probe means the kit is equipped"""
+        return color is not None and min(color) > self.min_channel
+
+
+class KitStateMachine:
+    """Tracks the equipped kit from sent toggles and confirms them from pixels"""
+
+    def __init__(self, base: str, confirm_timeout: float = DEFAULT_CONFIRM_TIMEOUT,
+                 send: Optional[Callable[[Any], None]] = None):
+        """Initialize the machine.
+
+        Args:
+            base: Name of the mode with no kit equipped (e.g. 'rifle')
+            confirm_timeout: Seconds to wait for a toggle to show up before
+                             re-reading every kit probe
+            send: Function sending one key press (default: press_and_release)
+        """
+        self.base = base
+        self.confirm_timeout = confirm_timeout
+        self.send = send or press_and_release
+        self.kits: Dict[str, Kit] = {}
+        self.mode = base                    # Last confirmed mode
+        self.target: Optional[str] = None   # Mode a sent toggle is heading to
+        self.sent_at = 0.0                  # When that toggle was sent
+        self.confirmed_at = 0.0             # When the mode was last confirmed
+        self._lock = threading.RLock()
+        self._xs = np.zeros(0, dtype=np.intp)
+        self._ys = np.zeros(0, dtype=np.intp)
+
+    def add_kit(self, name: str, coords: Tuple[int, int], key: Any, min_channel: int = DEFAULT_MIN_CHANNEL) -> Kit:
+        """Declare a kit.
+
+        Args:
+            name: Kit name
+            coords: (x, y) of the kit's utility icon (white while equipped)
+            key: Key that equips the kit, and unequips it again
+            min_channel: Icon counts as lit if every channel is above this
+        """
+        kit = Kit(name, coords, key, min_channel)
+        self.kits[name] = kit
+        self._xs = np.array([k.coords[0] for k in self.kits.values()], dtype=np.intp)
+        self._ys = np.array([k.coords[1] for k in self.kits.values()], dtype=np.intp)
+        return kit
+
+    @property
+    def pending(self) -> bool:
+        """Whether a toggle was sent and not confirmed yet"""
+        return self.target is not None
+
+    @property
+    def expected(self) -> str:
+        """Mode the game is in once the pending toggle (if any) lands"""
+        return self.target if self.target is not None else self.mode
+
+    def is_active(self, name: str) -> bool:
+        """Whether a mode is the confirmed current mode (no pixel read)"""
+        return self.mode == name
+
+    def _settle(self, mode: str, timestamp: float):
+        if mode != self.mode:
+            logger.debug(f"Mode {self.mode} -> {mode}")
+        self.mode = mode
+        self.target = None
+        self.confirmed_at = timestamp
+
+    def _timed_out(self, now: float) -> bool:
+        return self.target is not None and now - self.sent_at > self.confirm_timeout
+
+    def observe(self, lit: Mapping[str, bool], timestamp: Optional[float] = None):
+        """Feed kit states already read from a frame (e.g. a SkillBoard).
+
+        Args:
+            lit: {kit name: icon lit} for the kits that were read
+            timestamp: Capture time of the frame (default: now)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        seen = next((name for name, on in lit.items() if on and name in self.kits), self.base)
+
+        with self._lock:
+            if self.target is None:
+                self._settle(seen, timestamp)
+            elif timestamp <= self.sent_at:
+                return  # Frame predates the toggle
+            elif seen == self.target:
+                self._settle(seen, timestamp)
+            elif self._timed_out(timestamp):
+                logger.warning(f"Switch to {self.target} not confirmed, still in {seen}")
+                self._settle(seen, timestamp)
+
+    def update(self, frame: Optional[Frame] = None) -> str:
+        """Read every kit probe from one frame and feed them to observe().
+
+        Returns:
+            The confirmed current mode
+        """
+        if frame is None:
+            frame = get_frame_capture_service().get_frame()
+        if frame is None or not self.kits:
+            return self.mode
+        colors, found = get_frame_capture_service().sample(self._xs, self._ys, frame)
+        lit = {kit.name: bool(ok) and kit.lit(tuple(int(c) for c in rgb))
+               for kit, rgb, ok in zip(self.kits.values(), colors, found)}
+        self.observe(lit, frame.timestamp)
+        return self.mode
+
+    def sync(self, frame: Optional[Frame] = None) -> str:
+        """Drop any toggle in flight and adopt what the kit probes show"""
+        with self._lock:
+            self.target = None
+        return self.update(frame)
+
+    def _confirm_probe(self) -> Tuple[Kit, bool]:
+        """The single probe that shows the pending toggle landed, and its expected state"""
+        if self.target == self.base:
+            return self.kits[self.mode], False
+        return self.kits[self.target], True
+
+    def confirm(self, frame: Optional[Frame] = None) -> bool:
+        """Check the pending toggle against one probe in the shared frame.
+
+        Returns:
+            True if no toggle is pending (anymore)
+        """
+        with self._lock:
+            if self.target is None:
+                return True
+            if frame is None:
+                frame = get_frame_capture_service().get_frame()
+            if frame is None or frame.timestamp <= self.sent_at:
+                return False
+
+            kit, want = self._confirm_probe()
+            color = get_frame_capture_service().get_color(kit.coords[0], kit.coords[1], frame)
+            if kit.lit(color) == want:
+                self._settle(self.target, frame.timestamp)
+                return True
+            timed_out = self._timed_out(frame.timestamp)
+
+        if timed_out:
+            logger.warning(f"Switch to {self.target} not confirmed after {self.confirm_timeout:.1f}s, re-reading kits")
+            self.sync(frame)
+            return True
+        return False
+
+    def request(self, target: str) -> bool:
+        """Send the toggle towards a mode unless one is already in flight.
+
+        Returns:
+            True if the mode is already the confirmed current mode
+        """
+        if target != self.base and target not in self.kits:
+            raise KeyError(f"Unknown mode: {target!r}")
+
+        with self._lock:
+            if self.target is not None and not self.confirm():
+                return False  # Never stack toggles; wait for the first to land
+            if self.mode == target:
+                return True
+
+            # Kits toggle: the active kit's key drops back to the base mode,
+            # another kit's key swaps straight to that kit
+            key = self.kits[self.mode].key if target == self.base else self.kits[target].key
+            # Until the key is out no frame can confirm the toggle
+            self.target = target
+            self.sent_at = float('inf')
+            logger.info(f"Switching {self.mode} -> {target}")
+
+        # Send without the lock so observe() and update() callers don't wait
+        # on the input queue; stamp the time the key actually went out
+        ticket = self.send(key)
+        sent_at = ticket.sent_at if isinstance(ticket, InputTicket) and ticket.wait(SEND_TIMEOUT) else time.time()
+        with self._lock:
+            if self.target == target and self.sent_at == float('inf'):
+                self.sent_at = sent_at
+        return False
+
+    def wait(self, timeout: Optional[float] = None, stop_event: Optional[threading.Event] = None) -> bool:
+        """Block until the pending toggle is confirmed (on the first frame showing it).
+
+        Returns:
+            True if confirmed, False on timeout or stop
+        """
+        if timeout is None:
+            timeout = self.confirm_timeout
+        with self._lock:
+            if self.target is None:
+                return True
+            kit, want = self._confirm_probe()
+            target = self.target
+
+        color = wait_until(kit.coords[0], kit.coords[1], lambda c: kit.lit(c) == want,
+                           timeout=timeout, stop_event=stop_event)
+        with self._lock:
+            if color is not None and self.target == target:
+                self._settle(target, time.time())
+            return self.target is None and self.mode == target
+
+    def ensure(self, target: str, timeout: Optional[float] = None,
+               stop_event: Optional[threading.Event] = None) -> bool:
+        """Switch to a mode if needed and wait for it to be confirmed.
+
+        Args:
+            target: Mode name (a kit or the base mode)
+            timeout: Seconds to wait for confirmation (default: confirm_timeout)
+            stop_event: Optional event that aborts the wait
+
+        Returns:
+            True if the mode is active
+        """
+        if self.request(target):
+            return True
+        if self.target != target:
+            # Another toggle is still in flight: let it land, then switch
+            self.wait(timeout, stop_event)
+            if self.request(target):
+                return True
+        return self.wait(timeout, stop_event)
+
+    def reset(self):
+        """Forget the tracked mode (call when a rotation starts)"""
+        with self._lock:
+            self.mode = self.base
+            self.target = None
+            self.sent_at = 0.0
+            self.confirmed_at = 0.0
+
+    def get_state(self) -> Dict[str, Any]:
+        """Tracked state, for logging"""
+        return {
+            'mode': self.mode,
+            'target': self.target,
+            'pending_for': max(time.time() - self.sent_at, 0.0) if self.target else 0.0,
+        }
@@ -1,83 +1,83 @@
-from PIL import ImageGrab
-from libs.environment import is_gnome_wayland, check_gnome_screenshot_support
+from libs.frame_capture import get_frame_capture_service
 from libs.logger import get_logger
 
 logger = get_logger('pixel_get_color')
 
-# Wayland/GNOME support
-_gnome_manager = None
-_wayland_supported = None
-
-def _get_wayland_support():
-    """Check if Wayland support is available"""
-    global _wayland_supported
-    if _wayland_supported is None:
-        _wayland_supported = is_gnome_wayland() and check_gnome_screenshot_support()
-    return _wayland_supported
+def get_color(x, y, img=None, with_timestamp=False):
+    """Get the color of a pixel at the specified coordinates
 
-def _get_gnome_manager():
-    """Get the GNOME screenshot manager"""
-    global _gnome_manager
-    if _gnome_manager is None and _get_wayland_support():
-        try:
-            from libs.gnome_screenshot import get_gnome_screenshot_manager
-            _gnome_manager = get_gnome_screenshot_manager()
-        except ImportError as e:
-            logger.error(f"Failed to import GNOME screenshot support: {e}")
-            logger.info("Install required dependencies: dbus-python PyGObject")
-    return _gnome_manager
+    Reads come from the shared frame capture service, so calls made within
+    the freshness window reuse the same frame.
 
-def get_color(x, y, img=None):
-    """Get the color of a pixel at the specified coordinates
-    
     Args:
         x: X coordinate
-        y: Y coordinate  
-        img: Optional image to use (for X11 only)
-    
+        y: Y coordinate
+        img: Optional image to read from instead of the shared frame
+        with_timestamp: Also return the time the frame was captured
+
     Returns:
-        Tuple of (R, G, B) values or None if error
+        Tuple of (R, G, B) values or None if error. With with_timestamp,
+        a ((R, G, B), timestamp) tuple instead (timestamp None if error).
     """
     try:
-        # Use Wayland/GNOME backend if available
-        if _get_wayland_support():
-            gnome_manager = _get_gnome_manager()
-            if gnome_manager:
-                return gnome_manager.get_pixel_color(x, y)
-        
-        # Fall back to X11 backend
-        if img is None:
-            img = ImageGrab.grab()
-        return img.getpixel((x, y))
+        if img is not None:
+            color, timestamp = img.getpixel((x, y)), None
+        else:
+            service = get_frame_capture_service()
+            frame = service.get_frame()
+            color = service.get_color(x, y, frame) if frame is not None else None
+            timestamp = frame.timestamp if frame is not None else None
     except Exception as e:
         logger.error(f"Error getting pixel color at ({x}, {y}): {e}")
-        return None
+        color, timestamp = None, None
 
-def get_multiple_pixel_colors(coordinates):
+    if with_timestamp:
+        return color, timestamp
+    return color
+
+def get_multiple_pixel_colors(coordinates, with_timestamp=False):
     """Get colors of multiple pixels efficiently
-    
+
     Args:
         coordinates: List of (x, y) tuples
-    
+        with_timestamp: Also return the time the frame was captured
+
     Returns:
-        List of (R, G, B) tuples
+        List of (R, G, B) tuples (None for pixels that could not be read).
+        With with_timestamp, a (colors, timestamp) tuple instead.
     """
-    # Use Wayland/GNOME backend if available
-    if _get_wayland_support():
-        gnome_manager = _get_gnome_manager()
-        if gnome_manager:
-            # Use optimized method for multiple pixels
-            return gnome_manager.get_multiple_pixel_colors(coordinates)
-    
-    # Fall back to X11 backend
-    colors = []
     try:
-        img = ImageGrab.grab()
-        for (x, y) in coordinates:
-            color = get_color(x, y, img)
-            if color is not None:
-                colors.append(color)
+        service = get_frame_capture_service()
+        frame = service.get_frame()
+        colors = service.get_colors(coordinates, frame)
+        timestamp = frame.timestamp if frame is not None else None
     except Exception as e:
         logger.error(f"Error getting multiple pixel colors: {e}")
-    
+        colors, timestamp = [None] * len(coordinates), None
+
+    if with_timestamp:
+        return colors, timestamp
     return colors
+
+def wait_for_frame_after(timestamp, timeout=None):
+    """Wait for a frame captured after the given time
+
+    Call this with the time a key was sent (or the timestamp of the last
+    read) and read from the returned frame, e.g.
+    get_frame_capture_service().get_color(x, y, frame), so the check never
+    sees a stale frame.
+
+    Args:
+        timestamp: time.time() value the frame must be newer than
+        timeout: Maximum seconds to wait (None waits forever)
+
+    Returns:
+        The newer Frame, or None on timeout or error
+    """
+    if timestamp is None:
+        return None
+    try:
+        return get_frame_capture_service().wait_for_frame_after(timestamp, timeout)
+    except Exception as e:
+        logger.error(f"Error waiting for a new frame: {e}")
+        return None
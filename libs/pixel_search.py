@@ -1,80 +1,209 @@
-from PIL import ImageGrab
+from functools import lru_cache
 import numpy as np
-from libs.environment import is_gnome_wayland, check_gnome_screenshot_support
+from libs.frame_capture import get_frame_capture_service, pack_rgb, unpack_rgb
 from libs.logger import get_logger
 
 logger = get_logger('pixel_search')
 
-# Wayland/GNOME support
-_gnome_manager = None
-_wayland_supported = None
-
-def _get_wayland_support():
-    """Check if Wayland support is available"""
-    global _wayland_supported
-    if _wayland_supported is None:
-        _wayland_supported = is_gnome_wayland() and check_gnome_screenshot_support()
-    return _wayland_supported
-
-def _get_gnome_manager():
-    """Get the GNOME screenshot manager"""
-    global _gnome_manager
-    if _gnome_manager is None and _get_wayland_support():
-        try:
-            from libs.gnome_screenshot import get_gnome_screenshot_manager
-            _gnome_manager = get_gnome_screenshot_manager()
-        except ImportError as e:
-            logger.error(f"Failed to import GNOME screenshot support: {e}")
-            logger.info("Install required dependencies: dbus-python PyGObject")
-    return _gnome_manager
-
-def pixel_search(color, x1, y1, x2, y2):
+# Search modes
+MODE_FIRST = 'first'  # First match in row-major order (top-left most)
+MODE_LAST = 'last'    # Last match in row-major order (bottom-right most)
+MODE_ALL = 'all'      # Every match
+MODE_ANY = 'any'      # Only whether there is a match
+MODES = (MODE_FIRST, MODE_LAST, MODE_ALL, MODE_ANY)
+
+# Rows compared per step; first/last/any stop after the first chunk with a hit
+CHUNK_ROWS = 32
+
+# Each table is 16 MB; searches usually reuse one set of targets
+@lru_cache(maxsize=2)
+def _color_lut(colors, tolerances):
+    """Lookup table mapping every 24-bit color to the index+1 of the target it matches
+
+    Built once per set of targets (16 MB), so each search is a single
+    gather over the packed region instead of per-channel comparisons. Where tolerance boxes overlap the
+    earlier color wins.
+    """
+    lut = np.zeros(1 << 24, dtype=np.uint8)
+    cube = lut.reshape(256, 256, 256)
+    for label in range(len(colors), 0, -1):
+        (r, g, b), tol = colors[label - 1], tolerances[label - 1]
+        cube[max(r - tol, 0):r + tol + 1,
+             max(g - tol, 0):g + tol + 1,
+             max(b - tol, 0):b + tol + 1] = label
+    return lut
+
+def _labeler(colors, tolerances):
+    """Build a function labelling each pixel of a packed block with its matching target
+
+    Returns:
+        Function taking an HxW packed 0x00RRGGBB block and returning an HxW
+        uint8 array, 0 where nothing matched and k+1 where colors[k] matched
+    """
+    if len(colors) == 1 and tolerances[0] == 0:
+        # Exact match is a single 1-D compare on packed values
+        target = np.uint32(pack_rgb(colors[0]))
+        return lambda block: (block == target).view(np.uint8)
+    if len(colors) > 255:
+        raise ValueError("pixel_search supports at most 255 colors per call")
+    lut = _color_lut(colors, tolerances)
+    return lambda block: lut[block]
+
+def _first_last(mask, mode):
+    """(row, col) of the first or last True in a 2-D mask in row-major order"""
+    flat = mask.ravel()
+    if mode == MODE_LAST:
+        index = flat.size - 1 - int(np.argmax(flat[::-1]))
+    else:
+        # argmax on a bool mask is the first True in row-major order
+        index = int(np.argmax(flat))
+    return divmod(index, mask.shape[1])
+
+def _scan(image_np, labeler, count, mode, chunk_rows=CHUNK_ROWS):
+    """Scan an HxW packed array in row chunks for every target at once
+
+    Returns:
+        One entry per target: (row, col) or None for first/last,
+        list of (row, col) for all
+    """
+    if mode == MODE_ALL:
+        labels = labeler(image_np)
+        return [[(int(r), int(c)) for r, c in np.argwhere(labels == label)]
+                for label in range(1, count + 1)]
+
+    height = image_np.shape[0]
+    hits = [None] * count
+    remaining = list(range(count))
+    tops = range(0, height, chunk_rows)
+    if mode == MODE_LAST:
+        tops = reversed(tops)
+
+    for top in tops:
+        labels = labeler(image_np[top:top + chunk_rows])
+        if not labels.any():
+            continue
+        for index in list(remaining):
+            mask = labels == index + 1
+            if mask.any():
+                r, c = _first_last(mask, mode)
+                hits[index] = (top + r, c)
+                remaining.remove(index)
+        if not remaining:
+            break
+    return hits
+
+def _refine(image_np, labeler, count, index, row, col, stride, mode):
+    """Find the exact edge of a coarse strided hit within one stride around it"""
+    height, width = image_np.shape[:2]
+    if mode == MODE_LAST:
+        top, bottom = row, min(row + stride, height)
+    else:
+        top, bottom = max(row - stride + 1, 0), row + 1
+    left, right = max(col - stride + 1, 0), min(col + stride, width)
+    hit = _scan(image_np[top:bottom, left:right], labeler, count, mode)[index]
+    if hit is None:
+        return (row, col)
+    return (top + hit[0], left + hit[1])
+
+def _empty_result(mode):
+    """Result for a color with no match"""
+    if mode == MODE_ALL:
+        return []
+    if mode == MODE_ANY:
+        return False
+    return None
+
+def _is_multi(color):
+    """Whether a color argument holds several colors
+
+    (R, G, B) as a tuple or list (e.g. from YAML) is one color; a sequence of
+    sequences, or of packed ints that can't be one (R, G, B), is several.
+    """
+    if not isinstance(color, (tuple, list)) or not color:
+        return False
+    if all(isinstance(c, (int, np.integer)) for c in color):
+        return len(color) != 3 or any(not 0 <= c <= 255 for c in color)
+    return True
+
+def _to_rgb(color):
+    """Normalize an (R, G, B) tuple or packed 0xRRGGBB int to an (R, G, B) tuple"""
+    if isinstance(color, (int, np.integer)):
+        return unpack_rgb(color)
+    return tuple(int(c) for c in color)
+
+def pixel_search(color, x1, y1, x2, y2, mode=MODE_FIRST, stride=1, tolerance=0):
     """Search for a pixel of a specific color in a region of the screen.
-    
-    Uses vectorized numpy operations for significantly better performance
-    compared to nested loops.
-    
+
+    Works on the packed 0x00RRGGBB view of the shared frame and scans in row
+    chunks, stopping as soon as the question is answered instead of building
+    a mask of the whole region just to return the first hit.
+
+    Several colors can be searched at once: the region is captured once and
+    every pixel is labelled in one pass through a color lookup table.
+
     Args:
-        color: Target color as (R, G, B) tuple
+        color: Target color as (R, G, B) tuple or packed 0xRRGGBB int,
+               or a list of them
         x1, y1: Top-left corner of search region
         x2, y2: Bottom-right corner of search region
-    
+        mode: 'first' (default), 'last', 'all' or 'any'
+        stride: Check only every stride-th pixel in each direction first,
+                then refine around the hit. Only safe for targets at least
+                stride pixels wide and tall (e.g. the fishing bar blocks).
+                In 'all' mode only the coarse grid hits are returned.
+        tolerance: Maximum per-channel difference for a match, either one
+                   value for every color or a list with one per color
+
     Returns:
-        Tuple of (x, y) coordinates if found, None otherwise
+        'first'/'last': Tuple of (x, y) coordinates if found, None otherwise
+        'all': List of (x, y) tuples (empty if none)
+        'any': True if found, False otherwise
+        With a list of colors, a list with one such result per color.
     """
+    if mode not in MODES:
+        raise ValueError(f"Unknown pixel search mode: {mode}")
+
+    multi = _is_multi(color)
+    colors = tuple(_to_rgb(target) for target in (color if multi else [color]))
+    if isinstance(tolerance, (tuple, list)):
+        if len(tolerance) != len(colors):
+            raise ValueError("pixel_search needs one tolerance per color")
+        tolerances = tuple(int(t) for t in tolerance)
+    else:
+        tolerances = (int(tolerance),) * len(colors)
+
     try:
-        image = None
-        
-        # Use Wayland/GNOME backend if available
-        if _get_wayland_support():
-            gnome_manager = _get_gnome_manager()
-            if gnome_manager:
-                image = gnome_manager.get_region_screenshot(x1, y1, x2, y2)
-        
-        # Fall back to X11 backend if no image yet
-        if image is None:
-            image = ImageGrab.grab(bbox=(x1, y1, x2, y2))
-        
-        if image is None:
-            return None
-        
-        # Convert the image to a numpy array for faster processing
-        image_np = np.array(image)
-        
-        # Vectorized search: create boolean mask where all RGB channels match
-        # This is MUCH faster than nested loops
-        matches = np.all(image_np == color, axis=-1)
-        
-        # Find coordinates of matches
-        coords = np.argwhere(matches)
-        
-        if len(coords) > 0:
-            # Return the first match (top-left most)
-            y, x = coords[0]
-            return (x1 + int(x), y1 + int(y))
-        
-        # If no matching pixel is found, return None
-        return None
+        results = _search(colors, tolerances, x1, y1, x2, y2, mode, stride)
     except Exception as e:
         logger.error(f"Error during pixel search: {e}")
-        return None
+        results = [_empty_result(mode) for _ in colors]
+
+    return results if multi else results[0]
+
+def _search(colors, tolerances, x1, y1, x2, y2, mode, stride):
+    """Run one search for every target color; one result per color"""
+    # Search a view of the shared frame instead of grabbing the region again
+    image_np = get_frame_capture_service().get_region(x1, y1, x2, y2, packed=True)
+    if image_np is None:
+        return [_empty_result(mode) for _ in colors]
+
+    labeler = _labeler(colors, tolerances)
+    count = len(colors)
+    scan_mode = MODE_FIRST if mode == MODE_ANY else mode
+
+    if stride > 1:
+        hits = _scan(image_np[::stride, ::stride], labeler, count, scan_mode)
+        if mode == MODE_ALL:
+            hits = [[(r * stride, c * stride) for r, c in found] for found in hits]
+        elif mode != MODE_ANY:
+            hits = [None if hit is None else
+                    _refine(image_np, labeler, count, index, hit[0] * stride, hit[1] * stride, stride, mode)
+                    for index, hit in enumerate(hits)]
+    else:
+        hits = _scan(image_np, labeler, count, scan_mode)
+
+    if mode == MODE_ALL:
+        return [[(x1 + c, y1 + r) for r, c in found] for found in hits]
+    if mode == MODE_ANY:
+        return [hit is not None for hit in hits]
+    return [None if hit is None else (x1 + hit[1], y1 + hit[0]) for hit in hits]
@@ -0,0 +1,267 @@
+"""
+Event-driven pixel watchers for EvilHotKeys
+
+Instead of every spec hand-rolling "read pixel, sleep 50ms, repeat" loops,
+a spec registers a watch ("tell me when this pixel goes dark") and blocks on
+it. One scheduler thread evaluates every active watch against each captured
+frame with a single vectorized read and wakes waiting threads through a
+condition variable, so N concurrent waits cost one capture per frame.
+
+Example:
+    from libs.pixel_watch import wait_until, below
+
+    # Wait up to 2s for the skill icon to go dark
+    color = wait_until(2801, 1013, below(301), timeout=2.0, stop_event=stop_event)
+"""
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from libs.config_manager import get_config_manager
+from libs.frame_capture import DEFAULT_PREFETCH_FPS, get_frame_capture_service
+from libs.logger import get_logger
+
+logger = get_logger('pixel_watch')
+
+Color = Tuple[int, int, int]
+Predicate = Callable[[Color], bool]
+
+# How often waiters re-check their stop_event while blocked
+STOP_CHECK_INTERVAL = 0.05
+
+
+def below(threshold: int) -> Predicate:
+    """Match when R+G+B drops below threshold (e.g. a skill going on cooldown)"""
+    return lambda color: sum(color) < threshold
+
+
+def above(threshold: int) -> Predicate:
+    """Match when R+G+B rises above threshold (e.g. a skill coming off cooldown)"""
+    return lambda color: sum(color) > threshold
+
+
+def matches(target: Color, tolerance: int = 0) -> Predicate:
+    """Match when every channel is within tolerance of target"""
+    return lambda color: all(abs(c - t) <= tolerance for c, t in zip(color, target))
+
+
+def changes(tolerance: int = 0, initial: Optional[Color] = None) -> Predicate:
+    """Match when the color differs from its first observed value (or initial)"""
+    state = {'initial': initial}
+
+    def predicate(color: Color) -> bool:
+        if state['initial'] is None:
+            state['initial'] = color
+            return False
+        return any(abs(c - i) > tolerance for c, i in zip(color, state['initial']))
+
+    return predicate
+
+
+class PixelWatch:
+    """A registered condition on one pixel; one-shot until it fires"""
+
+    def __init__(self, watcher: 'PixelWatcher', x: int, y: int, predicate: Predicate,
+                 name: Optional[str] = None, unreadable: Optional[Color] = None):
+        self.watcher = watcher
+        self.x = x
+        self.y = y
+        self.predicate = predicate
+        self.name = name or f"({x}, {y})"
+        self.unreadable = unreadable  # Color to test when the pixel can't be read
+        self.triggered = False
+        self.color: Optional[Color] = None  # Color that triggered the watch
+        self.timestamp: Optional[float] = None  # Capture time of that frame
+        self.created = time.time()  # Frames captured before this are ignored
+
+    def wait(self, timeout: Optional[float] = None, stop_event: Optional[threading.Event] = None) -> bool:
+        """Block until the watch fires.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+            stop_event: Optional event that aborts the wait when set
+
+        Returns:
+            True if the watch fired, False on timeout or stop
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        condition = self.watcher.condition
+        with condition:
+            while not self.triggered:
+                if stop_event is not None and stop_event.is_set():
+                    break
+                wait_time = STOP_CHECK_INTERVAL if stop_event is not None else None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    wait_time = remaining if wait_time is None else min(wait_time, remaining)
+                condition.wait(wait_time)
+            triggered = self.triggered
+
+        if not triggered:
+            self.cancel()
+        return triggered
+
+    def cancel(self):
+        """Stop watching"""
+        self.watcher.remove(self)
+
+
+class PixelWatcher:
+    """Evaluates all active watches once per captured frame"""
+
+    def __init__(self, interval: Optional[float] = None):
+        """Initialize the watcher.
+
+        Args:
+            interval: Minimum seconds between evaluations when frames are not
+                      prefetched (default: 1 / performance.prefetch_fps)
+        """
+        if interval is None:
+            interval = 1.0 / get_config_manager().get('performance.prefetch_fps', DEFAULT_PREFETCH_FPS)
+
+        self.interval = interval
+        self.condition = threading.Condition()
+        self._watches: List[PixelWatch] = []
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, x: int, y: int, predicate: Predicate, name: Optional[str] = None,
+              unreadable: Optional[Color] = None) -> PixelWatch:
+        """Register a watch; the scheduler starts on the first one
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            predicate: Callable taking an (R, G, B) tuple
+            name: Name for logging
+            unreadable: Color to test when the pixel can't be read
+                        (None skips unreadable frames)
+        """
+        watch = PixelWatch(self, x, y, predicate, name, unreadable)
+        with self.condition:
+            self._watches.append(watch)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='pixel-watch', daemon=True)
+                self._thread.start()
+            self.condition.notify_all()
+        return watch
+
+    def remove(self, watch: PixelWatch):
+        """Unregister a watch (no-op if it already fired)"""
+        with self.condition:
+            if watch in self._watches:
+                self._watches.remove(watch)
+
+    def _next_frame(self, sequence: int, next_tick: float):
+        """Get the next frame to evaluate"""
+        service = get_frame_capture_service()
+        if service.prefetching:
+            return service.wait_for_frame(sequence, timeout=0.1)
+
+        delay = next_tick - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        # Reuse a frame another reader captured during this tick
+        return service.get_frame(max_age=self.interval)
+
+    def _run(self):
+        """Scheduler loop; idles on the condition while no watches remain
+
+        The thread lives as long as the process so its capture handle (mss
+        keeps one per thread) is opened once, not on every wait_until.
+        """
+        service = get_frame_capture_service()
+        sequence = 0
+        next_tick = time.monotonic()
+
+        while True:
+            with self.condition:
+                while not self._watches:
+                    self.condition.wait()
+                watches = list(self._watches)
+
+            try:
+                frame = self._next_frame(sequence, next_tick)
+                next_tick = time.monotonic() + self.interval
+                if frame is None:
+                    if not service.prefetching:
+                        # The capture failed, so no pixel could be read
+                        self._evaluate(watches, [None] * len(watches), time.time())
+                    continue
+                if frame.sequence == sequence:
+                    continue
+                sequence = frame.sequence
+
+                # One vectorized read for every watch
+                xs = np.array([w.x for w in watches], dtype=np.intp)
+                ys = np.array([w.y for w in watches], dtype=np.intp)
+                colors, found = service.sample(xs, ys, frame)
+                readings = [(int(rgb[0]), int(rgb[1]), int(rgb[2])) if ok else None
+                            for rgb, ok in zip(colors, found)]
+                self._evaluate(watches, readings, frame.timestamp)
+            except Exception as e:
+                logger.error(f"Error in pixel watch scheduler: {e}")
+                time.sleep(self.interval)
+
+    def _evaluate(self, watches: List[PixelWatch], colors: List[Optional[Color]], timestamp: float):
+        """Test each watch against its pixel and wake the ones that fired"""
+        fired = []
+        for watch, color in zip(watches, colors):
+            if timestamp < watch.created:
+                continue
+            if color is None:
+                color = watch.unreadable
+                if color is None:
+                    continue
+            try:
+                if watch.predicate(color):
+                    watch.color = color
+                    watch.timestamp = timestamp
+                    fired.append(watch)
+            except Exception as e:
+                logger.error(f"Error evaluating watch {watch.name}: {e}")
+                fired.append(watch)
+
+        if fired:
+            with self.condition:
+                for watch in fired:
+                    watch.triggered = True
+                    if watch in self._watches:
+                        self._watches.remove(watch)
+                self.condition.notify_all()
+
+
+# Global instance
+_pixel_watcher: Optional[PixelWatcher] = None
+
+
+def get_pixel_watcher() -> PixelWatcher:
+    """Get the global pixel watcher instance"""
+    global _pixel_watcher
+    if _pixel_watcher is None:
+        _pixel_watcher = PixelWatcher()
+    return _pixel_watcher
+
+
+def wait_until(x: int, y: int, predicate: Predicate, timeout: Optional[float] = None,
+               stop_event: Optional[threading.Event] = None,
+               unreadable: Optional[Color] = None) -> Optional[Color]:
+    """Block until a pixel matches a predicate.
+
+    Args:
+        x: X coordinate
+        y: Y coordinate
+        predicate: Callable taking an (R, G, B) tuple, e.g. below(301)
+        timeout: Maximum seconds to wait (None waits forever)
+        stop_event: Optional event that aborts the wait when set
+        unreadable: Color to test when the pixel can't be read, e.g. (0, 0, 0)
+                    to count a failed capture as dark (None skips it)
+
+    Returns:
+        The matching (R, G, B) color, or None on timeout or stop
+    """
+    watch = get_pixel_watcher().watch(x, y, predicate, unreadable=unreadable)
+    if watch.wait(timeout, stop_event):
+        return watch.color
+    return None
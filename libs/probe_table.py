@@ -0,0 +1,110 @@
+"""
+Compiled coordinate and key tables for EvilHotKeys specs
+
+Specs keep their coordinates and keys in readable dicts, but hot loops
+should not hash strings on every iteration. Compiling a spec's tables once
+when the spec module loads turns them into:
+
+- a ProbeTable: each coordinate as a plain attribute, every point (with
+  offsets) in flat NumPy index arrays, and integer indices per name
+- a KeyTable: each key name as an integer scan code attribute
+
+Example:
+    COORDS = ProbeTable(DEFAULT_COORDS, offsets={'weapon_5': MULTIPOINT_OFFSETS})
+    KEYS = KeyTable(key_mapping)
+
+    check_skill_available(COORDS.weapon_5)       # (x, y) tuple
+    press_and_release(KEYS.numpad5)              # int scan code
+    colors, found = COORDS.sample()              # every point in one read
+    colors[COORDS.index['weapon_5']]             # a name's first point
+"""
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from libs.frame_capture import Frame, get_frame_capture_service
+
+Point = Tuple[int, int]
+
+
+def _attribute_name(name: str) -> str:
+    """Turn a table key into an attribute name ('numpad+' -> 'numpad_plus')"""
+    return name.replace('+', '_plus').replace('-', '_minus').replace(' ', '_')
+
+
+class ProbeTable:
+    """Named screen coordinates compiled into attributes and index arrays"""
+
+    def __init__(self, coords: Mapping[str, Point],
+                 offsets: Optional[Mapping[str, Sequence[Tuple[int, int]]]] = None):
+        """Compile a coordinate table.
+
+        Args:
+            coords: {name: (x, y)}
+            offsets: Optional {name: [(dx, dy), ...]} of extra points to read
+                     around a coordinate (the (0, 0) point is always first)
+        """
+        offsets = offsets or {}
+        self.names: List[str] = list(coords)
+        self.points: Tuple[Point, ...] = tuple((int(x), int(y)) for x, y in coords.values())
+        self.coords: Dict[str, Point] = dict(zip(self.names, self.points))
+
+        xs, ys = [], []
+        self.index: Dict[str, int] = {}    # name -> first point in xs/ys
+        self.spans: Dict[str, slice] = {}  # name -> all of its points in xs/ys
+        for name, (x, y) in zip(self.names, self.points):
+            start = len(xs)
+            name_offsets = [(0, 0)] + [o for o in offsets.get(name, ()) if tuple(o) != (0, 0)]
+            for dx, dy in name_offsets:
+                xs.append(x + dx)
+                ys.append(y + dy)
+            self.index[name] = start
+            self.spans[name] = slice(start, len(xs))
+            setattr(self, _attribute_name(name), (x, y))
+
+        self.xs = np.array(xs, dtype=np.intp)
+        self.ys = np.array(ys, dtype=np.intp)
+
+    def __getitem__(self, name: str) -> Point:
+        return self.coords[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def all_points(self) -> List[Point]:
+        """Every compiled point, offsets included (for capture planning)"""
+        return list(zip(self.xs.tolist(), self.ys.tolist()))
+
+    def sample(self, frame: Optional[Frame] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Read every compiled point against one frame.
+
+        Returns:
+            Tuple of (Nx3 RGB array, N-length bool array of pixels read),
+            indexed by index[name] / spans[name]
+        """
+        return get_frame_capture_service().sample(self.xs, self.ys, frame)
+
+
+class KeyTable:
+    """Key names compiled into integer scan code attributes"""
+
+    def __init__(self, mapping: Mapping[str, int]):
+        """Compile a key table.
+
+        Args:
+            mapping: {name: scan code}, e.g. libs.key_mapping.key_mapping
+        """
+        self.codes: Dict[str, int] = {name: int(code) for name, code in mapping.items()}
+        for name, code in self.codes.items():
+            setattr(self, _attribute_name(name), code)
+
+    def __getitem__(self, name: str) -> int:
+        return self.codes[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.codes
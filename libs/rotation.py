@@ -0,0 +1,372 @@
+"""
+Declarative rotation engine for EvilHotKeys
+
+Instead of nested if/sleep chains, a spec declares its abilities once
+(key, readiness probe, cooldown, global cooldown, required kit/weapon mode,
+priority) and the engine picks the next action each tick:
+
+1. every probe is evaluated against one frame (SkillBoard.evaluate)
+2. readiness, cooldown and GCD are combined in one vectorized mask
+3. the highest priority candidate whose condition holds is emitted
+
+so a decision costs one frame read no matter how many abilities a spec has.
+
+Example:
+    board = SkillBoard()
+    board.add_probe('napalm', (2801, 1013), offsets=MULTIPOINT_OFFSETS, threshold=100)
+    board.add_probe('in_flamethrower', (3070, 1034), min_channel=200)
+
+    engine = RotationEngine(board, gcd=0.2)
+    engine.add_mode('flamethrower', probe='in_flamethrower', key=KEYS.numpad8)
+    engine.add_ability('napalm', KEYS.numpad5, probe='napalm', priority=1, requires='flamethrower')
+    engine.add_ability('auto', KEYS.numpad1, priority=99)
+
+    engine.run(stop_event, hold_key=KEYS.numpad1)
+"""
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+import numpy as np
+from libs.cooldowns import CooldownTracker
+from libs.frame_capture import Frame
+from libs.keyboard_actions import button_mash, press_and_release
+from libs.logger import get_logger
+from libs.skill_board import SkillBoard
+from libs.tick_scheduler import TickScheduler
+
+logger = get_logger('rotation')
+
+# Seconds between ticks when nothing was cast
+DEFAULT_TICK_INTERVAL = 0.02
+
+# Name of the mode used when no kit/weapon mode probe matches
+BASE_MODE = 'base'
+
+
+class Action(NamedTuple):
+    """One decision of the engine"""
+    kind: str  # 'cast' or 'switch'
+    name: str  # Ability (cast) or mode (switch) name
+    key: Any
+    presses: int = 1
+
+
+class Ability:
+    """A castable ability and the rules for when to cast it"""
+
+    def __init__(self, name: str, key: Any, probe: Optional[str] = None, priority: Optional[int] = 0,
+                 cooldown: float = 0.0, gcd: Optional[float] = None, requires: Optional[str] = None,
+                 requires_ready: Sequence[str] = (), condition: Optional[Callable[['Tick'], bool]] = None,
+                 presses: int = 1, recharge: Optional[float] = None):
+        """Declare an ability.
+
+        Args:
+            name: Ability name
+            key: Key (scan code or key name) to press
+            probe: SkillBoard probe that is True when the ability is ready
+                   (None: always ready, only cooldown/GCD apply)
+            priority: Lower values are cast first (None: only cast as a combo step)
+            cooldown: Seconds after a cast before the ability is considered again
+            gcd: Seconds the cast locks out every ability (default: engine gcd)
+            requires: Mode (kit/weapon) the ability must be cast from
+            requires_ready: Other probes that must be ready too (e.g. a burst opener)
+            condition: Extra check, called with the current Tick
+            presses: Times to press the key (for inputs that get eaten)
+            recharge: In-game cooldown for the engine's CooldownTracker
+                      (default: learned from observed casts)
+        """
+        self.name = name
+        self.key = key
+        self.probe = probe
+        self.priority = priority
+        self.cooldown = cooldown
+        self.gcd = gcd
+        self.requires = requires
+        self.requires_ready = tuple(requires_ready)
+        self.condition = condition
+        self.presses = presses
+        self.recharge = recharge
+
+
+class Combo:
+    """A fixed sequence of abilities cast back to back once it starts
+
+    Each step is cast if its probe is ready when reached and skipped
+    otherwise, like the hand-written burst functions it replaces.
+    """
+
+    def __init__(self, name: str, steps: Sequence[str], priority: int = 0,
+                 requires_ready: Sequence[str] = (), condition: Optional[Callable[['Tick'], bool]] = None):
+        """Declare a combo.
+
+        Args:
+            name: Combo name
+            steps: Ability names in cast order
+            priority: Lower values are considered first (shared with abilities)
+            requires_ready: Probes that must all be ready to start the combo
+            condition: Extra check, called with the current Tick
+        """
+        self.name = name
+        self.steps = tuple(steps)
+        self.priority = priority
+        self.requires_ready = tuple(requires_ready)
+        self.condition = condition
+
+
+class Tick:
+    """What the engine saw on one tick (passed to conditions)"""
+
+    def __init__(self, engine: 'RotationEngine', ready: np.ndarray, now: float, mode: str):
+        self.engine = engine
+        self.ready_array = ready
+        self.now = now
+        self.mode = mode
+
+    def ready(self, probe: str) -> bool:
+        """Whether a probe was ready in this tick's frame"""
+        return bool(self.ready_array[self.engine.board[probe]])
+
+    def since_cast(self, name: str) -> float:
+        """Seconds since an ability was last cast (inf if never)"""
+        return self.now - self.engine.last_cast.get(name, float('-inf'))
+
+
+class RotationEngine:
+    """Evaluates a declarative priority list against one frame per tick"""
+
+    def __init__(self, board: SkillBoard, gcd: float = 0.0,
+                 send: Optional[Callable[[Any, int], None]] = None,
+                 tracker: Optional[CooldownTracker] = None):
+        """Initialize the engine.
+
+        Args:
+            board: SkillBoard holding every probe the abilities refer to
+            gcd: Default seconds a cast locks out the next one
+            send: Function taking (key, presses) that sends the input
+                  (default: press_and_release / button_mash)
+            tracker: Optional CooldownTracker; while it predicts every probed
+                     ability is still on cooldown the board is not read
+        """
+        self.board = board
+        self.gcd = gcd
+        self.send = send or _send_key
+        self.tracker = tracker
+        self.abilities: List[Ability] = []
+        self.combos: Dict[str, Combo] = {}
+        self.modes: Dict[str, Dict[str, Any]] = {}
+        self.last_cast: Dict[str, float] = {}
+        self.gcd_until = 0.0
+        self._entries: List[Any] = []  # Abilities and combos in priority order
+        self._queue: List[str] = []    # Remaining steps of the running combo
+        self._compiled = False
+
+    def add_ability(self, name: str, key: Any, **kwargs) -> Ability:
+        """Declare an ability (see Ability for keyword arguments)"""
+        ability = Ability(name, key, **kwargs)
+        self.abilities.append(ability)
+        self._compiled = False
+        return ability
+
+    def add_combo(self, name: str, steps: Sequence[str], **kwargs) -> Combo:
+        """Declare a combo of already declared abilities (see Combo)"""
+        combo = Combo(name, steps, **kwargs)
+        self.combos[name] = combo
+        self._compiled = False
+        return combo
+
+    def add_mode(self, name: str, probe: str, key: Any):
+        """Declare a kit/weapon mode.
+
+        Args:
+            name: Mode name used in Ability.requires
+            probe: SkillBoard probe that is True while the mode is active
+            key: Key that toggles the mode on (and off again)
+        """
+        self.modes[name] = {'probe': probe, 'key': key}
+
+    def _compile(self):
+        """Flatten abilities and combos into arrays in priority order"""
+        entries = sorted([a for a in self.abilities if a.priority is not None] + list(self.combos.values()),
+                         key=lambda e: e.priority)
+        self._entries = entries
+        self._by_name = {a.name: a for a in self.abilities}
+        self._position = {a.name: i for i, a in enumerate(entries) if isinstance(a, Ability)}
+
+        # Entries without a probe read a constant True column
+        self._probe_index = np.array([self.board[e.probe] if getattr(e, 'probe', None) else -1
+                                      for e in entries], dtype=np.intp)
+        self._has_probe = self._probe_index >= 0
+        self._cooldown = np.array([getattr(e, 'cooldown', 0.0) for e in entries], dtype=np.float64)
+        self._last = np.full(len(entries), -np.inf)
+        self._requires_ready = [np.array([self.board[p] for p in e.requires_ready], dtype=np.intp)
+                                for e in entries]
+
+        # Cooldown tracking is keyed by probe: the probe is what the pixels confirm
+        self._tracked = sorted({a.probe for a in self.abilities if a.probe})
+        # Combo entries have no probe of their own; only abilities count here
+        self._always_ready = any(a.probe is None for a in self.abilities)
+        if self.tracker is not None:
+            for ability in self.abilities:
+                if ability.probe and ability.recharge is not None:
+                    self.tracker.register(ability.probe, ability.recharge)
+        self._compiled = True
+
+    def current_mode(self, ready: np.ndarray) -> str:
+        """Active mode from this tick's probes (BASE_MODE if none matches)"""
+        for name, mode in self.modes.items():
+            if ready[self.board[mode['probe']]]:
+                return name
+        return BASE_MODE
+
+    def _switch_action(self, mode: str, target: str) -> Action:
+        """Input that moves from mode to target"""
+        if target == BASE_MODE:
+            # Kits toggle: pressing the active kit's key drops back to the weapon
+            return Action('switch', target, self.modes[mode]['key'])
+        return Action('switch', target, self.modes[target]['key'])
+
+    def _cast_or_switch(self, ability: Ability, mode: str) -> Action:
+        """Cast an ability, or switch to its mode first"""
+        target = ability.requires
+        if target is not None and target != mode:
+            return self._switch_action(mode, target)
+        return Action('cast', ability.name, ability.key, ability.presses)
+
+    def decide(self, frame: Optional[Frame] = None, now: Optional[float] = None) -> Optional[Action]:
+        """Pick the next action without sending it.
+
+        Args:
+            frame: Frame to evaluate (default: the shared frame)
+            now: Current time (default: time.time())
+
+        Returns:
+            The next Action, or None if nothing should be cast now
+        """
+        if not self._compiled:
+            self._compile()
+        if now is None:
+            now = time.time()
+        if now < self.gcd_until:
+            return None
+
+        if self.tracker is not None and not self._queue and not self._always_ready and self._tracked:
+            # Nothing can be cast until a tracked ability may have come back
+            if all(self.tracker.predict(probe, now) is False for probe in self._tracked):
+                self.tracker.predicted += 1
+                return None
+
+        ready = self.board.evaluate(frame)
+        if self.tracker is not None:
+            self.tracker.reads += 1
+            for probe in self._tracked:
+                if self.tracker.predict(probe, now) is None:
+                    self.tracker.observe(probe, bool(ready[self.board[probe]]), now)
+        mode = self.current_mode(ready)
+        tick = Tick(self, ready, now, mode)
+
+        # Continue a running combo
+        action = self._next_step(ready, mode)
+        if action is not None:
+            return action
+
+        probe_ok = ~self._has_probe
+        probe_ok[self._has_probe] = ready[self._probe_index[self._has_probe]]
+        candidates = np.flatnonzero(probe_ok & (now - self._last >= self._cooldown))
+
+        for position in candidates:
+            entry = self._entries[position]
+            needed = self._requires_ready[position]
+            if needed.size and not ready[needed].all():
+                continue
+            if entry.condition is not None and not entry.condition(tick):
+                continue
+            if isinstance(entry, Combo):
+                # Uses this tick's reads; a combo with no castable step is skipped
+                self._queue = list(entry.steps)
+                action = self._next_step(ready, mode)
+                if action is None:
+                    continue
+                logger.debug(f"Starting combo {entry.name}")
+                return action
+            return self._cast_or_switch(entry, mode)
+        return None
+
+    def _next_step(self, ready: np.ndarray, mode: str) -> Optional[Action]:
+        """Next action of the running combo; steps that are not ready are skipped"""
+        while self._queue:
+            ability = self._by_name[self._queue[0]]
+            if ability.probe is None or ready[self.board[ability.probe]]:
+                action = self._cast_or_switch(ability, mode)
+                if action.kind == 'cast':
+                    self._queue.pop(0)
+                return action
+            self._queue.pop(0)
+        return None
+
+    def execute(self, action: Action, now: Optional[float] = None):
+        """Send an action and record it"""
+        if now is None:
+            now = time.time()
+        self.send(action.key, action.presses)
+
+        if action.kind == 'cast':
+            ability = self._by_name[action.name]
+            self.last_cast[action.name] = now
+            if self.tracker is not None and ability.probe:
+                self.tracker.record_cast(ability.probe, now)
+            if action.name in self._position:
+                self._last[self._position[action.name]] = now
+            self.gcd_until = now + (self.gcd if ability.gcd is None else ability.gcd)
+            logger.debug(f"Cast {action.name}")
+        else:
+            # Give the kit swap one GCD to land before deciding again
+            self.gcd_until = now + self.gcd
+            logger.debug(f"Switch to {action.name}")
+
+    def tick(self, frame: Optional[Frame] = None) -> Optional[Action]:
+        """Decide and send the next action; returns it (None if idle)"""
+        now = time.time()
+        action = self.decide(frame, now)
+        if action is not None:
+            self.execute(action, now)
+        return action
+
+    def reset(self):
+        """Forget cast history and abort a running combo"""
+        if not self._compiled:
+            self._compile()
+        self.last_cast.clear()
+        self._last[:] = -np.inf
+        self.gcd_until = 0.0
+        self._queue = []
+        if self.tracker is not None:
+            self.tracker.reset()
+
+    def run(self, stop_event, active: Optional[Callable[[], bool]] = None,
+            interval: float = DEFAULT_TICK_INTERVAL, hold_key: Optional[Any] = None):
+        """Tick until stop_event is set, active() turns False or hold_key is released.
+
+        Args:
+            stop_event: threading.Event that stops the loop
+            active: Optional check run before each tick
+            interval: Seconds between the starts of two ticks
+            hold_key: Optional rotation hotkey; releasing it ends the wait
+                      for the GCD at once
+        """
+        self._queue = []
+        # Ticks start interval apart, however long each one took
+        with TickScheduler(rate=1.0 / interval, name='rotation') as ticker:
+            while not stop_event.is_set() and (active is None or active()):
+                try:
+                    self.tick()
+                except Exception as e:
+                    logger.error(f"Error in rotation tick: {e}")
+                if not ticker.wait_next(stop_event, hold_key, at_least=self.gcd_until - time.time()):
+                    break
+
+
+def _send_key(key: Any, presses: int = 1):
+    """Default input: one press, or a mash for inputs that get eaten"""
+    if presses > 1:
+        button_mash(key, presses=presses)
+    else:
+        press_and_release(key)
@@ -0,0 +1,191 @@
+"""
+Batch skill-state evaluation for EvilHotKeys
+
+Instead of every spec re-implementing "is this skill ready" pixel by pixel,
+a spec declares named probes once and evaluates all of them against one
+frame with a single vectorized lookup.
+
+Example:
+    board = SkillBoard()
+    board.add_probe('napalm', (2801, 1013), offsets=MULTIPOINT_OFFSETS, threshold=100)
+    board.add_probe('flamethrower_kit', (3070, 1034), min_channel=200)
+    board.add_probe('merged', (2595, 970), color=(112, 112, 112), invert=True)
+    board.add_probe('kit', (3070, 1034), palette=[(255, 255, 255), (250, 250, 250)])
+
+    ready = board.evaluate()          # numpy bool vector in probe order
+    if ready[board['napalm']]: ...
+    states = board.evaluate_dict()    # {'napalm': True, ...}
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from libs.frame_capture import Frame, get_frame_capture_service, pack_rgb
+from libs.logger import get_logger
+
+logger = get_logger('skill_board')
+
+# Brightness threshold used by most GW2 specs (sum of R+G+B)
+DEFAULT_THRESHOLD = 300
+
+# Probe points used by the GW2 multipoint checks
+MULTIPOINT_OFFSETS = ((0, 0), (-2, -2), (2, -2), (0, -5))
+
+
+class SkillProbe:
+    """A named set of pixels and the predicate that means "ready"
+
+    A probe is ready when ANY of its points matches every predicate given
+    (threshold, color, min_channel, palette); invert flips the final result.
+    """
+
+    def __init__(self, name: str, coords: Tuple[int, int],
+                 offsets: Sequence[Tuple[int, int]] = ((0, 0),),
+                 threshold: Optional[int] = None,
+                 color: Optional[Tuple[int, int, int]] = None,
+                 min_channel: Optional[int] = None,
+                 palette: Optional[Sequence] = None,
+                 invert: bool = False):
+        """Initialize a probe.
+
+        Args:
+            name: Probe name
+            coords: (x, y) of the probe's anchor pixel
+            offsets: (dx, dy) offsets around coords to check
+            threshold: Ready if R+G+B is above this value
+            color: Ready if the pixel is exactly this (R, G, B) color
+            min_channel: Ready if every channel is above this value
+            palette: Ready if the pixel is one of these colors, given as
+                     (R, G, B) tuples or packed 0xRRGGBB ints
+            invert: Flip the result (e.g. "not this color" or "dark = ready")
+        """
+        if threshold is None and color is None and min_channel is None and palette is None:
+            threshold = DEFAULT_THRESHOLD
+
+        self.name = name
+        self.coords = coords
+        self.offsets = tuple(offsets)
+        self.threshold = threshold
+        self.color = color
+        self.min_channel = min_channel
+        self.palette = None if palette is None else tuple(
+            c if isinstance(c, (int, np.integer)) else pack_rgb(c) for c in palette)
+        self.invert = invert
+
+    @property
+    def points(self) -> List[Tuple[int, int]]:
+        """Absolute coordinates of every point this probe reads"""
+        return [(self.coords[0] + dx, self.coords[1] + dy) for dx, dy in self.offsets]
+
+
+class SkillBoard:
+    """A set of skill probes evaluated together against one frame"""
+
+    def __init__(self):
+        self.probes: List[SkillProbe] = []
+        self._index: Dict[str, int] = {}
+        self._compiled = False
+        self.last_colors: Optional[np.ndarray] = None
+
+    def add_probe(self, name: str, coords: Tuple[int, int], **kwargs) -> int:
+        """Declare a probe (see SkillProbe for keyword arguments).
+
+        Returns:
+            Index of the probe in the evaluate() result
+        """
+        if name in self._index:
+            raise ValueError(f"Probe '{name}' is already defined")
+
+        self._index[name] = len(self.probes)
+        self.probes.append(SkillProbe(name, coords, **kwargs))
+        self._compiled = False
+        return self._index[name]
+
+    def __getitem__(self, name: str) -> int:
+        return self._index[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self.probes)
+
+    @property
+    def names(self) -> List[str]:
+        """Probe names in evaluate() order"""
+        return [probe.name for probe in self.probes]
+
+    @property
+    def points(self) -> List[Tuple[int, int]]:
+        """Every pixel the board reads (for capture planning)"""
+        return [point for probe in self.probes for point in probe.points]
+
+    def _compile(self):
+        """Flatten all probes into per-point arrays"""
+        points = self.points
+        counts = [len(probe.offsets) for probe in self.probes]
+        owners = np.repeat(np.arange(len(self.probes)), counts)
+
+        self._xs = np.array([p[0] for p in points], dtype=np.intp)
+        self._ys = np.array([p[1] for p in points], dtype=np.intp)
+        self._starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+
+        # Per-point predicate parameters; a sentinel means "not used"
+        threshold = np.array([-1 if p.threshold is None else p.threshold for p in self.probes])
+        min_channel = np.array([-1 if p.min_channel is None else p.min_channel for p in self.probes])
+        self._threshold = threshold[owners]
+        self._min_channel = min_channel[owners]
+        self._has_color = np.array([p.color is not None for p in self.probes])[owners]
+        self._color = np.array([pack_rgb(p.color or (0, 0, 0)) for p in self.probes], dtype=np.int64)[owners]
+
+        # Palettes become one sorted table of (probe << 24 | color) keys, so
+        # every point is checked against its own probe's palette in one isin
+        self._owners = owners.astype(np.int64)
+        self._has_palette = np.array([p.palette is not None for p in self.probes])[owners]
+        self._palette_keys = np.array(sorted({(i << 24) | c for i, p in enumerate(self.probes)
+                                              for c in (p.palette or ())}), dtype=np.int64)
+        self._invert = np.array([p.invert for p in self.probes], dtype=bool)
+        self._compiled = True
+
+    def evaluate(self, frame: Optional[Frame] = None) -> np.ndarray:
+        """Evaluate every probe against one frame.
+
+        Args:
+            frame: Frame to read from (default: the shared frame)
+
+        Returns:
+            Bool array with one entry per probe, in declaration order.
+            Probes whose pixels could not be read are False.
+        """
+        if not self.probes:
+            return np.zeros(0, dtype=bool)
+        if not self._compiled:
+            self._compile()
+
+        colors, found = get_frame_capture_service().sample(self._xs, self._ys, frame)
+        self.last_colors = colors
+
+        packed = (colors[:, 0].astype(np.int64) << 16) | (colors[:, 1] << 8) | colors[:, 2]
+
+        ok = found.copy()
+        ok &= (self._threshold < 0) | (colors.sum(axis=1) > self._threshold)
+        ok &= (self._min_channel < 0) | (colors.min(axis=1) > self._min_channel)
+        ok &= ~self._has_color | (packed == self._color)
+        if self._palette_keys.size:
+            ok &= ~self._has_palette | np.isin((self._owners << 24) | packed, self._palette_keys)
+
+        ready = np.logical_or.reduceat(ok, self._starts)
+        readable = np.logical_or.reduceat(found, self._starts)
+        return (ready ^ self._invert) & readable
+
+    def evaluate_dict(self, frame: Optional[Frame] = None) -> Dict[str, bool]:
+        """Evaluate every probe and return {name: ready}"""
+        ready = self.evaluate(frame)
+        return {probe.name: bool(state) for probe, state in zip(self.probes, ready)}
+
+    def color_of(self, name: str) -> Optional[Tuple[int, int, int]]:
+        """Color of a probe's first point from the last evaluate() (for logging)"""
+        if self.last_colors is None:
+            return None
+        if not self._compiled:
+            self._compile()
+        r, g, b = self.last_colors[self._starts[self._index[name]]]
+        return (int(r), int(g), int(b))
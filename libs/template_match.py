@@ -0,0 +1,274 @@
+"""
+Template (icon) matching for EvilHotKeys
+
+Single-pixel brightness checks break whenever UI scale or resolution
+changes. Templates are reference icons captured with coordinate_helper.py;
+each frame they are located (or just verified) with normalized
+cross-correlation inside a small region around where the icon is expected.
+
+Template statistics (zero-mean pixels and norm) are computed once at load,
+and window statistics come from integral images, so a match over a small
+region is a single tensor contraction.
+
+Example:
+    from libs.template_match import TemplateMatcher
+
+    matcher = TemplateMatcher.from_config('Guild Wars 2')
+    match = matcher.locate('napalm')     # Match(name, x, y, score) or None
+    if matcher.verify('evolve'): ...     # cheap check at the last known spot
+"""
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from PIL import Image
+from libs.config_manager import get_config_manager
+from libs.frame_capture import get_frame_capture_service
+from libs.logger import get_logger
+
+logger = get_logger('template_match')
+
+# Directory holding one sub-directory of PNG templates per game
+TEMPLATE_DIR = Path('templates')
+
+# Minimum normalized correlation for a template to count as found
+DEFAULT_MIN_SCORE = 0.9
+
+# Pixels searched around the expected position in each direction
+DEFAULT_SEARCH_MARGIN = 8
+
+# Luminance weights used for matching
+GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+Box = Tuple[int, int, int, int]
+
+
+class Match(NamedTuple):
+    """A located template: top-left corner and correlation score"""
+    name: str
+    x: int
+    y: int
+    score: float
+
+
+def to_gray(rgb: np.ndarray) -> np.ndarray:
+    """Convert an HxWx3 RGB array to float32 luminance"""
+    return np.asarray(rgb, dtype=np.float32) @ GRAY_WEIGHTS
+
+
+def _window_sums(values: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Sum of every height x width window, via an integral image"""
+    integral = np.zeros((values.shape[0] + 1, values.shape[1] + 1), dtype=np.float64)
+    integral[1:, 1:] = values.cumsum(axis=0).cumsum(axis=1)
+    return (integral[height:, width:] - integral[:-height, width:]
+            - integral[height:, :-width] + integral[:-height, :-width])
+
+
+class Template:
+    """A reference icon with precomputed matching statistics"""
+
+    def __init__(self, name: str, pixels: np.ndarray):
+        """Initialize a template.
+
+        Args:
+            name: Template name
+            pixels: HxWx3 RGB array of the icon
+
+        Raises:
+            ValueError: If the icon is a single flat color (nothing to correlate)
+        """
+        self.name = name
+        self.pixels = np.ascontiguousarray(pixels[..., :3])
+        self.height, self.width = self.pixels.shape[:2]
+        self.size = self.height * self.width
+
+        gray = to_gray(self.pixels)
+        self._zero_mean = (gray - gray.mean()).astype(np.float32)
+        self._norm = float(np.sqrt(np.square(self._zero_mean, dtype=np.float64).sum()))
+        if self._norm < 1e-6:
+            raise ValueError(f"Template '{name}' is a flat color and cannot be matched")
+
+    @classmethod
+    def from_file(cls, path: Path, name: Optional[str] = None) -> 'Template':
+        """Load a template from a PNG file"""
+        path = Path(path)
+        with Image.open(path) as image:
+            pixels = np.asarray(image.convert('RGB'))
+        return cls(name or path.stem, pixels)
+
+    @classmethod
+    def from_screen(cls, name: str, x1: int, y1: int, x2: int, y2: int) -> Optional['Template']:
+        """Capture a template from the screen (x2/y2 exclusive)"""
+        pixels = get_frame_capture_service().get_region(x1, y1, x2, y2)
+        if pixels is None:
+            return None
+        return cls(name, np.array(pixels))
+
+    def save(self, path: Path):
+        """Save the template as a PNG file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(self.pixels).save(path)
+
+    def score_map(self, gray: np.ndarray) -> np.ndarray:
+        """Normalized cross-correlation of the template at every offset
+
+        Args:
+            gray: Float32 luminance of the searched region (at least template size)
+
+        Returns:
+            (H - h + 1) x (W - w + 1) array of scores in [-1, 1]
+        """
+        windows = np.lib.stride_tricks.sliding_window_view(gray, (self.height, self.width))
+        # The template is zero-mean, so correlating against raw windows
+        # equals correlating against mean-subtracted windows
+        numerator = np.tensordot(windows, self._zero_mean, axes=2)
+
+        sums = _window_sums(gray, self.height, self.width)
+        squares = _window_sums(np.square(gray, dtype=np.float64), self.height, self.width)
+        variance = np.maximum(squares - sums * sums / self.size, 0.0)
+        denominator = self._norm * np.sqrt(variance)
+
+        scores = np.zeros(numerator.shape, dtype=np.float64)
+        np.divide(numerator, denominator, out=scores, where=denominator > 1e-6)
+        return scores
+
+    def score_at(self, gray: np.ndarray) -> float:
+        """Normalized cross-correlation for a region exactly the template's size"""
+        window = gray - gray.mean()
+        denominator = self._norm * float(np.sqrt(np.square(window, dtype=np.float64).sum()))
+        if denominator < 1e-6:
+            return 0.0
+        return float((window * self._zero_mean).sum() / denominator)
+
+
+class TemplateMatcher:
+    """A set of templates, each searched in a small region around its expected position"""
+
+    def __init__(self, min_score: float = DEFAULT_MIN_SCORE, margin: int = DEFAULT_SEARCH_MARGIN):
+        """Initialize the matcher.
+
+        Args:
+            min_score: Default minimum correlation for a match
+            margin: Default pixels searched around each expected position
+        """
+        self.min_score = min_score
+        self.margin = margin
+        self.templates: Dict[str, Template] = {}
+        self.positions: Dict[str, Tuple[int, int]] = {}
+        self._settings: Dict[str, Tuple[float, int, bool]] = {}
+
+    def add(self, template: Template, position: Tuple[int, int], min_score: Optional[float] = None,
+            margin: Optional[int] = None, track: bool = True):
+        """Register a template.
+
+        Args:
+            template: Template to match
+            position: Expected (x, y) of the template's top-left corner
+            min_score: Minimum correlation (default: the matcher's)
+            margin: Pixels searched around position (default: the matcher's)
+            track: Move the expected position to wherever the icon was last found
+        """
+        self.templates[template.name] = template
+        self.positions[template.name] = (int(position[0]), int(position[1]))
+        self._settings[template.name] = (
+            self.min_score if min_score is None else min_score,
+            self.margin if margin is None else margin,
+            track,
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.templates
+
+    @property
+    def names(self) -> List[str]:
+        """Registered template names"""
+        return list(self.templates)
+
+    def search_box(self, name: str) -> Box:
+        """Region (x1, y1, x2, y2) searched for a template"""
+        template = self.templates[name]
+        x, y = self.positions[name]
+        margin = self._settings[name][1]
+        return (max(x - margin, 0), max(y - margin, 0),
+                x + template.width + margin, y + template.height + margin)
+
+    @property
+    def regions(self) -> List[Box]:
+        """Every searched region (for capture planning)"""
+        return [self.search_box(name) for name in self.templates]
+
+    def locate(self, name: str) -> Optional[Match]:
+        """Find a template near its expected position.
+
+        Returns:
+            Match for the best scoring offset, or None if below min_score
+        """
+        template = self.templates[name]
+        min_score, _, track = self._settings[name]
+        x1, y1, x2, y2 = self.search_box(name)
+
+        try:
+            pixels = get_frame_capture_service().get_region(x1, y1, x2, y2)
+            if pixels is None or pixels.shape[0] < template.height or pixels.shape[1] < template.width:
+                return None
+            scores = template.score_map(to_gray(pixels))
+        except Exception as e:
+            logger.error(f"Error matching template '{name}': {e}")
+            return None
+
+        row, col = np.unravel_index(int(np.argmax(scores)), scores.shape)
+        score = float(scores[row, col])
+        if score < min_score:
+            return None
+
+        match = Match(name, x1 + int(col), y1 + int(row), score)
+        if track:
+            self.positions[name] = (match.x, match.y)
+        return match
+
+    def verify(self, name: str) -> bool:
+        """Check a template at exactly its expected position (no search)"""
+        template = self.templates[name]
+        x, y = self.positions[name]
+        try:
+            pixels = get_frame_capture_service().get_region(x, y, x + template.width, y + template.height)
+            if pixels is None or pixels.shape[:2] != (template.height, template.width):
+                return False
+            return template.score_at(to_gray(pixels)) >= self._settings[name][0]
+        except Exception as e:
+            logger.error(f"Error verifying template '{name}': {e}")
+            return False
+
+    def locate_all(self) -> Dict[str, Optional[Match]]:
+        """Locate every template; {name: Match or None}"""
+        return {name: self.locate(name) for name in self.templates}
+
+    @classmethod
+    def from_config(cls, game_name: str, resolution: Optional[str] = None,
+                    directory: Path = TEMPLATE_DIR, **kwargs) -> 'TemplateMatcher':
+        """Build a matcher from the templates saved for a game.
+
+        Positions come from games.<game>.templates.<resolution> in the
+        config (as written by coordinate_helper.py), images from
+        <directory>/<game>/<name>.png.
+        """
+        matcher = cls(**kwargs)
+        config = get_config_manager()
+        if resolution is None:
+            resolution = config.get('display.resolution', '5760x1080')
+
+        boxes = config.get_game_config(game_name).get('templates', {}).get(resolution, {})
+        for name, box in boxes.items():
+            path = template_path(game_name, name, directory)
+            try:
+                matcher.add(Template.from_file(path, name), (box[0], box[1]))
+            except Exception as e:
+                logger.warning(f"Skipping template '{name}' ({path}): {e}")
+
+        logger.debug(f"Loaded {len(matcher.templates)} templates for {game_name} at {resolution}")
+        return matcher
+
+
+def template_path(game_name: str, name: str, directory: Path = TEMPLATE_DIR) -> Path:
+    """Path of a game's template PNG"""
+    return Path(directory) / game_name / f"{name}.png"
@@ -0,0 +1,153 @@
+"""
+Deadline-based tick scheduler for EvilHotKeys
+
+Rotation loops used to end with a fixed time.sleep(0.05), so a pass took
+"work + 0.05s" and the rate drifted with capture time (a 0.5s GNOME capture
+turned a 20 Hz loop into a 2 Hz one, then slept on top of it). The ticker
+keeps monotonic deadlines instead: each wait ends one period after the
+previous deadline, so the work time is absorbed into the period. A pass that
+runs past its deadline is an overrun; the next pass starts right away and
+the missed ticks are dropped rather than replayed in a burst.
+
+While running, the ticker asks the frame capture service for a freshness
+window of a fraction of its period: every read within one tick shares one
+frame, and the next tick is guaranteed a new one.
+
+Example:
+    TICKER = TickScheduler(rate=10, name='rifle')
+
+    TICKER.start()
+    while not stop_event.is_set():
+        ...one pass...
+        if not TICKER.wait_next(stop_event, hold_key=KEYS.numpad1):
+            break
+    TICKER.stop()
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+from libs.frame_capture import get_frame_capture_service
+from libs.logger import get_logger
+from libs.waits import sleep
+
+logger = get_logger('tick_scheduler')
+
+# Ticks per second when no rate is given
+DEFAULT_TICK_RATE = 20
+
+# Freshness window as a fraction of the tick period (margin for jitter)
+FRESHNESS_FRACTION = 0.8
+
+
+class TickScheduler:
+    """Paces a loop to a target rate with monotonic deadlines"""
+
+    def __init__(self, rate: float = DEFAULT_TICK_RATE, name: str = 'rotation',
+                 adapt_freshness: bool = True):
+        """Initialize the ticker.
+
+        Args:
+            rate: Target ticks per second
+            name: Name for logging and the freshness request
+            adapt_freshness: Match the capture freshness window to the tick period
+        """
+        if rate <= 0:
+            raise ValueError(f"Tick rate must be positive, got {rate}")
+        self.period = 1.0 / rate
+        self.name = name
+        self.adapt_freshness = adapt_freshness
+        # Per instance, so two rotations with the same name keep their own request
+        self._freshness_key = f'tick:{name}:{id(self)}'
+        self.running = False
+        self._deadline = 0.0
+        self._woke = 0.0
+
+        # Statistics
+        self.ticks = 0
+        self.overruns = 0
+        self.max_late = 0.0
+        self.work_time = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Target ticks per second"""
+        return 1.0 / self.period
+
+    def start(self):
+        """Make now tick zero and reset the statistics"""
+        now = time.monotonic()
+        self._deadline = now
+        self._woke = now
+        self.ticks = 0
+        self.overruns = 0
+        self.max_late = 0.0
+        self.work_time = 0.0
+        self.running = True
+        if self.adapt_freshness:
+            get_frame_capture_service().request_freshness(self._freshness_key, self.period * FRESHNESS_FRACTION)
+
+    def stop(self):
+        """Release the freshness request and log a summary"""
+        if not self.running:
+            return
+        self.running = False
+        if self.adapt_freshness:
+            get_frame_capture_service().release_freshness(self._freshness_key)
+        if self.ticks:
+            logger.info(f"{self.name}: {self.ticks} ticks at {self.rate:.0f} Hz, "
+                        f"{self.overruns} overruns (worst {self.max_late * 1000:.0f}ms late), "
+                        f"average pass {self.work_time / self.ticks * 1000:.1f}ms")
+
+    def __enter__(self) -> 'TickScheduler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def wait_next(self, stop_event: Optional[threading.Event] = None, hold_key: Optional[Any] = None,
+                  at_least: float = 0.0) -> bool:
+        """Sleep until the next deadline.
+
+        Args:
+            stop_event: Optional event that ends the wait
+            hold_key: Optional rotation hotkey; releasing it ends the wait
+            at_least: Minimum seconds from now (e.g. the rest of a GCD);
+                      the schedule continues from the later deadline
+
+        Returns:
+            False if stopped or the hold key was released, True otherwise
+        """
+        if not self.running:
+            self.start()
+
+        now = time.monotonic()
+        self.ticks += 1
+        self.work_time += now - self._woke
+
+        deadline = self._deadline + self.period
+        late = now - deadline
+        if late > 0:
+            self.overruns += 1
+            self.max_late = max(self.max_late, late)
+            logger.debug(f"{self.name}: tick {self.ticks} overran by {late * 1000:.0f}ms")
+            deadline = now  # Drop the missed ticks
+        self._deadline = max(deadline, now + at_least)
+
+        ok = sleep(self._deadline - now, stop_event, hold_key)
+        self._woke = time.monotonic()
+        return ok
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tick statistics.
+
+        Returns:
+            Dict with ticks, overruns, max_late_ms, avg_work_ms and rate_hz
+        """
+        return {
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'max_late_ms': self.max_late * 1000,
+            'avg_work_ms': (self.work_time / self.ticks * 1000) if self.ticks else 0.0,
+            'rate_hz': self.rate
+        }
@@ -0,0 +1,71 @@
+"""
+Cancellable waits for EvilHotKeys
+
+time.sleep() inside a rotation ignores the stop request: a spec sitting in
+time.sleep(4) keeps main.py waiting (and logging "The spec did not
+terminate as expected") for up to 4s. sleep() here is a drop-in that wakes
+as soon as the stop event is set or the rotation's hold key is released.
+
+Key releases arrive as events from the shared key state, so they end the
+wait immediately; the stop event is checked every STOP_CHECK_INTERVAL while
+also waiting on a key.
+
+Example:
+    from libs.waits import sleep
+
+    if not sleep(0.5, stop_event, hold_key=key_mapping['numpad1']):
+        break  # Stopped or key released
+"""
+import threading
+import time
+from typing import Any, Optional
+from libs.key_state import get_key_state
+
+# Seconds between stop event checks while waiting on a key release
+STOP_CHECK_INTERVAL = 0.01
+
+
+def sleep(seconds: float, stop_event: Optional[threading.Event] = None,
+          hold_key: Optional[Any] = None) -> bool:
+    """Sleep unless stopped or the hold key is released.
+
+    Args:
+        seconds: Seconds to sleep
+        stop_event: Optional event that ends the wait when set
+        hold_key: Optional key (scan code or name) that ends the wait when released
+
+    Returns:
+        True if the full time elapsed, False if the wait was cancelled
+    """
+    if stop_event is not None and stop_event.is_set():
+        return False
+    if hold_key is None:
+        if stop_event is None:
+            time.sleep(max(seconds, 0.0))
+            return True
+        return not stop_event.wait(max(seconds, 0.0))
+
+    key_state = get_key_state()
+    codes = key_state.scan_codes(hold_key)
+    released = threading.Event()
+
+    def on_key(code: int, down: bool, repeat: bool):
+        if not down and code in codes:
+            released.set()
+
+    key_state.add_listener(on_key)
+    try:
+        # Checked after subscribing so a release in between is not missed
+        if not key_state.is_pressed(hold_key):
+            return False
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            if stop_event is None:
+                return not released.wait(remaining)
+            if released.wait(min(remaining, STOP_CHECK_INTERVAL)) or stop_event.is_set():
+                return False
+    finally:
+        key_state.remove_listener(on_key)
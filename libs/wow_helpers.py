@@ -0,0 +1,42 @@
+"""
+World of Warcraft spec helpers
+
+Coordinates come from the coordinate registry, so the same spec works at
+every resolution the WoW coordinates are configured (or scalable) for.
+"""
+from typing import Dict, List, Tuple
+from libs.coordinate_registry import get_coordinate_registry
+from libs.logger import get_logger
+
+logger = get_logger('wow_helpers')
+
+GAME_NAME = 'World of Warcraft'
+
+_logged = set()
+
+
+def get_coord(name: str) -> Tuple[int, int]:
+    """Get the absolute (x, y) of a WoW coordinate for the active resolution
+
+    Raises:
+        KeyError: If the coordinate is not configured
+    """
+    point = get_coordinate_registry(GAME_NAME).get(name)
+    if point is None:
+        raise KeyError(f"Coordinate '{name}' is not configured for {GAME_NAME} "
+                       f"(capture it with coordinate_helper.py)")
+    return point
+
+
+def get_coords(*names: str) -> List[Tuple[int, int]]:
+    """Get several WoW coordinates at once (see get_coord)"""
+    return [get_coord(name) for name in names]
+
+
+def log_coords_once(coords: Dict[str, Tuple[int, int]]):
+    """Log the coordinates a spec uses, once per set of names"""
+    key = tuple(sorted(coords))
+    if key in _logged:
+        return
+    _logged.add(key)
+    logger.info("Using coordinates: " + ", ".join(f"{name}={point}" for name, point in coords.items()))
@@ -5,6 +5,10 @@ import os
 from importlib import import_module, reload
 from libs.menu_customization import customize_menu, customize_specs
 from libs.logger import get_logger
+from libs.config_manager import get_config_manager
+from libs.capture_backends import get_capture_backend
+from libs.frame_capture import get_frame_capture_service
+from libs.input_scheduler import get_input_scheduler
 import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image
@@ -17,6 +21,14 @@ logger = get_logger('main-gui')
 def run_spec(selected_game, selected_spec, stop_event):
    try:
        logger.info(f"Running spec '{selected_spec}' for game '{selected_game}'")
+
+       # Keep frames refreshed in the background so reads never wait on capture
+       if get_config_manager().get('performance.prefetch', False):
+           get_frame_capture_service().start_prefetch()
+
+       # Space inputs the way this game needs
+       get_input_scheduler().configure_for_game(selected_game)
+
        module_name = f'games.{selected_game}.specs.{selected_spec}'
        
        # If module is already imported, reload it
@@ -42,6 +54,14 @@ def run_spec(selected_game, selected_spec, stop_event):
        logger.exception(f"Unexpected error in spec: {e}")
        messagebox.showerror("Unexpected Error", f"An unexpected error occurred: {e}")
        raise  # Re-raise so GUI can handle it
+   finally:
+       # Don't let one spec's capture plan leak into the next
+       get_frame_capture_service().stop_prefetch()
+       get_frame_capture_service().clear_capture_plan()
+       # Keys still queued by a stopped spec must not fire afterwards
+       get_input_scheduler().clear()
+       # Release the capture handle this spec thread opened
+       get_capture_backend().close()
 
 
 # GUI Application Class
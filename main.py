@@ -8,6 +8,9 @@ from libs.menu_customization import customize_menu, customize_specs
 from libs.environment import get_environment_info
 from libs.logger import get_logger
 from libs.config_manager import get_config_manager
+from libs.capture_backends import get_capture_backend
+from libs.frame_capture import get_frame_capture_service
+from libs.input_scheduler import get_input_scheduler
 
 logger = get_logger('main')
 config = get_config_manager()
@@ -17,6 +20,13 @@ def run_spec(selected_game, selected_spec, stop_event):
     try:
         logger.info(f"Running spec '{selected_spec}' for game '{selected_game}'")
 
+        # Keep frames refreshed in the background so reads never wait on capture
+        if config.get('performance.prefetch', False):
+            get_frame_capture_service().start_prefetch()
+
+        # Space inputs the way this game needs
+        get_input_scheduler().configure_for_game(selected_game)
+
         # Import and run the spec
         spec_module = import_module(f'games.{selected_game}.specs.{selected_spec}')
         if hasattr(spec_module, 'run'):
@@ -30,6 +40,14 @@ def run_spec(selected_game, selected_spec, stop_event):
         logger.error(f"Spec '{selected_spec}' for game '{selected_game}' encountered an AttributeError: {e}")
     except Exception as e:
         logger.exception(f"Unexpected error running spec '{selected_spec}' for game '{selected_game}': {e}")
+    finally:
+        # Don't let one spec's capture plan leak into the next
+        get_frame_capture_service().stop_prefetch()
+        get_frame_capture_service().clear_capture_plan()
+        # Keys still queued by a stopped spec must not fire afterwards
+        get_input_scheduler().clear()
+        # Release the capture handle this spec thread opened
+        get_capture_backend().close()
 
 # Function to select a game
 def select_game():